@@ -1 +1,2 @@
 from .client import AnytypeClient
+from .session import get_client
@@ -0,0 +1,140 @@
+"""Concurrent bulk writes against the Anytype API."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class WriteResult:
+    key: str
+    object_id: str | None = None
+    error: str | None = None
+    # True when the write was already recorded as done in a resumed journal.
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def object_id(response: dict) -> str:
+    """Return the id of an object from a create or get response."""
+    return response.get("object", response)["id"]
+
+
+def _create(client, space_id, key, payload) -> WriteResult:
+    try:
+        return WriteResult(key, object_id(client.create_object(space_id, payload)))
+    except Exception as e:
+        return WriteResult(key, error=str(e))
+
+
+def _update(client, key, object_id, payload) -> WriteResult:
+    try:
+        client.update_object(object_id, payload)
+        return WriteResult(key, object_id)
+    except Exception as e:
+        return WriteResult(key, object_id, error=str(e))
+
+
+def _reporting(fn, on_result):
+    if on_result is None:
+        return fn
+
+    def wrapper(*args):
+        result = fn(*args)
+        on_result(result)
+        return result
+
+    return wrapper
+
+
+def create_objects(
+    client,
+    space_id: str,
+    items: list[tuple[str, dict]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_result=None,
+    journal=None,
+) -> list[WriteResult]:
+    """Create objects concurrently on a bounded thread pool.
+
+    ``items`` are ``(key, payload)`` pairs; results are returned in the same
+    order so callers can log deterministically. Failures are captured per
+    object instead of aborting the batch. ``on_result`` is called from the
+    worker thread as soon as each write finishes.
+
+    With a ``journal`` (see ``anytype_api.journal``), keys already recorded
+    as done are returned without a request, and every other key is recorded
+    as planned and then as done once its create succeeds.
+    """
+    results: list[WriteResult | None] = [None] * len(items)
+    pending = []
+    for position, (key, payload) in enumerate(items):
+        if journal and journal.is_done(key):
+            results[position] = WriteResult(key, journal.completed[key], resumed=True)
+        else:
+            if journal:
+                journal.planned(key, "create")
+            pending.append((position, key, payload))
+    if not pending:
+        return results
+
+    def record(result):
+        if journal and result.ok:
+            journal.done(result.key, "create", result.object_id)
+        if on_result:
+            on_result(result)
+
+    create = _reporting(_create, record)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            (position, pool.submit(create, client, space_id, key, payload))
+            for position, key, payload in pending
+        ]
+        for position, future in futures:
+            results[position] = future.result()
+    return results
+
+
+def update_objects(
+    client,
+    items: list[tuple[str, str, dict]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_result=None,
+    journal=None,
+) -> list[WriteResult]:
+    """Update objects concurrently; ``items`` are ``(key, object_id, payload)``.
+
+    A ``journal`` is used as in ``create_objects``: updates it records as
+    done are skipped, and the rest are recorded as planned and then done.
+    """
+    results: list[WriteResult | None] = [None] * len(items)
+    pending = []
+    for position, (key, object_id, payload) in enumerate(items):
+        if journal and journal.is_done(key):
+            results[position] = WriteResult(key, object_id, resumed=True)
+        else:
+            if journal:
+                journal.planned(key, "update")
+            pending.append((position, key, object_id, payload))
+    if not pending:
+        return results
+
+    def record(result):
+        if journal and result.ok:
+            journal.done(result.key, "update", result.object_id)
+        if on_result:
+            on_result(result)
+
+    update = _reporting(_update, record)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            (position, pool.submit(update, client, key, object_id, payload))
+            for position, key, object_id, payload in pending
+        ]
+        for position, future in futures:
+            results[position] = future.result()
+    return results
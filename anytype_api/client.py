@@ -1,6 +1,27 @@
 import http.client
 import json
 import os
+import threading
+
+from . import tracing
+
+# Largest page the Anytype API returns for a single search request.
+SEARCH_PAGE_SIZE = 1000
+
+
+class _InFlight:
+    """A request being sent on behalf of every caller that asked for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.response
 
 
 class AnytypeClient:
@@ -15,13 +36,46 @@ class AnytypeClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self._in_flight: dict[tuple, _InFlight] = {}
+        self._in_flight_lock = threading.Lock()
 
     def _make_request(self, method, endpoint, payload=None):
-        conn = http.client.HTTPConnection(self.host, self.port)
-        body = json.dumps(payload) if payload else ""
-        conn.request(method, endpoint, body, self.headers)
-        res = conn.getresponse()
-        data = res.read().decode("utf-8")
+        """Send a request, sharing concurrent identical GETs.
+
+        While a GET is in flight, identical GETs from other threads wait for
+        it and receive the same decoded response instead of sending their
+        own, so callers must not mutate what they get back.
+        """
+        if method != "GET":
+            return self._send(method, endpoint, payload)
+
+        key = (endpoint, json.dumps(payload, sort_keys=True) if payload else "")
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._in_flight[key] = _InFlight()
+        if not is_leader:
+            return call.wait()
+
+        try:
+            call.response = self._send(method, endpoint, payload)
+            return call.response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def _send(self, method, endpoint, payload=None):
+        with tracing.span(f"{method} {endpoint}", "http"):
+            conn = http.client.HTTPConnection(self.host, self.port)
+            body = json.dumps(payload) if payload else ""
+            conn.request(method, endpoint, body, self.headers)
+            res = conn.getresponse()
+            data = res.read().decode("utf-8")
         if res.status >= 400:
             raise Exception(f"API Error: {res.status} {res.reason} - {data}")
         try:
@@ -43,9 +97,23 @@ class AnytypeClient:
     def get_object(self, space_id, object_id):
         return self._make_request("GET", f"/v1/spaces/{space_id}/objects/{object_id}")
 
-    def search_objects(self, space_id, query, type_ids):
+    def search_objects(self, space_id, query, type_ids, offset=None, limit=None):
         payload = {"query": query, "types": type_ids}
-        return self._make_request("POST", f"/v1/spaces/{space_id}/search", payload)
+        endpoint = f"/v1/spaces/{space_id}/search"
+        if offset is not None or limit is not None:
+            endpoint += f"?offset={offset or 0}&limit={limit or SEARCH_PAGE_SIZE}"
+        return self._make_request("POST", endpoint, payload)
+
+    def iter_search_pages(self, space_id, query, type_ids, page_size=SEARCH_PAGE_SIZE):
+        """Yield the ``data`` list of each search results page in turn."""
+        offset = 0
+        while True:
+            page = self.search_objects(space_id, query, type_ids, offset, page_size)
+            data = page.get("data") or []
+            yield data
+            if not page.get("pagination", {}).get("has_more") or not data:
+                return
+            offset += len(data)
 
     def create_object(self, space_id, payload):
         return self._make_request("POST", f"/v1/spaces/{space_id}/objects", payload)
@@ -0,0 +1,203 @@
+"""Traceability graph of the SFs, FRs and APIs in a space.
+
+Objects are numbered per kind and relations are stored as compressed
+sparse rows: for SF ``i`` its FRs are ``sf_frs.targets[sf_frs.offsets[i]:
+sf_frs.offsets[i + 1]]``. Both directions of each relation are kept, so
+coverage queries are plain array scans with no dict lookups or fetches.
+"""
+
+from array import array
+
+from .keys import (
+    API_FUNCTIONAL_REQUIREMENTS_KEY,
+    API_TYPE_ID,
+    FR_SYSTEM_FEATURE_KEY,
+    FR_TYPE_KEY,
+    SF_TYPE_ID,
+    SF_TYPE_KEY,
+)
+from .space_index import get_property
+
+SF, FR, API = "sf", "fr", "api"
+# Relations SFs carry to their FRs, besides the FR's own SF property.
+SF_FR_KEYS = ("backlinks", "functionalRequirements")
+
+
+class Adjacency:
+    """One direction of a relation in CSR form."""
+
+    def __init__(self, offsets: array, targets: array):
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_edges(cls, size: int, edges: list[tuple[int, int]]) -> "Adjacency":
+        offsets = array("I", bytes(4 * (size + 1)))
+        for source, _ in edges:
+            offsets[source + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+        targets = array("I", bytes(4 * len(edges)))
+        cursor = offsets[:-1]
+        for source, target in sorted(edges):
+            targets[cursor[source]] = target
+            cursor[source] += 1
+        return cls(offsets, targets)
+
+    def neighbours(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+
+def _select_name(obj: dict, key: str | None = None, name: str | None = None) -> str:
+    for prop in obj.get("properties", []):
+        if (key and prop.get("key") == key) or (name and prop.get("name") == name):
+            return (prop.get("select") or {}).get("name", "")
+    return ""
+
+
+class Codes:
+    """Interns strings as small integers, in order of first appearance."""
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        if value not in self._codes:
+            self._codes[value] = len(self.values)
+            self.values.append(value)
+        return self._codes[value]
+
+
+class RelationGraph:
+    def __init__(self):
+        self.ids: dict[str, list[str]] = {SF: [], FR: [], API: []}
+        self.names: dict[str, list[str]] = {SF: [], FR: [], API: []}
+        self.fr_done = bytearray()
+        # Status and API type columns, as codes into ``statuses``/``api_types``.
+        self.statuses = Codes()
+        self.api_types = Codes()
+        self.fr_status = array("H")
+        self.api_status = array("H")
+        self.api_type = array("H")
+        self.sf_frs = self.fr_sfs = self.fr_apis = self.api_frs = None
+
+    @classmethod
+    def load(
+        cls,
+        client,
+        space_id: str,
+        sf_types=(SF_TYPE_ID, SF_TYPE_KEY),
+        fr_types=(FR_TYPE_KEY,),
+        api_types=(API_TYPE_ID,),
+    ) -> "RelationGraph":
+        """Build the graph from one paged search over the three types."""
+        kind_of_type = {t: SF for t in sf_types}
+        kind_of_type.update({t: FR for t in fr_types})
+        kind_of_type.update({t: API for t in api_types})
+        objects = []
+        for page in client.iter_search_pages(space_id, "", list(kind_of_type)):
+            objects.extend(page)
+        return cls.from_objects(objects, kind_of_type)
+
+    @classmethod
+    def from_objects(cls, objects, kind_of_type: dict[str, str]) -> "RelationGraph":
+        graph = cls()
+        classified = []
+        for obj in objects:
+            obj_type = obj.get("type") or {}
+            kind = kind_of_type.get(obj_type.get("id")) or kind_of_type.get(
+                obj_type.get("key")
+            )
+            if kind:
+                classified.append((kind, obj))
+                graph.ids[kind].append(obj["id"])
+                graph.names[kind].append(obj.get("name", ""))
+
+        number = {
+            kind: {object_id: i for i, object_id in enumerate(ids)}
+            for kind, ids in graph.ids.items()
+        }
+        sf_fr = set()
+        fr_api = set()
+        graph.fr_done = bytearray(len(graph.ids[FR]))
+        graph.fr_status = array("H", bytes(2 * len(graph.ids[FR])))
+        graph.api_status = array("H", bytes(2 * len(graph.ids[API])))
+        graph.api_type = array("H", bytes(2 * len(graph.ids[API])))
+        for kind, obj in classified:
+            if kind == SF:
+                sf = number[SF][obj["id"]]
+                for key in SF_FR_KEYS:
+                    for linked in get_property(obj, key).get("objects") or []:
+                        if linked in number[FR]:
+                            sf_fr.add((sf, number[FR][linked]))
+            elif kind == FR:
+                fr = number[FR][obj["id"]]
+                status = _select_name(obj, key="status")
+                graph.fr_done[fr] = status == "Done"
+                graph.fr_status[fr] = graph.statuses.code(status)
+                linked_sfs = get_property(obj, FR_SYSTEM_FEATURE_KEY).get("objects")
+                for linked in linked_sfs or []:
+                    if linked in number[SF]:
+                        sf_fr.add((number[SF][linked], fr))
+            else:
+                api = number[API][obj["id"]]
+                graph.api_status[api] = graph.statuses.code(
+                    _select_name(obj, name="Status")
+                )
+                graph.api_type[api] = graph.api_types.code(
+                    _select_name(obj, name="API Type")
+                )
+                linked_frs = get_property(obj, API_FUNCTIONAL_REQUIREMENTS_KEY).get(
+                    "objects"
+                )
+                for linked in linked_frs or []:
+                    if linked in number[FR]:
+                        fr_api.add((number[FR][linked], api))
+
+        sizes = {kind: len(ids) for kind, ids in graph.ids.items()}
+        graph.sf_frs = Adjacency.from_edges(sizes[SF], list(sf_fr))
+        graph.fr_sfs = Adjacency.from_edges(sizes[FR], [(f, s) for s, f in sf_fr])
+        graph.fr_apis = Adjacency.from_edges(sizes[FR], list(fr_api))
+        graph.api_frs = Adjacency.from_edges(sizes[API], [(a, f) for f, a in fr_api])
+        return graph
+
+    # -- coverage queries ------------------------------------------------
+
+    def frs_without_api(self) -> list[int]:
+        return [fr for fr in range(len(self.ids[FR])) if not self.fr_apis.degree(fr)]
+
+    def frs_without_sf(self) -> list[int]:
+        return [fr for fr in range(len(self.ids[FR])) if not self.fr_sfs.degree(fr)]
+
+    def orphan_apis(self) -> list[int]:
+        return [
+            api for api in range(len(self.ids[API])) if not self.api_frs.degree(api)
+        ]
+
+    def done_system_features(self) -> list[int]:
+        """SFs that have FRs, all of which are Done."""
+        return [
+            sf
+            for sf in range(len(self.ids[SF]))
+            if self.sf_frs.degree(sf)
+            and all(self.fr_done[fr] for fr in self.sf_frs.neighbours(sf))
+        ]
+
+    def coverage_matrix(self) -> list[tuple[int, int, int, int]]:
+        """Per SF: (sf, FRs, FRs done, FRs with at least one API)."""
+        rows = []
+        for sf in range(len(self.ids[SF])):
+            frs = self.sf_frs.neighbours(sf)
+            rows.append(
+                (
+                    sf,
+                    len(frs),
+                    sum(self.fr_done[fr] for fr in frs),
+                    sum(1 for fr in frs if self.fr_apis.degree(fr)),
+                )
+            )
+        return rows
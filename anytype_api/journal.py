@@ -0,0 +1,106 @@
+"""Append-only journal of the writes made by an import run.
+
+Each line is a JSON record: a ``planned`` record when a step is scheduled
+and a ``done`` record with the returned object id once it succeeds. A run
+started with ``--resume`` replays the journal and skips every step that is
+already done, without touching the API. Steps that were planned but never
+confirmed are reported as ``unconfirmed``: their request may have reached
+the server before the run died, so the caller can warn before retrying.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+JOURNAL_DIR = ".everywhere_journal"
+
+
+class Journal:
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: dict[str, str] = {}
+        # Steps a replayed journal shows as started, done or not.
+        self.started: set[str] = set()
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def open(
+        cls, *run_key: str, resume: bool = False, directory: str = JOURNAL_DIR
+    ) -> "Journal":
+        """Open the journal for a run identified by ``run_key``.
+
+        Without ``resume`` any previous journal for the same run is discarded.
+        """
+        digest = hashlib.sha1("\0".join(run_key).encode("utf-8")).hexdigest()
+        journal = cls(os.path.join(directory, f"{digest}.jsonl"))
+        os.makedirs(directory, exist_ok=True)
+        if resume:
+            journal._replay()
+            journal._drop_partial_line()
+        journal._file = open(journal.path, "a" if resume else "w")
+        return journal
+
+    def _replay(self):
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A run killed mid-write can leave a partial last line.
+                        continue
+                    if record.get("event") == "planned":
+                        self.started.add(record["step"])
+                    elif record.get("event") == "done":
+                        self.completed[record["step"]] = record["object_id"]
+        except FileNotFoundError:
+            pass
+
+    def _drop_partial_line(self):
+        """Cut a record a killed run left half-written.
+
+        New records are appended after it, and a record glued onto a partial
+        line would be skipped as bad JSON on the next replay.
+        """
+        try:
+            with open(self.path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+
+    def _append(self, record: dict):
+        with self._lock:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+
+    def is_done(self, step: str) -> bool:
+        return step in self.completed
+
+    @property
+    def unconfirmed(self) -> list[str]:
+        """Steps a previous run started without recording them as done."""
+        return sorted(self.started - self.completed.keys())
+
+    def planned(self, step: str, op: str):
+        self._append({"event": "planned", "step": step, "op": op})
+
+    def done(self, step: str, op: str, object_id: str):
+        self.completed[step] = object_id
+        self._append(
+            {"event": "done", "step": step, "op": op, "object_id": object_id}
+        )
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,18 @@
+"""Type and property keys of the requirements space.
+
+These are the same keys hardcoded in the individual commands, collected
+here for code that needs several of them.
+"""
+
+SF_TYPE_KEY = "6829c5890dd8772c7c96a596"
+FR_TYPE_KEY = "6829be190dd8772c7c96a583"
+API_TYPE_ID = "bafyreicpin6mrj5btg3tqy6ve5twfjqittegdmojpai6d6vmhbuqmkmytq"
+SF_TYPE_ID = "bafyreiczbkx2ungqnhdf6c7haiq3efjvpb3cqm5tyfnpei3nopbexf7o2e"
+FR_TEMPLATE_ID = "bafyreidchi3wlbchypmpp3tksocuxzyh6hozuar4vihogm7jg7ps53yzby"
+
+# Custom "Id" text property on SFs, e.g. "SR-3".
+CUSTOM_ID_KEY = "6829bde80dd8772c7c96a582"
+# FR -> SF relation.
+FR_SYSTEM_FEATURE_KEY = "6829c5d10dd8772c7c96a599"
+# API -> FR relation.
+API_FUNCTIONAL_REQUIREMENTS_KEY = "6829e4c40dd8772c7c96a5ac"
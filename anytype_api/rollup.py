@@ -0,0 +1,154 @@
+"""Vectorized status rollups over a ``RelationGraph``.
+
+The graph's code columns and CSR relations are viewed as NumPy arrays and
+every rollup is a single ``bincount`` over relation edges, so the cost is a
+few array passes regardless of how many objects the space holds. NumPy is
+an optional dependency (``pip install everywhere-any[stats]``).
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .graph import FR, SF, Adjacency, RelationGraph
+
+DONE = "Done"
+
+
+def _edges(adjacency: Adjacency) -> tuple[np.ndarray, np.ndarray]:
+    """(source, target) index arrays for every edge of a CSR relation."""
+    offsets = np.asarray(adjacency.offsets, dtype=np.intp)
+    targets = np.asarray(adjacency.targets, dtype=np.intp)
+    sources = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    return sources, targets
+
+
+def _percent(part: np.ndarray, whole: np.ndarray) -> np.ndarray:
+    return np.divide(100.0 * part, whole, out=np.zeros(np.shape(part)), where=whole > 0)
+
+
+@dataclass
+class StatusRollup:
+    statuses: list[str]
+    api_types: list[str]
+    # FRs per (SF, status), shape (SFs, statuses).
+    sf_status: np.ndarray
+    fr_status_totals: np.ndarray
+    fr_done: np.ndarray
+    # Per FR: linked APIs and how many of them are Done.
+    fr_apis: np.ndarray
+    fr_apis_done: np.ndarray
+    api_done: np.ndarray
+    api_type_totals: np.ndarray
+
+    @classmethod
+    def from_graph(cls, graph: RelationGraph) -> "StatusRollup":
+        statuses = graph.statuses.values or [""]
+        done_code = statuses.index(DONE) if DONE in statuses else -1
+        fr_status = np.asarray(graph.fr_status, dtype=np.intp)
+        api_status = np.asarray(graph.api_status, dtype=np.intp)
+        api_type = np.asarray(graph.api_type, dtype=np.intp)
+        sf_count, fr_count = len(graph.ids[SF]), len(graph.ids[FR])
+
+        sf_of_edge, fr_of_edge = _edges(graph.sf_frs)
+        sf_status = np.bincount(
+            sf_of_edge * len(statuses) + fr_status[fr_of_edge],
+            minlength=sf_count * len(statuses),
+        ).reshape(sf_count, len(statuses))
+
+        api_done = api_status == done_code
+        api_of_edge, fr_of_api_edge = _edges(graph.api_frs)
+        fr_apis = np.bincount(fr_of_api_edge, minlength=fr_count)
+        fr_apis_done = np.bincount(
+            fr_of_api_edge, weights=api_done[api_of_edge], minlength=fr_count
+        ).astype(np.intp)
+
+        return cls(
+            statuses=statuses,
+            api_types=graph.api_types.values,
+            sf_status=sf_status,
+            fr_status_totals=np.bincount(fr_status, minlength=len(statuses)),
+            fr_done=fr_status == done_code,
+            fr_apis=fr_apis,
+            fr_apis_done=fr_apis_done,
+            api_done=api_done,
+            api_type_totals=np.bincount(
+                api_type, minlength=len(graph.api_types.values)
+            ),
+        )
+
+    @property
+    def sf_percent_done(self) -> np.ndarray:
+        if DONE not in self.statuses:
+            return np.zeros(len(self.sf_status))
+        done = self.sf_status[:, self.statuses.index(DONE)]
+        return _percent(done, self.sf_status.sum(axis=1))
+
+    def api_completion(self) -> dict[str, int]:
+        """FRs bucketed by how many of their APIs are Done."""
+        has_apis = self.fr_apis > 0
+        return {
+            "all_done": int(np.sum(has_apis & (self.fr_apis_done == self.fr_apis))),
+            "some_done": int(
+                np.sum((self.fr_apis_done > 0) & (self.fr_apis_done < self.fr_apis))
+            ),
+            "none_done": int(np.sum(has_apis & (self.fr_apis_done == 0))),
+            "no_apis": int(np.sum(~has_apis)),
+        }
+
+    def summary(self) -> dict:
+        frs, apis = len(self.fr_done), len(self.api_done)
+        frs_done, apis_done = int(self.fr_done.sum()), int(self.api_done.sum())
+        return {
+            "system_features": len(self.sf_status),
+            "functional_requirements": frs,
+            "frs_done": frs_done,
+            "percent_frs_done": round(float(_percent(frs_done, frs)), 1),
+            "apis": apis,
+            "apis_done": apis_done,
+            "percent_apis_done": round(float(_percent(apis_done, apis)), 1),
+            "frs_by_status": {
+                status or "(none)": int(count)
+                for status, count in zip(self.statuses, self.fr_status_totals)
+                if count
+            },
+            "apis_by_type": {
+                api_type or "(none)": int(count)
+                for api_type, count in zip(self.api_types, self.api_type_totals)
+            },
+            "fr_api_completion": self.api_completion(),
+        }
+
+    def to_dict(self, graph: RelationGraph) -> dict:
+        """Everything, per SF and per FR, in a JSON-ready form."""
+        status_names = [status or "(none)" for status in self.statuses]
+        percent_done = self.sf_percent_done.round(1).tolist()
+        fr_percent = _percent(self.fr_apis_done, self.fr_apis).round(1).tolist()
+        return {
+            "summary": self.summary(),
+            "system_features": [
+                {
+                    "name": name,
+                    "frs": sum(counts),
+                    "by_status": dict(zip(status_names, counts)),
+                    "percent_done": percent,
+                }
+                for name, counts, percent in zip(
+                    graph.names[SF], self.sf_status.tolist(), percent_done
+                )
+            ],
+            "functional_requirements": [
+                {
+                    "name": name,
+                    "apis": apis,
+                    "apis_done": done,
+                    "percent_apis_done": percent,
+                }
+                for name, apis, done, percent in zip(
+                    graph.names[FR],
+                    self.fr_apis.tolist(),
+                    self.fr_apis_done.tolist(),
+                    fr_percent,
+                )
+            ],
+        }
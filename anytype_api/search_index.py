@@ -0,0 +1,239 @@
+"""Local inverted index over the objects of a space.
+
+The index is built from one bulk pull of every object in the space and
+stored on disk, so ad-hoc queries run without the Anytype app. Queries are
+whitespace-separated terms that must all match:
+
+- ``login`` matches names and descriptions with a word starting "login";
+- ``status:Done`` or ``type:FR`` restricts the match to one field, where the
+  fields are name, description, type and every select property (lower-cased,
+  spaces replaced by underscores, e.g. ``api_type:GET``);
+- quoting keeps words together, e.g. ``type:"Functional Requirement"``.
+
+Every query word is treated as a prefix. ``refresh`` re-pulls the space and
+re-indexes only the objects whose content changed. The index is saved as
+JSON, and a file that cannot be read back is treated as no index.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+from bisect import bisect_left
+
+from .space_index import description_of
+
+INDEX_DIR = ".everywhere_cache"
+INDEX_VERSION = 2
+
+TEXT_FIELD = "text"
+token_pattern = re.compile(r"[a-z0-9]+(?:[.\-_][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> set[str]:
+    """Lower-cased words, keeping ids like "fr-1.2" whole as well as split."""
+    text = text.lower()
+    tokens = set(token_pattern.findall(text))
+    for token in list(tokens):
+        tokens.update(re.split(r"[.\-_]", token))
+    tokens.discard("")
+    return tokens
+
+
+def field_name(property_name: str) -> str:
+    return property_name.strip().lower().replace(" ", "_")
+
+
+def _type_tokens(type_info: dict) -> set[str]:
+    name = type_info.get("name", "")
+    tokens = tokenize(name)
+    words = name.split()
+    if len(words) > 1:
+        # "Functional Requirement" is also findable as type:FR.
+        tokens.add("".join(word[0] for word in words).lower())
+    for key in ("key", "id"):
+        if type_info.get(key):
+            tokens.add(type_info[key].lower())
+    return tokens
+
+
+def document_for(obj: dict) -> dict:
+    """Reduce an API object to the fields the index cares about."""
+    type_info = obj.get("type") or {}
+    if not isinstance(type_info, dict):
+        type_info = {"id": str(type_info)}
+    selects = {}
+    for prop in obj.get("properties", []):
+        if isinstance(prop.get("select"), dict) and prop.get("name"):
+            selects[field_name(prop["name"])] = prop["select"].get("name", "")
+    document = {
+        "id": obj["id"],
+        "name": obj.get("name", ""),
+        "description": description_of(obj),
+        "type": {k: type_info.get(k, "") for k in ("id", "key", "name")},
+        "selects": selects,
+    }
+    document["hash"] = hashlib.sha1(
+        json.dumps(document, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return document
+
+
+def _document_fields(document: dict) -> dict[str, set[str]]:
+    name_tokens = tokenize(document["name"])
+    description_tokens = tokenize(document["description"])
+    fields = {
+        "name": name_tokens,
+        "description": description_tokens,
+        TEXT_FIELD: name_tokens | description_tokens,
+        "type": _type_tokens(document["type"]),
+    }
+    for select_field, value in document["selects"].items():
+        fields[select_field] = tokenize(value)
+    return fields
+
+
+class SearchIndex:
+    def __init__(self, space_name: str):
+        self.space_name = space_name
+        self.documents: dict[str, dict] = {}
+        self.postings: dict[str, dict[str, set[str]]] = {}
+        self._sorted_tokens: dict[str, list[str]] = {}
+
+    # -- maintenance -----------------------------------------------------
+
+    def upsert(self, obj: dict) -> bool:
+        """Index ``obj``; returns False when it was already indexed unchanged."""
+        document = document_for(obj)
+        existing = self.documents.get(document["id"])
+        if existing and existing["hash"] == document["hash"]:
+            return False
+        if existing:
+            self.remove(document["id"])
+        self.documents[document["id"]] = document
+        for field, tokens in _document_fields(document).items():
+            postings = self.postings.setdefault(field, {})
+            for token in tokens:
+                postings.setdefault(token, set()).add(document["id"])
+            self._sorted_tokens.pop(field, None)
+        return True
+
+    def remove(self, object_id: str):
+        document = self.documents.pop(object_id, None)
+        if not document:
+            return
+        for field, tokens in _document_fields(document).items():
+            postings = self.postings.get(field, {})
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is not None:
+                    ids.discard(object_id)
+                    if not ids:
+                        del postings[token]
+            self._sorted_tokens.pop(field, None)
+
+    def refresh(self, client, space_id: str) -> tuple[int, int]:
+        """Re-pull the space; returns (objects re-indexed, objects removed)."""
+        types = client.get_object_types(space_id).get("data") or []
+        type_ids = [t["id"] for t in types]
+        seen = set()
+        changed = 0
+        for page in client.iter_search_pages(space_id, "", type_ids):
+            for obj in page:
+                seen.add(obj["id"])
+                if self.upsert(obj):
+                    changed += 1
+        removed = [object_id for object_id in self.documents if object_id not in seen]
+        for object_id in removed:
+            self.remove(object_id)
+        return changed, len(removed)
+
+    # -- queries ---------------------------------------------------------
+
+    def _prefix_ids(self, field: str, prefix: str) -> set[str]:
+        postings = self.postings.get(field)
+        if not postings:
+            return set()
+        tokens = self._sorted_tokens.get(field)
+        if tokens is None:
+            tokens = self._sorted_tokens[field] = sorted(postings)
+        ids = set()
+        position = bisect_left(tokens, prefix)
+        while position < len(tokens) and tokens[position].startswith(prefix):
+            ids |= postings[tokens[position]]
+            position += 1
+        return ids
+
+    def search(self, query: str, type_filter: set[str] | None = None) -> list[dict]:
+        """Return documents matching every term of ``query``, sorted by name.
+
+        ``type_filter`` optionally limits results to objects whose lower-cased
+        type id, key or name is in the set.
+        """
+        result = None
+        for term in shlex.split(query):
+            field, _, value = term.partition(":")
+            if not value or field_name(field) not in self.postings:
+                field, value = TEXT_FIELD, term
+            field = field_name(field)
+            words = token_pattern.findall(value.lower()) or [value.lower()]
+            for word in words:
+                ids = self._prefix_ids(field, word)
+                result = ids if result is None else result & ids
+                if not result:
+                    return []
+
+        documents = (
+            self.documents.values()
+            if result is None
+            else (self.documents[object_id] for object_id in result)
+        )
+        if type_filter:
+            documents = (
+                d
+                for d in documents
+                if {value.lower() for value in d["type"].values()} & type_filter
+            )
+        return sorted(documents, key=lambda d: d["name"])
+
+    # -- storage ---------------------------------------------------------
+
+    @staticmethod
+    def path_for(space_name: str, directory: str = INDEX_DIR) -> str:
+        key = hashlib.sha1(space_name.encode("utf-8")).hexdigest()
+        return os.path.join(directory, f"search-{key}.json")
+
+    @classmethod
+    def load(cls, space_name: str, directory: str = INDEX_DIR) -> "SearchIndex | None":
+        try:
+            with open(cls.path_for(space_name, directory), encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] != INDEX_VERSION:
+                return None
+            index = cls(space_name)
+            index.documents = data["documents"]
+            index.postings = {
+                field: {token: set(ids) for token, ids in postings.items()}
+                for field, postings in data["postings"].items()
+            }
+        except Exception:
+            # Any unreadable or outdated index is rebuilt by 'index'.
+            return None
+        return index
+
+    def save(self, directory: str = INDEX_DIR):
+        path = self.path_for(self.space_name, directory)
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        data = {
+            "version": INDEX_VERSION,
+            "documents": self.documents,
+            "postings": {
+                field: {token: sorted(ids) for token, ids in postings.items()}
+                for field, postings in self.postings.items()
+            },
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
@@ -0,0 +1,74 @@
+"""Client sharing for commands that run inside one long-lived process."""
+
+import json
+import threading
+from contextlib import contextmanager
+
+from .client import AnytypeClient
+
+_current_client = None
+
+
+def get_client() -> AnytypeClient:
+    """Return the client of the active session, or a fresh client."""
+    return _current_client or AnytypeClient()
+
+
+@contextmanager
+def use_client(client: AnytypeClient):
+    """Make every ``get_client()`` call inside the block return ``client``."""
+    global _current_client
+    previous = _current_client
+    _current_client = client
+    try:
+        yield client
+    finally:
+        _current_client = previous
+
+
+class CachingAnytypeClient(AnytypeClient):
+    """An AnytypeClient that remembers read responses.
+
+    GET requests and searches are answered from memory after the first
+    call; any other request (creates and updates) empties the cache. The
+    names of every type and object seen are kept for tab completion.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._responses = {}
+        self._lock = threading.Lock()
+        self.type_names: set[str] = set()
+        self.object_names: set[str] = set()
+
+    def _make_request(self, method, endpoint, payload=None):
+        is_read = method == "GET" or (method == "POST" and "/search" in endpoint)
+        if not is_read:
+            self.clear()
+            return super()._make_request(method, endpoint, payload)
+
+        key = (method, endpoint, json.dumps(payload, sort_keys=True))
+        with self._lock:
+            if key in self._responses:
+                return self._responses[key]
+        response = super()._make_request(method, endpoint, payload)
+        with self._lock:
+            self._responses[key] = response
+        self._remember_names(endpoint, response)
+        return response
+
+    def _remember_names(self, endpoint, response):
+        if not isinstance(response, dict):
+            return
+        if isinstance(response.get("object"), dict):
+            items = [response["object"]]
+        else:
+            items = response.get("data") or []
+        names = self.type_names if endpoint.endswith("/types") else self.object_names
+        for item in items:
+            if isinstance(item, dict) and item.get("name"):
+                names.add(item["name"])
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
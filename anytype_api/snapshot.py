@@ -0,0 +1,124 @@
+"""Local snapshots of a space and a client that reads them offline.
+
+A snapshot is gzip-compressed JSON Lines: a ``space`` record, one ``type``
+record per object type, then one ``object`` record per SF, FR and API, as
+the search endpoint returned them. ``SnapshotClient`` answers the reads
+``AnytypeClient`` makes from that file, so commands run unchanged against
+an archived baseline without the Anytype app.
+"""
+
+import gzip
+import json
+import os
+from urllib.parse import parse_qs, urlsplit
+
+from .client import SEARCH_PAGE_SIZE, AnytypeClient
+from .keys import API_TYPE_ID, FR_TYPE_KEY, SF_TYPE_ID, SF_TYPE_KEY
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_TYPES = (SF_TYPE_ID, SF_TYPE_KEY, FR_TYPE_KEY, API_TYPE_ID)
+
+
+def write_snapshot(client, space: dict, path: str, type_ids=SNAPSHOT_TYPES) -> int:
+    """Pull the space's types and objects into ``path``; returns the object count."""
+    types = client.get_object_types(space["id"]).get("data") or []
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"version": SNAPSHOT_VERSION, "space": space}) + "\n")
+        for obj_type in types:
+            f.write(json.dumps({"type": obj_type}) + "\n")
+        for page in client.iter_search_pages(space["id"], "", list(type_ids)):
+            for obj in page:
+                f.write(json.dumps({"object": obj}) + "\n")
+                count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+class SnapshotClient(AnytypeClient):
+    """A read-only AnytypeClient backed by a snapshot file."""
+
+    def __init__(self, space: dict, types: list[dict], objects: dict[str, dict]):
+        # AnytypeClient.__init__ only sets up what a live connection needs
+        # (host, ANYTYPE_API_KEY, headers, in-flight GET sharing), so it is
+        # skipped: no request leaves the process, and a snapshot must load
+        # without an API key.
+        self.space = space
+        self.types = types
+        self.objects = objects
+
+    @classmethod
+    def load(cls, path: str) -> "SnapshotClient":
+        space, types, objects = None, [], {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                if "object" in record:
+                    objects[record["object"]["id"]] = record["object"]
+                elif "type" in record:
+                    types.append(record["type"])
+                elif "space" in record:
+                    if record.get("version") != SNAPSHOT_VERSION:
+                        raise ValueError(
+                            f"Unsupported snapshot version {record.get('version')}"
+                        )
+                    space = record["space"]
+        if space is None:
+            raise ValueError(f"'{path}' is not a space snapshot")
+        return cls(space, types, objects)
+
+    def _make_request(self, method, endpoint, payload=None):
+        url = urlsplit(endpoint)
+        parts = url.path.strip("/").split("/")
+        if method == "GET":
+            if parts == ["v1", "spaces"]:
+                return {"data": [self.space]}
+            if parts[-1] == "types":
+                return {"data": self.types}
+            if parts[-1] == "templates":
+                return {"data": []}
+            if len(parts) == 5 and parts[3] == "types":
+                for obj_type in self.types:
+                    if parts[4] in (obj_type.get("id"), obj_type.get("key")):
+                        return {"type": obj_type}
+                raise Exception(f"Type '{parts[4]}' is not in the snapshot")
+            if len(parts) == 5 and parts[3] == "objects":
+                obj = self.objects.get(parts[4])
+                if obj is None:
+                    # Every SF, FR and API is in the snapshot, so any other id
+                    # (e.g. a page backlinking an SF) is an object of another
+                    # type, and callers filtering on type skip it.
+                    obj = {"id": parts[4], "name": "", "type": {}, "properties": []}
+                return {"object": obj}
+        if method == "POST" and parts[-1] == "search":
+            return self._search(payload or {}, parse_qs(url.query))
+        raise Exception(f"Snapshots are read-only: {method} {url.path}")
+
+    def _search(self, payload, query):
+        types = set(payload.get("types") or [])
+        text = (payload.get("query") or "").lower()
+        matches = [
+            obj
+            for obj in self.objects.values()
+            if (
+                not types
+                or {obj.get("type", {}).get("id"), obj.get("type", {}).get("key")}
+                & types
+            )
+            and text in obj.get("name", "").lower()
+        ]
+        if "limit" not in query:
+            return {"data": matches}
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(SEARCH_PAGE_SIZE)])[0])
+        page = matches[offset : offset + limit]
+        return {
+            "data": page,
+            "pagination": {
+                "total": len(matches),
+                "offset": offset,
+                "limit": limit,
+                "has_more": offset + len(page) < len(matches),
+            },
+        }
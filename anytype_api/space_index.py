@@ -0,0 +1,77 @@
+"""In-memory name indexes of the SFs and FRs in a space."""
+
+from .keys import CUSTOM_ID_KEY, FR_SYSTEM_FEATURE_KEY, FR_TYPE_KEY, SF_TYPE_KEY
+
+
+def get_property(obj: dict, key: str) -> dict:
+    for prop in obj.get("properties", []):
+        if prop.get("key") == key:
+            return prop
+    return {}
+
+
+def description_of(obj: dict) -> str:
+    return get_property(obj, "description").get("text", "")
+
+
+def normalize_name(name: str) -> str:
+    """Fold case and runs of whitespace, e.g. for markdown headings."""
+    return " ".join(name.split()).casefold()
+
+
+class SpaceIndex:
+    """Name -> object maps for System Features and Functional Requirements.
+
+    Built from one paged search per type, then kept up to date in place as
+    objects are created so later lookups never go back to the server. SFs
+    that have no exact name match are also looked up by ``normalize_name``.
+    """
+
+    def __init__(self, space_id: str):
+        self.space_id = space_id
+        self.system_features: dict[str, dict] = {}
+        self.functional_requirements: dict[str, dict] = {}
+        self._normalized_system_features: dict[str, dict] = {}
+
+    @classmethod
+    def load(
+        cls,
+        client,
+        space_id: str,
+        sf_type_key: str = SF_TYPE_KEY,
+        fr_type_key: str = FR_TYPE_KEY,
+    ) -> "SpaceIndex":
+        index = cls(space_id)
+        for page in client.iter_search_pages(space_id, "", [sf_type_key]):
+            for obj in page:
+                index.add_system_feature(obj)
+        for page in client.iter_search_pages(space_id, "", [fr_type_key]):
+            for obj in page:
+                index.add_functional_requirement(obj)
+        return index
+
+    def add_system_feature(self, obj: dict):
+        self.system_features[obj["name"]] = obj
+        # SFs are also addressable by their custom "SR-x" id.
+        custom_id = get_property(obj, CUSTOM_ID_KEY).get("text")
+        if custom_id:
+            self.system_features.setdefault(custom_id, obj)
+        self._normalized_system_features.setdefault(normalize_name(obj["name"]), obj)
+
+    def add_functional_requirement(self, obj: dict):
+        self.functional_requirements[obj["name"]] = obj
+
+    def system_feature_id(self, name: str) -> str | None:
+        obj = self.system_features.get(name)
+        if obj is None:
+            obj = self._normalized_system_features.get(normalize_name(name))
+        return obj["id"] if obj else None
+
+    def functional_requirement_id(self, name: str) -> str | None:
+        obj = self.functional_requirements.get(name)
+        return obj["id"] if obj else None
+
+    @staticmethod
+    def linked_system_feature(fr_obj: dict) -> str | None:
+        objects = get_property(fr_obj, FR_SYSTEM_FEATURE_KEY).get("objects") or []
+        return objects[0] if objects else None
@@ -0,0 +1,183 @@
+"""Plan and apply a differential sync of parsed requirements into a space."""
+
+from dataclasses import dataclass, field
+
+from parser.payloads import functional_requirement_payload, system_feature_payload
+
+from .bulk import DEFAULT_MAX_WORKERS, WriteResult, create_objects, update_objects
+from .keys import FR_SYSTEM_FEATURE_KEY
+from .space_index import SpaceIndex, description_of
+
+CREATE = "create"
+UPDATE = "update"
+NOOP = "noop"
+
+
+@dataclass
+class SyncAction:
+    action: str
+    kind: str  # "SF" or "FR"
+    name: str
+    node: object = field(repr=False)
+    object_id: str | None = None
+    changes: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SyncPlan:
+    actions: list[SyncAction] = field(default_factory=list)
+
+    def by_action(self, action: str) -> list[SyncAction]:
+        return [a for a in self.actions if a.action == action]
+
+    @property
+    def has_changes(self) -> bool:
+        return any(a.action != NOOP for a in self.actions)
+
+
+def _sf_title_field(remote_sf: dict, sr_id: str) -> str:
+    """Where a remote SF keeps the heading title parsed as its description.
+
+    SFs written by this tool are named ``SR-x`` and hold the title in their
+    description. SFs matched through their custom id are named after the
+    title and keep their own, longer description, which sync leaves alone.
+    """
+    return "description" if remote_sf["name"] == sr_id else "name"
+
+
+def _sf_title(remote_sf: dict, sr_id: str) -> str:
+    if _sf_title_field(remote_sf, sr_id) == "description":
+        return description_of(remote_sf)
+    return remote_sf["name"]
+
+
+def plan_sync(features, index: SpaceIndex) -> SyncPlan:
+    """Diff parsed features against the space by name and content."""
+    plan = SyncPlan()
+    for feature in features:
+        remote_sf = index.system_features.get(feature.id)
+        if remote_sf is None:
+            plan.actions.append(SyncAction(CREATE, "SF", feature.id, feature))
+            sf_object_id = None
+        else:
+            sf_object_id = remote_sf["id"]
+            if feature.description == _sf_title(remote_sf, feature.id):
+                action = SyncAction(NOOP, "SF", feature.id, feature, sf_object_id)
+            else:
+                action = SyncAction(
+                    UPDATE,
+                    "SF",
+                    feature.id,
+                    feature,
+                    sf_object_id,
+                    [_sf_title_field(remote_sf, feature.id)],
+                )
+            plan.actions.append(action)
+
+        for fr in feature.functional_requirements:
+            remote_fr = index.functional_requirements.get(fr.id)
+            if remote_fr is None:
+                plan.actions.append(SyncAction(CREATE, "FR", fr.id, fr))
+                continue
+
+            changes = []
+            if fr.description != description_of(remote_fr):
+                changes.append("description")
+            # An SF created by this plan has no id yet, so its existing FRs
+            # always need linking to it.
+            remote_sf_id = SpaceIndex.linked_system_feature(remote_fr)
+            if sf_object_id is None or sf_object_id != remote_sf_id:
+                changes.append("system feature")
+            if changes:
+                action = SyncAction(UPDATE, "FR", fr.id, fr, remote_fr["id"], changes)
+            else:
+                action = SyncAction(NOOP, "FR", fr.id, fr, remote_fr["id"])
+            plan.actions.append(action)
+    return plan
+
+
+def _fr_link(index: SpaceIndex, fr) -> list[dict] | None:
+    """The FR's System Feature link, or None when its SF has no object."""
+    sf_object_id = index.system_feature_id(fr.linked_sr)
+    if not sf_object_id:
+        return None
+    return [{"key": FR_SYSTEM_FEATURE_KEY, "objects": [sf_object_id]}]
+
+
+def _unlinked(action: SyncAction) -> WriteResult:
+    return WriteResult(action.name, error="its System Feature was not created")
+
+
+def _sf_update(action: SyncAction) -> dict:
+    if "name" in action.changes:
+        return {"name": action.node.description}
+    return {"properties": [{"key": "description", "text": action.node.description}]}
+
+
+def apply_plan(
+    client,
+    index: SpaceIndex,
+    plan: SyncPlan,
+    sf_type_key: str,
+    fr_type_key: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[WriteResult]:
+    """Send only the writes in the plan: SFs first, then FRs linked to them."""
+    results = []
+
+    sf_creates = [a for a in plan.by_action(CREATE) if a.kind == "SF"]
+    created = create_objects(
+        client,
+        index.space_id,
+        [(a.name, system_feature_payload(a.node, sf_type_key)) for a in sf_creates],
+        max_workers,
+    )
+    for result in created:
+        if result.ok:
+            index.add_system_feature({"id": result.object_id, "name": result.key})
+    results.extend(created)
+
+    results.extend(
+        update_objects(
+            client,
+            [
+                (a.name, a.object_id, _sf_update(a))
+                for a in plan.by_action(UPDATE)
+                if a.kind == "SF"
+            ],
+            max_workers,
+        )
+    )
+
+    # FRs whose SF failed to be created are reported, not written unlinked.
+    fr_creates = []
+    for a in plan.by_action(CREATE):
+        if a.kind == "FR":
+            link = _fr_link(index, a.node)
+            if link is None:
+                results.append(_unlinked(a))
+                continue
+            payload = functional_requirement_payload(a.node, fr_type_key)
+            payload["properties"].extend(link)
+            fr_creates.append((a.name, payload))
+    created = create_objects(client, index.space_id, fr_creates, max_workers)
+    for result in created:
+        if result.ok:
+            index.add_functional_requirement(
+                {"id": result.object_id, "name": result.key}
+            )
+    results.extend(created)
+
+    fr_updates = []
+    for a in plan.by_action(UPDATE):
+        if a.kind == "FR":
+            link = _fr_link(index, a.node)
+            if link is None:
+                results.append(_unlinked(a))
+                continue
+            properties = [{"key": "description", "text": a.node.description}]
+            properties.extend(link)
+            fr_updates.append((a.name, a.object_id, {"properties": properties}))
+    results.extend(update_objects(client, fr_updates, max_workers))
+
+    return results
@@ -0,0 +1,83 @@
+"""Lightweight phase tracing with Chrome trace export.
+
+Wrap a phase in ``span``; when tracing has been started, each span becomes
+a complete ("X") event of the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev load directly. Spans on the
+same thread nest by time, so HTTP requests show up under the phase that
+made them. Without ``start`` a span costs one global check.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_events = None
+_lock = threading.Lock()
+_origin_ns = 0
+
+
+def start():
+    """Begin recording spans, discarding any earlier recording."""
+    global _events, _origin_ns
+    with _lock:
+        _events = []
+        _origin_ns = time.perf_counter_ns()
+
+
+def stop() -> list[dict]:
+    """Stop recording and return the recorded events."""
+    global _events
+    with _lock:
+        events, _events = _events or [], None
+    return events
+
+
+def is_enabled() -> bool:
+    return _events is not None
+
+
+@contextmanager
+def span(name: str, category: str = "phase", **args):
+    """Record the time spent in the block as one event."""
+    if _events is None:
+        yield
+        return
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end_ns = time.perf_counter_ns()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - _origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with _lock:
+            if _events is not None:
+                _events.append(event)
+
+
+def write(path: str):
+    """Stop recording and write the events to ``path`` as a Chrome trace."""
+    events = stop()
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    metadata = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": tid,
+            "args": {"name": thread_names.get(tid, f"thread {tid}")},
+        }
+        for tid in sorted({event["tid"] for event in events})
+    ]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,41 @@
+"""Micro-benchmark for parse_lines throughput on synthetic documents.
+
+Run with ``python -m benchmarks.bench_parser``.
+"""
+
+import time
+
+import click
+
+from benchmarks.synthetic import requirements_lines
+from parser.parser import parse_lines
+
+
+def measure(lines: list[str], repeat: int) -> float:
+    """Return the best observed throughput in lines per second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_lines(lines)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="100,1000,5000",
+    help="Comma-separated numbers of system features to generate.",
+)
+@click.option("--frs-per-feature", default=10, help="FRs generated per feature.")
+@click.option("--repeat", default=5, help="Runs per size; the best run is reported.")
+def main(sizes, frs_per_feature, repeat):
+    click.echo(f"{'features':>10} {'lines':>10} {'lines/s':>14}")
+    for size in (int(s) for s in sizes.split(",")):
+        lines = requirements_lines(size, frs_per_feature)
+        rate = measure(lines, repeat)
+        click.echo(f"{size:>10} {len(lines):>10} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""A local stand-in for the Anytype API that counts the requests it serves.
+
+It implements the endpoints ``AnytypeClient`` uses over plain HTTP, so
+commands run unchanged against it:
+
+    with FakeAnytype(space_objects(100)) as fake, use_client(fake.client()):
+        generate_report.main([...], standalone_mode=False)
+    fake.requests  # {"GET /v1/spaces/{space_id}/objects/{object_id}": 2101, ...}
+"""
+
+import itertools
+import json
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from anytype_api.client import SEARCH_PAGE_SIZE, AnytypeClient
+
+from .synthetic import SPACE_TYPES
+
+SPACE_NAME = "Everywhere"
+SPACE_ID = "synthetic-space"
+
+# Concrete paths are counted under these templates.
+ROUTES = [
+    (re.compile(r"^/v1/spaces$"), "/v1/spaces"),
+    (re.compile(r"^/v1/spaces/[^/]+/types$"), "/v1/spaces/{space_id}/types"),
+    (
+        re.compile(r"^/v1/spaces/[^/]+/types/[^/]+/templates$"),
+        "/v1/spaces/{space_id}/types/{type_id}/templates",
+    ),
+    (
+        re.compile(r"^/v1/spaces/[^/]+/types/[^/]+$"),
+        "/v1/spaces/{space_id}/types/{type_id}",
+    ),
+    (re.compile(r"^/v1/spaces/[^/]+/search$"), "/v1/spaces/{space_id}/search"),
+    (re.compile(r"^/v1/spaces/[^/]+/objects$"), "/v1/spaces/{space_id}/objects"),
+    (
+        re.compile(r"^/v1/spaces/[^/]+/objects/[^/]+$"),
+        "/v1/spaces/{space_id}/objects/{object_id}",
+    ),
+    (re.compile(r"^/v1/objects/[^/]+$"), "/v1/objects/{object_id}"),
+]
+
+
+def route_of(path: str) -> str:
+    for pattern, template in ROUTES:
+        if pattern.match(path):
+            return template
+    return path
+
+
+class FakeAnytype:
+    """Serve ``objects`` as the only space, named ``SPACE_NAME``."""
+
+    def __init__(self, objects=(), types=SPACE_TYPES, page_size=SEARCH_PAGE_SIZE):
+        self.objects: dict[str, dict] = {obj["id"]: obj for obj in objects}
+        self.types = list(types)
+        self.page_size = page_size
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._server = None
+
+    # -- lifecycle -------------------------------------------------------
+
+    def start(self) -> "FakeAnytype":
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, response = fake.handle(
+                    self.command, url.path, parse_qs(url.query), body
+                )
+                data = json.dumps(response).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        # A short poll interval keeps stop() from stalling the next run.
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def client(self) -> AnytypeClient:
+        return AnytypeClient("127.0.0.1", self.port)
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests.clear()
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    # -- request handling ------------------------------------------------
+
+    def handle(self, method, path, query, body):
+        route = route_of(path)
+        with self._lock:
+            self.requests[f"{method} {route}"] += 1
+
+        if method == "GET" and route == "/v1/spaces":
+            return 200, {"data": [{"id": SPACE_ID, "name": SPACE_NAME}]}
+        if method == "GET" and route == "/v1/spaces/{space_id}/types":
+            return 200, {"data": self.types}
+        if method == "GET" and route == "/v1/spaces/{space_id}/types/{type_id}":
+            type_id = path.rsplit("/", 1)[1]
+            for obj_type in self.types:
+                if type_id in (obj_type["id"], obj_type["key"]):
+                    return 200, {"type": obj_type}
+            return 404, {"error": f"type {type_id} not found"}
+        if method == "GET" and route.endswith("/templates"):
+            return 200, {"data": []}
+        if method == "GET" and route == "/v1/spaces/{space_id}/objects/{object_id}":
+            obj = self.objects.get(path.rsplit("/", 1)[1])
+            if obj is None:
+                return 404, {"error": "object not found"}
+            return 200, {"object": obj}
+        if method == "POST" and route == "/v1/spaces/{space_id}/search":
+            return 200, self._search(body or {}, query)
+        if method == "POST" and route == "/v1/spaces/{space_id}/objects":
+            return 200, {"object": self._create(body or {})}
+        if method == "PATCH" and route == "/v1/objects/{object_id}":
+            obj = self.objects.get(path.rsplit("/", 1)[1])
+            if obj is None:
+                return 404, {"error": "object not found"}
+            return 200, {"object": self._update(obj, body or {})}
+        return 404, {"error": f"{method} {path} is not implemented"}
+
+    def _search(self, body, query):
+        types = set(body.get("types") or [])
+        text = (body.get("query") or "").lower()
+        matches = [
+            obj
+            for obj in self.objects.values()
+            if (not types or {obj["type"]["id"], obj["type"]["key"]} & types)
+            and text in obj["name"].lower()
+        ]
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(self.page_size)])[0])
+        limit = min(limit, self.page_size)
+        page = matches[offset : offset + limit]
+        return {
+            "data": page,
+            "pagination": {
+                "total": len(matches),
+                "offset": offset,
+                "limit": limit,
+                "has_more": offset + len(page) < len(matches),
+            },
+        }
+
+    def _create(self, body):
+        type_key = body.get("type_key", "")
+        obj_type = next(
+            (t for t in self.types if type_key in (t["id"], t["key"])),
+            {"id": type_key, "key": type_key, "name": type_key},
+        )
+        with self._lock:
+            object_id = f"created-{next(self._ids)}"
+        obj = {
+            "id": object_id,
+            "name": body.get("name", ""),
+            "type": obj_type,
+            "properties": list(body.get("properties", [])),
+        }
+        self.objects[object_id] = obj
+        return obj
+
+    def _update(self, obj, body):
+        if "name" in body:
+            obj["name"] = body["name"]
+        if "properties" in body:
+            by_key = {prop.get("key"): prop for prop in obj["properties"]}
+            for prop in body["properties"]:
+                by_key[prop.get("key")] = prop
+            obj["properties"] = list(by_key.values())
+        return obj
@@ -0,0 +1,264 @@
+"""Benchmark suite for the parser, exporters and API-bound commands.
+
+Run with ``python -m benchmarks.run``. Every benchmark reports wall time,
+peak traced memory and the requests it sent to the local stand-in API, and
+the whole run is written as JSON so runs can be diffed against each other.
+Peak memory comes from tracemalloc, which also slows the code it traces;
+pass ``--no-memory`` for wall times closer to a normal run.
+"""
+
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import click
+
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import SPACE_ID, SPACE_NAME, FakeAnytype
+from benchmarks.synthetic import requirements_lines, space_objects
+from parser.exporter import (
+    export_to_csv,
+    export_to_json,
+    export_to_jsonl,
+    export_to_markdown,
+    export_to_markdown_table,
+)
+from parser.models import SystemFeature
+from parser.parser import parse_document, parse_lines
+from parser.stats import validate_frs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(name, fn, fake=None, trace_memory=True) -> dict:
+    """Run ``fn`` once with its output captured and return its measurements.
+
+    Commands report failures as ``Error: ...`` text rather than raising, so
+    that output fails the benchmark too instead of timing a failed run.
+    """
+    if fake:
+        fake.reset_counts()
+    if trace_memory:
+        tracemalloc.start()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    except Exception as e:
+        raise click.ClickException(f"Benchmark '{name}' failed: {e}") from e
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    errors = [line for line in output.getvalue().splitlines() if "Error" in line]
+    if errors:
+        raise click.ClickException(f"Benchmark '{name}' failed: {errors[0]}")
+    result = {
+        "name": name,
+        "wall_seconds": round(elapsed, 6),
+        "peak_memory_bytes": peak,
+    }
+    if fake:
+        result["requests"] = dict(sorted(fake.requests.items()))
+        result["total_requests"] = fake.total_requests
+    return result
+
+
+def run_command(command, args):
+    """Invoke a click command in-process, as the CLI would."""
+    command.main(args, standalone_mode=False)
+
+
+def parser_benchmarks(lines, workdir, trace_memory):
+    features = parse_lines(lines)
+    document = parse_document(lines)
+    json_path = os.path.join(workdir, "output.json")
+    return [
+        measure("parse_lines", lambda: parse_lines(lines), trace_memory=trace_memory),
+        measure(
+            "validate_frs", lambda: validate_frs(document), trace_memory=trace_memory
+        ),
+        measure(
+            "export_to_json",
+            lambda: export_to_json(features, json_path),
+            trace_memory=trace_memory,
+        ),
+        measure(
+            "export_to_json (compact)",
+            lambda: export_to_json(features, json_path, compact=True),
+            trace_memory=trace_memory,
+        ),
+        measure(
+            "export_to_jsonl",
+            lambda: export_to_jsonl(features, os.path.join(workdir, "output.jsonl")),
+            trace_memory=trace_memory,
+        ),
+    ]
+
+
+def report_benchmarks(fake, workdir, trace_memory):
+    # Imported here so parser-only runs don't pay for the command modules.
+    from commands.generate_report import generate_report
+
+    results = []
+    for output_format in ("md", "md-table", "csv"):
+        results.append(
+            measure(
+                f"generate_report ({output_format})",
+                lambda: run_command(
+                    generate_report,
+                    ["--space-name", SPACE_NAME, "--output-format", output_format],
+                ),
+                fake,
+                trace_memory,
+            )
+        )
+
+    # The markdown exporters take hydrated models; build them once, untimed.
+    system_features = [
+        SystemFeature(id=obj["id"], space_id=SPACE_ID)
+        for obj in fake.objects.values()
+        if obj["type"]["name"] == "System Feature"
+    ]
+    for name, exporter, extension in (
+        ("export_to_markdown", export_to_markdown, "md"),
+        ("export_to_markdown_table", export_to_markdown_table, "md"),
+        ("export_to_csv", export_to_csv, "csv"),
+    ):
+        path = os.path.join(workdir, f"{name}.{extension}")
+        results.append(
+            measure(
+                name,
+                lambda: exporter(system_features, path),
+                trace_memory=trace_memory,
+            )
+        )
+    return results
+
+
+def startup_benchmarks():
+    """Time ``main.py`` help screens in a fresh interpreter, imports included."""
+    return [
+        measure(
+            f"startup (main.py {' '.join(args)})",
+            lambda: subprocess.run(
+                [sys.executable, os.path.join(REPO_ROOT, "main.py"), *args],
+                cwd=REPO_ROOT,
+                capture_output=True,
+                check=True,
+            ),
+            trace_memory=False,
+        )
+        for args in (["--help"], ["validate", "--help"])
+    ]
+
+
+def create_benchmark(lines, workdir, max_workers, trace_memory):
+    from commands.objects import create_objects_command
+
+    requirements_path = os.path.join(workdir, "requirements.md")
+    with open(requirements_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    with FakeAnytype() as fake, use_client(fake.client()):
+        return measure(
+            "create_objects_command",
+            lambda: run_command(
+                create_objects_command,
+                [
+                    "--space-name",
+                    SPACE_NAME,
+                    "--file-path",
+                    requirements_path,
+                    "--max-workers",
+                    str(max_workers),
+                ],
+            ),
+            fake,
+            trace_memory,
+        )
+
+
+@click.command()
+@click.option("--features", default=100, show_default=True, help="Number of SFs.")
+@click.option("--frs-per-feature", default=10, show_default=True, help="FRs per SF.")
+@click.option("--apis-per-fr", default=1, show_default=True, help="APIs per FR.")
+@click.option(
+    "--max-workers",
+    default=8,
+    show_default=True,
+    help="Concurrent writes for create_objects_command.",
+)
+@click.option(
+    "--only",
+    type=click.Choice(["startup", "parser", "report", "create"]),
+    multiple=True,
+    help="Run only these groups; repeatable. Runs everything by default.",
+)
+@click.option(
+    "--memory/--no-memory", default=True, help="Trace peak memory with tracemalloc."
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="Write the JSON results here instead of standard output.",
+)
+def main(features, frs_per_feature, apis_per_fr, max_workers, only, memory, output):
+    """Time the hot paths against synthetic documents and a local stand-in API."""
+    os.environ.setdefault("ANYTYPE_API_KEY", "benchmark")
+    groups = set(only) or {"startup", "parser", "report", "create"}
+    lines = requirements_lines(features, frs_per_feature)
+    results = []
+
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # Commands write reports and journals relative to the working directory.
+        os.chdir(workdir)
+        try:
+            if "startup" in groups:
+                results.extend(startup_benchmarks())
+            if "parser" in groups:
+                results.extend(parser_benchmarks(lines, workdir, memory))
+            if "report" in groups:
+                objects = space_objects(features, frs_per_feature, apis_per_fr)
+                with FakeAnytype(objects) as fake, use_client(fake.client()):
+                    results.extend(report_benchmarks(fake, workdir, memory))
+            if "create" in groups:
+                results.append(create_benchmark(lines, workdir, max_workers, memory))
+        finally:
+            os.chdir(previous_cwd)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "features": features,
+            "frs_per_feature": frs_per_feature,
+            "apis_per_fr": apis_per_fr,
+            "document_lines": len(lines),
+            "traced_memory": memory,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(text + "\n")
+        click.echo(f"Wrote {len(results)} results to {output}", err=True)
+    else:
+        click.echo(text)
+
+
+if __name__ == "__main__":
+    main()
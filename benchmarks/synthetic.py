@@ -0,0 +1,129 @@
+"""Generators for synthetic requirement documents and spaces used by the benchmarks."""
+
+from anytype_api.keys import (
+    API_FUNCTIONAL_REQUIREMENTS_KEY,
+    API_TYPE_ID,
+    CUSTOM_ID_KEY,
+    FR_SYSTEM_FEATURE_KEY,
+    FR_TYPE_KEY,
+    SF_TYPE_ID,
+    SF_TYPE_KEY,
+)
+
+
+def requirements_lines(features: int, frs_per_feature: int = 10) -> list[str]:
+    """Build a requirements.md-shaped document as stripped lines."""
+    lines = [
+        "# Software Requirements Specification",
+        "",
+        "## 1.0 Introduction",
+        "",
+        "### 1.1 Purpose",
+        "This document describes the synthetic system used for benchmarking.",
+        "",
+        "## 2.0 System Features",
+        "",
+    ]
+    for sf in range(1, features + 1):
+        lines.append(f"### 2.{sf} **Synthetic Feature {sf}**")
+        lines.append("")
+        lines.append(f"**Description:** Feature {sf} lets users manage synthetic records.")
+        lines.append("")
+        lines.append("**Stimulus/Response Sequences:**")
+        lines.append("- User opens the feature; the system shows the records.")
+        lines.append("")
+        lines.append("**Functional Requirements:**")
+        for fr in range(1, frs_per_feature + 1):
+            lines.append(
+                f"- FR-{sf}.{fr}: The system shall handle case {fr} of feature {sf}."
+            )
+        lines.append("")
+    lines.append("## 3.0 Non-Functional Requirements")
+    lines.append("")
+    lines.append("- NFR-1: Pages load within two seconds.")
+    return lines
+
+
+def requirements_markdown(features: int, frs_per_feature: int = 10) -> str:
+    return "\n".join(requirements_lines(features, frs_per_feature)) + "\n"
+
+
+SF_TYPE = {"id": SF_TYPE_ID, "key": SF_TYPE_KEY, "name": "System Feature"}
+FR_TYPE = {
+    "id": "synthetic-fr-type",
+    "key": FR_TYPE_KEY,
+    "name": "Functional Requirement",
+}
+API_TYPE = {"id": API_TYPE_ID, "key": "api", "name": "API"}
+SPACE_TYPES = [SF_TYPE, FR_TYPE, API_TYPE]
+
+
+def _select(name: str, value: str) -> dict:
+    key = name.lower().replace(" ", "_")
+    return {"key": key, "name": name, "select": {"name": value}}
+
+
+def space_objects(
+    features: int, frs_per_feature: int = 10, apis_per_fr: int = 1
+) -> list[dict]:
+    """Build the SF, FR and API objects of a space as the API returns them.
+
+    SFs backlink their FRs and every API links one FR, matching what
+    ``generate_report`` and ``parser/models.py`` read.
+    """
+    objects = []
+    for sf in range(1, features + 1):
+        sf_id = f"sf-{sf}"
+        fr_ids = []
+        for fr in range(1, frs_per_feature + 1):
+            fr_id = f"fr-{sf}-{fr}"
+            fr_ids.append(fr_id)
+            objects.append(
+                {
+                    "id": fr_id,
+                    "name": f"FR-{sf}.{fr}",
+                    "type": FR_TYPE,
+                    "properties": [
+                        {
+                            "key": "description",
+                            "text": f"The system shall handle case {fr} of feature {sf}.",
+                        },
+                        _select("Status", "Done" if fr % 3 == 0 else "To Do"),
+                        {"key": FR_SYSTEM_FEATURE_KEY, "objects": [sf_id]},
+                    ],
+                }
+            )
+            for api in range(1, apis_per_fr + 1):
+                objects.append(
+                    {
+                        "id": f"api-{sf}-{fr}-{api}",
+                        "name": f"/features/{sf}/cases/{fr}/{api}",
+                        "type": API_TYPE,
+                        "properties": [
+                            _select("Status", "Done" if api % 2 else "To Do"),
+                            _select("API Type", "GET" if api % 2 else "POST"),
+                            {
+                                "key": "postman_url",
+                                "name": "Postman URL",
+                                "url": f"https://postman.example/{sf}/{fr}/{api}",
+                            },
+                            {"key": API_FUNCTIONAL_REQUIREMENTS_KEY, "objects": [fr_id]},
+                        ],
+                    }
+                )
+        objects.append(
+            {
+                "id": sf_id,
+                "name": f"Synthetic Feature {sf}",
+                "type": SF_TYPE,
+                "properties": [
+                    {
+                        "key": "description",
+                        "text": f"Feature {sf} lets users manage synthetic records.",
+                    },
+                    {"key": CUSTOM_ID_KEY, "text": f"SR-{sf}"},
+                    {"key": "backlinks", "objects": fr_ids},
+                ],
+            }
+        )
+    return objects
@@ -0,0 +1,19 @@
+"""State shared by the steps of one CLI invocation."""
+
+import click
+
+PARSED_DOCUMENTS = "everywhere.parsed_documents"
+
+
+def parsed_documents() -> dict | None:
+    """Parse results already produced during the current invocation.
+
+    Composite commands such as ``create`` and ``import-requirements`` run
+    several steps under one click context; passing this memo to
+    ``parse_files``/``load_features`` makes every step reuse the first
+    parse of a file. Outside a click invocation there is nothing to share.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    return ctx.meta.setdefault(PARSED_DOCUMENTS, {})
@@ -0,0 +1,70 @@
+import click
+
+from anytype_api import get_client, tracing
+from anytype_api.graph import API, FR, SF, RelationGraph
+
+SECTIONS = ("matrix", "frs-without-api", "frs-without-sf", "done-sfs", "orphan-apis")
+
+
+def _print_names(title, graph, kind, nodes):
+    click.echo(f"\n--- {title} ({len(nodes)}) ---")
+    for name in sorted(graph.names[kind][node] for node in nodes):
+        click.echo(f"- {name}")
+
+
+@click.command()
+@click.option(
+    "--space-name", default="Everywhere", help="The name of the Anytype space."
+)
+@click.option(
+    "--show",
+    type=click.Choice(SECTIONS),
+    multiple=True,
+    help="Sections to print; repeatable. Prints every section by default.",
+)
+def coverage(space_name, show):
+    """Report traceability coverage between SFs, FRs and APIs."""
+    try:
+        anytype_client = get_client()
+        spaces = anytype_client.get_spaces()
+        space = next((s for s in spaces["data"] if s["name"] == space_name), None)
+        if not space:
+            click.echo(f"Error: Space '{space_name}' not found.")
+            return
+
+        with tracing.span("load graph"):
+            graph = RelationGraph.load(anytype_client, space["id"])
+        click.echo(
+            f"Loaded {len(graph.ids[SF])} SFs, {len(graph.ids[FR])} FRs "
+            f"and {len(graph.ids[API])} APIs from '{space_name}'."
+        )
+
+        sections = show or SECTIONS
+        if "matrix" in sections:
+            click.echo("\n--- Coverage by System Feature ---")
+            click.echo(f"{'System Feature':<40} {'FRs':>5} {'Done':>5} {'API':>5}")
+            rows = graph.coverage_matrix()
+            for sf, frs, done, with_api in sorted(
+                rows, key=lambda row: graph.names[SF][row[0]]
+            ):
+                click.echo(
+                    f"{graph.names[SF][sf][:40]:<40} {frs:>5} {done:>5} {with_api:>5}"
+                )
+        if "frs-without-api" in sections:
+            _print_names("FRs without an API", graph, FR, graph.frs_without_api())
+        if "frs-without-sf" in sections:
+            _print_names(
+                "FRs without a System Feature", graph, FR, graph.frs_without_sf()
+            )
+        if "done-sfs" in sections:
+            _print_names(
+                "System Features with every FR Done",
+                graph,
+                SF,
+                graph.done_system_features(),
+            )
+        if "orphan-apis" in sections:
+            _print_names("APIs not linked to an FR", graph, API, graph.orphan_apis())
+
+    except Exception as e:
+        click.echo(f"Error: {e}")
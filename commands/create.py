@@ -1,11 +1,8 @@
 import click
-from dotenv import load_dotenv
 
 from .validate import validate_requirements_command
 from .objects import create_objects_command
 
-load_dotenv()
-
 
 @click.command()
 @click.option("--space-name", required=True, help="The name of the Anytype space.")
@@ -20,10 +17,15 @@ load_dotenv()
 @click.option(
     "--file-path",
     default="requirements.md",
-    help="The path to the requirements markdown file.",
+    help="The requirements markdown file, a glob such as 'specs/*.md', or a directory.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted run, skipping objects its journal records as created.",
 )
 @click.pass_context
-def create(ctx, space_name, sf_type_key, fr_type_key, file_path):
+def create(ctx, space_name, sf_type_key, fr_type_key, file_path, resume):
     """Parse a requirements file and create objects in Anytype."""
     ctx.invoke(validate_requirements_command, file_path=file_path)
     ctx.invoke(
@@ -32,4 +34,5 @@ def create(ctx, space_name, sf_type_key, fr_type_key, file_path):
         sf_type_key=sf_type_key,
         fr_type_key=fr_type_key,
         file_path=file_path,
+        resume=resume,
     )
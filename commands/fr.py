@@ -1,11 +1,44 @@
 import datetime
 
 import click
-from dotenv import load_dotenv
 
-from anytype_api import AnytypeClient
+from anytype_api import get_client
+from anytype_api.keys import FR_TYPE_KEY
+from commands.list import LISTING_FIELDS, print_local_results
+from commands.records import RecordWriter, fail, record_format_options
+from commands.snapshot import from_snapshot_option
 
-load_dotenv()
+
+def build_fr_payload(
+    fr_name, fr_description, system_feature_object_id=None, links=None, template_id=None
+):
+    """Build the create payload for a Functional Requirement object."""
+    properties = [
+        {"key": "6829bde80dd8772c7c96a582", "text": fr_name},
+        {"key": "description", "text": fr_description},
+        {
+            "key": "created_date",
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+    ]
+    if system_feature_object_id:
+        properties.append(
+            {
+                "key": "6829c5d10dd8772c7c96a599",
+                "objects": [system_feature_object_id],
+            }
+        )
+    if links:
+        properties.append({"key": "links", "objects": links})
+
+    fr_payload = {
+        "type_key": "6829be190dd8772c7c96a583",
+        "name": fr_name,
+        "properties": properties,
+    }
+    if template_id:
+        fr_payload["template_id"] = template_id
+    return fr_payload
 
 
 @click.command()
@@ -59,7 +92,7 @@ def create_fr(
 ):
     """Create a single Functional Requirement object in Anytype."""
     try:
-        anytype_client = AnytypeClient()
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
@@ -67,15 +100,6 @@ def create_fr(
             return
         space_id = space["id"]
 
-        properties = [
-            {"key": "6829bde80dd8772c7c96a582", "text": fr_name},
-            {"key": "description", "text": fr_description},
-            {
-                "key": "created_date",
-                "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            },
-        ]
-
         system_feature_object_id = None
         if system_feature_id and system_feature_name:
             click.echo(
@@ -108,17 +132,6 @@ def create_fr(
                     click.echo("No System Features found in this space.")
                 return
 
-        if system_feature_object_id:
-            properties.append(
-                {
-                    "key": "6829c5d10dd8772c7c96a599",
-                    "objects": [system_feature_object_id],
-                }
-            )
-
-        if links:
-            properties.append({"key": "links", "objects": links.split(",")})
-
         # Check if an FR with the same ID already exists
         existing_frs = anytype_client.search_objects(space_id, fr_name, ["6829be190dd8772c7c96a583"])
         if existing_frs and existing_frs["data"]:
@@ -129,14 +142,13 @@ def create_fr(
                     )
                     return
 
-        fr_payload = {
-            "type_key": "6829be190dd8772c7c96a583",
-            "name": fr_name,
-            "properties": properties,
-        }
-        if template_id:
-            fr_payload["template_id"] = template_id
-
+        fr_payload = build_fr_payload(
+            fr_name,
+            fr_description,
+            system_feature_object_id,
+            links.split(",") if links else None,
+            template_id,
+        )
         created_fr = anytype_client.create_object(space_id, fr_payload)
         click.echo(f"✅ Created FunctionalRequirement: {created_fr['object']['id']}")
 
@@ -151,18 +163,40 @@ def create_fr(
     required=True,
     help="The name of the Anytype space.",
 )
-def list_frs(space_name):
+@click.option("--query", default="", help="The search query.")
+@click.option(
+    "--local",
+    is_flag=True,
+    help="Search the local index built by 'index' instead of the server.",
+)
+@record_format_options(LISTING_FIELDS)
+@from_snapshot_option
+def list_frs(space_name, query, local, output_format, fields):
     """List all Functional Requirements in a given space."""
     try:
-        anytype_client = AnytypeClient()
+        if local:
+            print_local_results(
+                space_name, query, {FR_TYPE_KEY}, output_format, fields
+            )
+            return
+
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
-            click.echo(f"Error: Space '{space_name}' not found.")
+            fail(f"Error: Space '{space_name}' not found.", output_format)
             return
         space_id = space["id"]
 
-        results = anytype_client.search_objects(space_id, "", ["6829be190dd8772c7c96a583"])
+        if output_format != "text":
+            writer = RecordWriter(output_format, fields)
+            for page in anytype_client.iter_search_pages(
+                space_id, query, [FR_TYPE_KEY]
+            ):
+                writer.write_page(page)
+            return
+
+        results = anytype_client.search_objects(space_id, query, [FR_TYPE_KEY])
         click.echo(f"\n--- Functional Requirements in '{space_name}' ---")
         if results and results["data"]:
             for obj in results["data"]:
@@ -182,5 +216,7 @@ def list_frs(space_name):
             else:
                 click.echo("No object types found in this space.")
 
+    except click.exceptions.Exit:
+        raise
     except Exception as e:
-        click.echo(f"Error: {e}")
+        fail(f"Error: {e}", output_format)
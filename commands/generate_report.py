@@ -1,15 +1,38 @@
-from parser.models import API, SystemFeature
+from parser.models import API, SystemFeature, is_fr_name
 from parser.exporter import export_to_markdown_table, export_to_csv
 
 import click
-import markdown
-from dotenv import load_dotenv
-from weasyprint import HTML
 import os
 
-from anytype_api.client import AnytypeClient
+from anytype_api import tracing
+from anytype_api.keys import (
+    API_FUNCTIONAL_REQUIREMENTS_KEY,
+    API_TYPE_ID,
+    CUSTOM_ID_KEY,
+    FR_TYPE_KEY,
+    SF_TYPE_ID,
+)
+from anytype_api.session import get_client
+from anytype_api.space_index import get_property
+from commands.snapshot import from_snapshot_option
+
+
+def _split(values, normalize):
+    """Parse a comma-separated option into a set, or None when unset."""
+    if not values:
+        return None
+    return {normalize(value.strip()) for value in values.split(",") if value.strip()}
+
+
+def _select_name(obj, property_name):
+    for prop in obj.get("properties", []):
+        if prop.get("name") == property_name:
+            return (prop.get("select") or {}).get("name", "")
+    return ""
+
 
-load_dotenv()
+def _linked_frs(api_obj):
+    return get_property(api_obj, API_FUNCTIONAL_REQUIREMENTS_KEY).get("objects") or []
 
 
 @click.command()
@@ -29,14 +52,32 @@ load_dotenv()
     default="md",
     help="The output format for the report.",
 )
-def generate_report(space_name, output_file, output_format):
+@click.option("--sf-ids", help="Only report these System Features, e.g. 'SR-3,SR-7'.")
+@click.option("--fr-status", help="Only report FRs with these statuses, e.g. 'To Do'.")
+@click.option(
+    "--api-type",
+    help="Only report APIs of these types, and the FRs linked to them, e.g. 'GET'.",
+)
+@click.option(
+    "--name-prefix", help="Only report System Features whose name starts with this."
+)
+@from_snapshot_option
+def generate_report(
+    space_name,
+    output_file,
+    output_format,
+    sf_ids=None,
+    fr_status=None,
+    api_type=None,
+    name_prefix=None,
+):
     """Generates a Markdown report of System Features and Functional Requirements from Anytype."""
     try:
         # Create reports directory if it doesn't exist
         reports_dir = "reports"
         os.makedirs(reports_dir, exist_ok=True)
 
-        anytype_client = AnytypeClient()
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
@@ -44,33 +85,89 @@ def generate_report(space_name, output_file, output_format):
             return
         space_id = space["id"]
 
-        # Fetch System Features
-        sf_type_key = "bafyreiczbkx2ungqnhdf6c7haiq3efjvpb3cqm5tyfnpei3nopbexf7o2e"  # Hardcoded SF type key
-        system_features_results = anytype_client.search_objects(
-            space_id, "", [sf_type_key]
-        )
+        # Filters are applied to search results before anything is hydrated,
+        # so objects outside the requested slice are never fetched.
+        sf_id_filter = _split(sf_ids, str.upper)
+        fr_status_filter = _split(fr_status, str.lower)
+        api_type_filter = _split(api_type, str.lower)
+
+        api_objects = []
+        with tracing.span("search APIs"):
+            for page in anytype_client.iter_search_pages(space_id, "", [API_TYPE_ID]):
+                api_objects.extend(page)
+        if api_type_filter:
+            api_objects = [
+                obj
+                for obj in api_objects
+                if _select_name(obj, "API Type").lower() in api_type_filter
+            ]
+
+        # Without FR-level filters every backlinked FR is shown (None); with
+        # them, one FR search decides which FRs are worth hydrating.
+        allowed_fr_ids = None
+        if fr_status_filter or api_type_filter:
+            with tracing.span("search functional requirements"):
+                allowed_fr_ids = set()
+                for page in anytype_client.iter_search_pages(
+                    space_id, "", [FR_TYPE_KEY]
+                ):
+                    for obj in page:
+                        status = (
+                            get_property(obj, "status").get("select") or {}
+                        ).get("name", "")
+                        if is_fr_name(obj.get("name", "")) and (
+                            not fr_status_filter or status.lower() in fr_status_filter
+                        ):
+                            allowed_fr_ids.add(obj["id"])
+            if api_type_filter:
+                allowed_fr_ids &= {
+                    fr_id for obj in api_objects for fr_id in _linked_frs(obj)
+                }
+
+        with tracing.span("search system features"):
+            sf_objects = []
+            for page in anytype_client.iter_search_pages(
+                space_id, name_prefix or "", [SF_TYPE_ID]
+            ):
+                sf_objects.extend(page)
         system_feature_ids = [
-            obj["id"] for obj in system_features_results.get("data", [])
+            obj["id"]
+            for obj in sf_objects
+            if obj.get("name", "").startswith(name_prefix or "")
+            and (
+                not sf_id_filter
+                or get_property(obj, CUSTOM_ID_KEY).get("text", "").upper()
+                in sf_id_filter
+            )
         ]
 
-        system_features = [
-            SystemFeature(id=sf_id, space_id=space_id) for sf_id in system_feature_ids
-        ]
+        with tracing.span("hydrate system features", count=len(system_feature_ids)):
+            system_features = [
+                SystemFeature(id=sf_id, space_id=space_id, fr_ids=allowed_fr_ids)
+                for sf_id in system_feature_ids
+            ]
+        if allowed_fr_ids is not None:
+            system_features = [
+                sf for sf in system_features if sf.functional_requirements
+            ]
 
-        # Fetch API objects and create a mapping for easy lookup
-        api_type_id = "bafyreicpin6mrj5btg3tqy6ve5twfjqittegdmojpai6d6vmhbuqmkmytq"  # Hardcoded API type ID
-        api_results = anytype_client.search_objects(space_id, "", [api_type_id])
+        # Only APIs linked to a reported FR are fetched.
+        reported_fr_ids = {
+            fr.id for sf in system_features for fr in sf.functional_requirements
+        }
         apis_by_fr_id = {}
-        for api_obj_data in api_results.get("data", []):
-            api_obj = API(id=api_obj_data["id"], space_id=space_id)
-            for prop in api_obj_data.get("properties", []):
-                if prop.get("key") == "6829e4c40dd8772c7c96a5ac" and prop.get(
-                    "objects"
-                ):
-                    for fr_id in prop.get("objects"):
-                        if fr_id not in apis_by_fr_id:
-                            apis_by_fr_id[fr_id] = []
-                        apis_by_fr_id[fr_id].append(api_obj)
+        with tracing.span("build APIs"):
+            for api_obj_data in api_objects:
+                linked_fr_ids = [
+                    fr_id
+                    for fr_id in _linked_frs(api_obj_data)
+                    if fr_id in reported_fr_ids
+                ]
+                if not linked_fr_ids:
+                    continue
+                api_obj = API(id=api_obj_data["id"], space_id=space_id)
+                for fr_id in linked_fr_ids:
+                    apis_by_fr_id.setdefault(fr_id, []).append(api_obj)
 
         # Sort System Features by their custom 'Id' property numerically
         def get_sf_sort_key(sf_obj):
@@ -89,68 +186,71 @@ def generate_report(space_name, output_file, output_format):
 
         if output_format == "md-table":
             final_output_file = os.path.join(reports_dir, f"{output_file}.md")
-            export_to_markdown_table(system_features, final_output_file)
+            with tracing.span("export markdown table"):
+                export_to_markdown_table(system_features, final_output_file)
             click.echo(f"✅ Report generated successfully: {final_output_file}")
             return
         if output_format == "csv":
             final_output_file = os.path.join(reports_dir, f"{output_file}.csv")
-            export_to_csv(system_features, final_output_file)
+            with tracing.span("export csv"):
+                export_to_csv(system_features, final_output_file)
             click.echo(f"✅ Report generated successfully: {final_output_file}")
             return
 
-        report_content = []
-        total_sfs = len(system_features)
-        total_frs = sum(len(sf.functional_requirements) for sf in system_features)
+        with tracing.span("render markdown"):
+            report_content = []
+            total_sfs = len(system_features)
+            total_frs = sum(len(sf.functional_requirements) for sf in system_features)
 
-        report_content.append("# Requirements Report\n")
-        report_content.append(f"## Summary\n")
-        report_content.append(f"- Total System Features: {total_sfs}\n")
-        report_content.append(f"- Total Functional Requirements: {total_frs}\n\n")
+            report_content.append("# Requirements Report\n")
+            report_content.append(f"## Summary\n")
+            report_content.append(f"- Total System Features: {total_sfs}\n")
+            report_content.append(f"- Total Functional Requirements: {total_frs}\n\n")
 
-        # System Features and Functional Requirements Section
-        report_content.append("## System Features and Functional Requirements\n")
-        for sf in system_features:
-            sf.functional_requirements.sort(key=lambda fr: fr.sort_key)
-            report_content.append(f"### {sf.custom_id} {sf.name}\n")
-            if sf.description:
-                report_content.append(f"> {sf.description}\n")
-            report_content.append(f"\n")
-
-            # List associated Functional Requirements
-            if sf.functional_requirements:
-                report_content.append(f"#### Functional Requirements\n")
-                for fr in sf.functional_requirements:
-                    fr_name = fr.name
-                    if fr.status == "Done":
-                        fr_name += " (Done)"
-                    report_content.append(f"- **{fr_name}**: {fr.description}\n")
-
-                    # Append linked APIs
-                    if fr.apis:
-                        report_content.append(f"  - **Linked APIs:**\n")
-                        for api in fr.apis:
-                            name_with_status = api.name
-                            if api.status == "Done":
-                                name_with_status += " (Done)"
-
-                            if api.postman_url:
-                                display_name = f"{api.api_type or ''} [{name_with_status}]({api.postman_url})"
-                            else:
-                                display_name = (
-                                    f"{api.api_type or ''} {name_with_status}"
-                                )
-
-                            report_content.append(f"    - {display_name.strip()}\n")
-            else:
-                report_content.append(
-                    f"_No Functional Requirements found for {sf.name}_\n"
-                )
-            report_content.append("\n")
+            # System Features and Functional Requirements Section
+            report_content.append("## System Features and Functional Requirements\n")
+            for sf in system_features:
+                sf.functional_requirements.sort(key=lambda fr: fr.sort_key)
+                report_content.append(f"### {sf.custom_id} {sf.name}\n")
+                if sf.description:
+                    report_content.append(f"> {sf.description}\n")
+                report_content.append(f"\n")
+
+                # List associated Functional Requirements
+                if sf.functional_requirements:
+                    report_content.append(f"#### Functional Requirements\n")
+                    for fr in sf.functional_requirements:
+                        fr_name = fr.name
+                        if fr.status == "Done":
+                            fr_name += " (Done)"
+                        report_content.append(f"- **{fr_name}**: {fr.description}\n")
+
+                        # Append linked APIs
+                        if fr.apis:
+                            report_content.append(f"  - **Linked APIs:**\n")
+                            for api in fr.apis:
+                                name_with_status = api.name
+                                if api.status == "Done":
+                                    name_with_status += " (Done)"
+
+                                if api.postman_url:
+                                    display_name = f"{api.api_type or ''} [{name_with_status}]({api.postman_url})"
+                                else:
+                                    display_name = (
+                                        f"{api.api_type or ''} {name_with_status}"
+                                    )
+
+                                report_content.append(f"    - {display_name.strip()}\n")
+                else:
+                    report_content.append(
+                        f"_No Functional Requirements found for {sf.name}_\n"
+                    )
+                report_content.append("\n")
 
         # Write to file
         if output_format == "md":
             final_output_file = os.path.join(reports_dir, f"{output_file}.md")
-            with open(final_output_file, "w") as f:
+            with tracing.span("write markdown"), open(final_output_file, "w") as f:
                 f.writelines(report_content)
             click.echo(f"✅ Report generated successfully: {final_output_file}")
         elif output_format == "pdf":
@@ -160,8 +260,15 @@ def generate_report(space_name, output_file, output_format):
             click.echo(f"Converting Markdown to PDF: {final_output_file}...")
 
             try:
-                html_content = markdown.markdown(md_content)
-                HTML(string=html_content).write_pdf(final_output_file)
+                # Imported here: WeasyPrint pulls in a large native stack that
+                # only PDF output needs.
+                import markdown
+                from weasyprint import HTML
+
+                with tracing.span("markdown to HTML"):
+                    html_content = markdown.markdown(md_content)
+                with tracing.span("weasyprint"):
+                    HTML(string=html_content).write_pdf(final_output_file)
                 click.echo(f"✅ Report generated successfully: {final_output_file}")
             except Exception as e:
                 click.echo(f"Error during PDF conversion: {e}")
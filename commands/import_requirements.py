@@ -1,41 +1,54 @@
-from parser.parser import parse_lines
-from parser.reader import read_markdown
+from parser.batch import load_batch
+
+import os
 
 import click
-from dotenv import load_dotenv
 
-from commands.fr import create_fr
+from anytype_api import get_client, tracing
+from anytype_api.bulk import object_id
+from anytype_api.journal import Journal
+from anytype_api.keys import FR_TEMPLATE_ID, FR_TYPE_KEY, SF_TYPE_ID
+from anytype_api.space_index import SpaceIndex
+from commands.context import parsed_documents
+from commands.fr import build_fr_payload
 from commands.validate import validate_requirements_command
 
-load_dotenv()
-
 
 @click.command()
 @click.option(
     "--requirements-file",
     default="requirements.md",
-    help="Path to the requirements Markdown file.",
+    help="Path to the requirements Markdown file, a glob, or a directory.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted import, skipping FRs its journal records as created.",
 )
-def import_requirements(requirements_file):
+def import_requirements(requirements_file, resume):
     """Reads and imports Functional Requirements from a Markdown file."""
+    journal = None
     try:
         click.echo(f"Reading requirements from {requirements_file}...")
-        lines = read_markdown(requirements_file)
+        with tracing.span("parse"):
+            batch = load_batch(requirements_file, memo=parsed_documents())
 
         click.echo("Validating requirements file...")
         validate_requirements_command.callback(file_path=requirements_file)
 
         click.echo("Parsing Functional Requirements...")
-        system_features_data = parse_lines(lines)
-
         system_features = {}
-        for sf_obj in system_features_data:
+        for source, sf_obj in batch.iter_features():
             # Use sf_obj.description as the key for the system_features dictionary
             # The description from parse_lines already has the 'SR-X' removed and cleaned.
             system_features[sf_obj.description] = []
             for fr_obj in sf_obj.functional_requirements:
                 system_features[sf_obj.description].append(
-                    {"name": fr_obj.id, "description": fr_obj.description}
+                    {
+                        "name": fr_obj.id,
+                        "description": fr_obj.description,
+                        "source": source,
+                    }
                 )
 
         if not system_features:
@@ -50,6 +63,22 @@ def import_requirements(requirements_file):
             for fr in frs:
                 click.echo(f"  - {fr['name']}: {fr['description']}")
 
+        journal = Journal.open(
+            "import-requirements",
+            "Everywhere",
+            os.path.abspath(requirements_file),
+            resume=resume,
+        )
+        if resume and journal.completed:
+            click.echo(f"Resuming: {len(journal.completed)} FRs already created.")
+        # A create the last run sent without confirming may have succeeded;
+        # the existing-name check below keeps it from being created twice.
+        for step in journal.unconfirmed:
+            click.echo(f"Unconfirmed create from the last run: {step}")
+
+        anytype_client = None
+        index = None
+
         click.echo("\nStarting import process. You will be prompted for each FR.")
 
         for sf_name, frs in system_features.items():
@@ -57,24 +86,90 @@ def import_requirements(requirements_file):
                 f"\nProcessing Functional Requirements for System Feature: {sf_name}"
             )
             for fr in frs:
+                # Scoped to the source file: FR ids can repeat across files.
+                step = f"fr:{fr['source']}:{fr['name']}"
+                if journal.is_done(step):
+                    click.echo(
+                        f"Skipping FR '{fr['name']}': already created ({journal.completed[step]})."
+                    )
+                    continue
+
                 prompt = f"Create FR '{fr['name']}' (Description: '{fr['description']}') under System Feature '{sf_name}'?"
                 if not click.confirm(prompt, default=True):
                     click.echo("Import process cancelled by user.")
                     return
 
+                if index is None:
+                    anytype_client = get_client()
+                    spaces = anytype_client.get_spaces()
+                    space = next(
+                        (s for s in spaces["data"] if s["name"] == "Everywhere"), None
+                    )
+                    if not space:
+                        click.echo("Error: Space 'Everywhere' not found.")
+                        return
+                    space_id = space["id"]
+
+                    # One bulk pull of the space's SFs and FRs replaces the
+                    # per-FR SF search and duplicate check; the index is
+                    # updated as FRs are created.
+                    click.echo(
+                        "Loading existing System Features and Functional Requirements..."
+                    )
+                    with tracing.span("load space index"):
+                        index = SpaceIndex.load(
+                            anytype_client, space_id, SF_TYPE_ID, FR_TYPE_KEY
+                        )
+
+                system_feature_object_id = index.system_feature_id(sf_name)
+                if not system_feature_object_id:
+                    # No name matches even after normalising: fall back to
+                    # the full-text search that used to resolve every SF.
+                    with tracing.span("search system feature"):
+                        matches = anytype_client.search_objects(
+                            space_id, sf_name, [SF_TYPE_ID]
+                        )
+                    if matches and matches["data"]:
+                        system_feature_object_id = matches["data"][0]["id"]
+                        # Remembered under the heading so its other FRs
+                        # resolve without another search.
+                        index.add_system_feature(
+                            {**matches["data"][0], "name": sf_name}
+                        )
+                if not system_feature_object_id:
+                    click.echo(
+                        f"Error: System Feature with name '{sf_name}' not found."
+                    )
+                    if index.system_features:
+                        click.echo("\nAvailable System Features:")
+                        for name in sorted(index.system_features):
+                            click.echo(f"- {name}")
+                    else:
+                        click.echo("No System Features found in this space.")
+                    continue
+
+                if index.functional_requirement_id(fr["name"]):
+                    click.echo(
+                        f"Error: Functional Requirement with name '{fr['name']}' already exists."
+                    )
+                    continue
+
                 click.echo(f"Creating FR '{fr['name']}'...")
                 try:
-                    create_fr.callback(
-                        space_name="Everywhere",
-                        fr_name=fr["name"],
-                        fr_description=fr["description"],
-                        fr_status="To Do",  # Default status
-                        system_feature_id=None,  # Not using ID here
-                        system_feature_name=sf_name,
-                        system_feature_type_key="bafyreiczbkx2ungqnhdf6c7haiq3efjvpb3cqm5tyfnpei3nopbexf7o2e",  # Hardcoded SF type key
-                        links=None,
-                        template_id="bafyreidchi3wlbchypmpp3tksocuxzyh6hozuar4vihogm7jg7ps53yzby",  # Default template ID
+                    fr_payload = build_fr_payload(
+                        fr["name"],
+                        fr["description"],
+                        system_feature_object_id,
+                        template_id=FR_TEMPLATE_ID,
+                    )
+                    journal.planned(step, "create")
+                    created_fr = anytype_client.create_object(space_id, fr_payload)
+                    created_id = object_id(created_fr)
+                    journal.done(step, "create", created_id)
+                    index.add_functional_requirement(
+                        {"id": created_id, "name": fr["name"]}
                     )
+                    click.echo(f"✅ Created FunctionalRequirement: {created_id}")
                 except Exception as e:
                     click.echo(f"Error creating FR '{fr['name']}': {e}")
                     import traceback
@@ -93,3 +188,6 @@ def import_requirements(requirements_file):
         import traceback
 
         click.echo(traceback.format_exc())
+    finally:
+        if journal:
+            journal.close()
@@ -0,0 +1,35 @@
+import click
+
+from anytype_api import get_client
+from anytype_api.search_index import SearchIndex
+
+
+@click.command()
+@click.option(
+    "--space-name", default="Everywhere", help="The name of the Anytype space."
+)
+@click.option(
+    "--rebuild", is_flag=True, help="Discard the existing index and pull everything."
+)
+def index(space_name, rebuild):
+    """Build or refresh the local search index of a space."""
+    try:
+        anytype_client = get_client()
+        spaces = anytype_client.get_spaces()
+        space = next((s for s in spaces["data"] if s["name"] == space_name), None)
+        if not space:
+            click.echo(f"Error: Space '{space_name}' not found.")
+            return
+
+        search_index = None if rebuild else SearchIndex.load(space_name)
+        if search_index is None:
+            search_index = SearchIndex(space_name)
+        changed, removed = search_index.refresh(anytype_client, space["id"])
+        search_index.save()
+        click.echo(
+            f"✅ Indexed {len(search_index.documents)} objects in '{space_name}' "
+            f"({changed} updated, {removed} removed)."
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}")
@@ -2,12 +2,48 @@ import json
 import sys
 
 import click
-import questionary
-from dotenv import load_dotenv
 
-from anytype_api import AnytypeClient
-
-load_dotenv()
+from anytype_api import get_client
+from anytype_api.search_index import SearchIndex
+from commands.records import RecordWriter, fail, record_format_options
+from commands.snapshot import from_snapshot_option
+
+LISTING_FIELDS = ("id", "name", "type", "description")
+
+
+def _as_object(document: dict) -> dict:
+    """Shape an index document like the API object it was made from."""
+    properties = [{"key": "description", "text": document["description"]}]
+    properties.extend(
+        {"key": name, "select": {"name": value}}
+        for name, value in document["selects"].items()
+    )
+    return {**document, "properties": properties}
+
+
+def print_local_results(
+    space_name, query, type_filter=None, output_format="text", fields=""
+):
+    """Print matches for ``query`` from the local search index of a space."""
+    search_index = SearchIndex.load(space_name)
+    if search_index is None:
+        fail(
+            f"Error: No local index for space '{space_name}'. Run 'index' first.",
+            output_format,
+        )
+        return
+    documents = search_index.search(query, type_filter)
+    if output_format != "text":
+        RecordWriter(output_format, fields).write_page(map(_as_object, documents))
+        return
+    click.echo("\n--- Existing Objects ---")
+    if not documents:
+        click.echo("No objects found for the given query.")
+    for document in documents:
+        click.echo(
+            f"- {document['name']} ({document['type']['name']}) - "
+            f"{document['description']}"
+        )
 
 
 @click.command()
@@ -18,23 +54,43 @@ load_dotenv()
 @click.option(
     "--type-keys", help="A comma-separated list of type keys or names to search for."
 )
-def list_objects(space_name, query, type_keys):
+@click.option(
+    "--local",
+    is_flag=True,
+    help="Search the local index built by 'index' instead of the server.",
+)
+@record_format_options(LISTING_FIELDS)
+@from_snapshot_option
+def list_objects(space_name, query, type_keys, local, output_format, fields):
     """List objects in an Anytype space."""
     try:
-        anytype_client = AnytypeClient()
+        if local:
+            type_filter = (
+                {key.strip().lower() for key in type_keys.split(",")}
+                if type_keys
+                else None
+            )
+            print_local_results(
+                space_name, query, type_filter, output_format, fields
+            )
+            return
+
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
-            click.echo(f"Error: Space '{space_name}' not found.")
+            fail(f"Error: Space '{space_name}' not found.", output_format)
             return
         space_id = space["id"]
 
         if not type_keys:
             object_types = anytype_client.get_object_types(space_id)
             if not (object_types and object_types["data"]):
-                click.echo("No object types found in this space.")
+                fail("No object types found in this space.", output_format)
                 return
 
+            import questionary
+
             choices = []
             for obj_type in object_types["data"]:
                 choices.append(
@@ -50,7 +106,7 @@ def list_objects(space_name, query, type_keys):
                 instruction="Use arrow keys to navigate, enter to confirm.",
             ).ask()
             if not type_name_or_id:
-                click.echo("No type selected. Exiting.")
+                fail("No type selected. Exiting.", output_format)
                 return
             type_names_or_ids = [type_name_or_id]
         else:
@@ -79,11 +135,20 @@ def list_objects(space_name, query, type_keys):
                 resolved_type_ids.append(type_map[key_or_name_lower])
             else:
                 click.echo(
-                    f"Warning: Type '{key_or_name}' not found by name or ID. Skipping."
+                    f"Warning: Type '{key_or_name}' not found by name or ID. Skipping.",
+                    err=output_format != "text",
                 )
 
         if not resolved_type_ids:
-            click.echo("Error: No valid type keys or names provided.")
+            fail("Error: No valid type keys or names provided.", output_format)
+            return
+
+        if output_format != "text":
+            writer = RecordWriter(output_format, fields)
+            for page in anytype_client.iter_search_pages(
+                space_id, query, resolved_type_ids
+            ):
+                writer.write_page(page)
             return
 
         results = anytype_client.search_objects(space_id, query, resolved_type_ids)
@@ -99,8 +164,10 @@ def list_objects(space_name, query, type_keys):
         else:
             click.echo("No objects found for the given query and type keys.")
 
+    except click.exceptions.Exit:
+        raise
     except Exception as e:
-        click.echo(f"Error: {e}")
+        fail(f"Error: {e}", output_format)
 
 
 @click.command()
@@ -116,7 +183,7 @@ def list_objects(space_name, query, type_keys):
 def get_object_type_details(space_name, object_type_id):
     """Get details of a specific object type in an Anytype space."""
     try:
-        anytype_client = AnytypeClient()
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
@@ -138,6 +205,8 @@ def get_object_type_details(space_name, object_type_id):
                 )
                 return
 
+            import questionary
+
             choices = []
             for obj_type in object_types["data"]:
                 choices.append(
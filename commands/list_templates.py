@@ -1,11 +1,8 @@
 import click
-import questionary
 import sys
-from dotenv import load_dotenv
 
-from anytype_api import AnytypeClient
-
-load_dotenv()
+from anytype_api import get_client
+from commands.records import RecordWriter, fail, record_format_options
 
 
 @click.command()
@@ -18,31 +15,38 @@ load_dotenv()
     "--object-type-id",
     help="The ID of the object type to get templates for.",
 )
-def list_templates(space_name, object_type_id):
+@record_format_options(("id", "name"))
+def list_templates(space_name, object_type_id, output_format, fields):
     """List templates for a given object type in an Anytype space."""
     try:
-        anytype_client = AnytypeClient()
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
-            click.echo(f"Error: Space '{space_name}' not found.")
+            fail(f"Error: Space '{space_name}' not found.", output_format)
             return
         space_id = space["id"]
 
         if not object_type_id:
             object_types = anytype_client.get_object_types(space_id)
             if not (object_types and object_types["data"]):
-                click.echo("No object types found in this space.")
+                fail("No object types found in this space.", output_format)
                 return
             if not sys.stdin.isatty():
-                click.echo("Available object types:")
+                machine = output_format != "text"
+                click.echo("Available object types:", err=machine)
                 for obj_type in object_types["data"]:
-                    click.echo(f"- {obj_type['name']} (Key: {obj_type['key']})")
-                click.echo(
-                    "\nError: --object-type-id is required when not running in an interactive terminal."
+                    click.echo(
+                        f"- {obj_type['name']} (Key: {obj_type['key']})", err=machine
+                    )
+                fail(
+                    "\nError: --object-type-id is required when not running in an interactive terminal.",
+                    output_format,
                 )
                 return
 
+            import questionary
+
             choices = []
             for obj_type in object_types["data"]:
                 choices.append(
@@ -58,11 +62,14 @@ def list_templates(space_name, object_type_id):
                 instruction="Use arrow keys to navigate, enter to confirm.",
             ).ask()
             if not selected_object_type_id:
-                click.echo("No type selected. Exiting.")
+                fail("No type selected. Exiting.", output_format)
                 return
             object_type_id = selected_object_type_id
 
         templates = anytype_client.get_templates_for_type(space_id, object_type_id)
+        if output_format != "text":
+            RecordWriter(output_format, fields).write_page(templates.get("data") or [])
+            return
         click.echo(f"\n--- Templates for Object Type: {object_type_id} ---")
         if templates and templates["data"]:
             for template in templates["data"]:
@@ -70,5 +77,7 @@ def list_templates(space_name, object_type_id):
         else:
             click.echo("No templates found for the selected object type.")
 
+    except click.exceptions.Exit:
+        raise
     except Exception as e:
-        click.echo(f"Error: {e}")
+        fail(f"Error: {e}", output_format)
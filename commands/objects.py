@@ -1,14 +1,17 @@
-import click
-from dotenv import load_dotenv
+import os
 
-from anytype_api import AnytypeClient
-from parser.parser import parse_lines
-from parser.reader import read_markdown
+import click
 
-load_dotenv()
+from anytype_api import get_client, tracing
+from anytype_api.bulk import DEFAULT_MAX_WORKERS, WriteResult, create_objects
+from anytype_api.journal import Journal
+from anytype_api.keys import FR_SYSTEM_FEATURE_KEY
+from commands.context import parsed_documents
+from parser.batch import load_batch
+from parser.payloads import functional_requirement_payload, system_feature_payload
 
 
-@click.command("create")
+@click.command("create-objects")
 @click.option("--space-name", required=True, help="The name of the Anytype space.")
 @click.option(
     "--sf-type-key", default="page", help="The type key for SystemFeature objects."
@@ -21,15 +24,38 @@ load_dotenv()
 @click.option(
     "--file-path",
     default="requirements.md",
-    help="The path to the requirements markdown file.",
+    help="The requirements markdown file, a glob such as 'specs/*.md', or a directory.",
+)
+@click.option(
+    "--max-workers",
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="Maximum number of concurrent create requests.",
 )
-def create_objects_command(space_name, sf_type_key, fr_type_key, file_path):
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted run, skipping objects its journal records as created.",
+)
+def create_objects_command(
+    space_name,
+    sf_type_key,
+    fr_type_key,
+    file_path,
+    max_workers=DEFAULT_MAX_WORKERS,
+    resume=False,
+):
     """Creates objects in Anytype based on a requirements file."""
-    lines = read_markdown(file_path)
-    features = parse_lines(lines)
-
     try:
-        anytype_client = AnytypeClient()
+        with tracing.span("parse"):
+            batch = load_batch(file_path, memo=parsed_documents())
+        # Journal steps are scoped to the file that defines each object, so
+        # ids repeated across files never share a step.
+        located = list(batch.iter_features())
+        sources = [path for path, _ in located]
+        features = [feature for _, feature in located]
+
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
@@ -37,33 +63,109 @@ def create_objects_command(space_name, sf_type_key, fr_type_key, file_path):
             return
         space_id = space["id"]
 
-        for feature in features:
-            sf_payload = {
-                "type_key": sf_type_key,
-                "name": feature.id,
-                "properties": [{"key": "description", "text": feature.description}],
-            }
-            created_sf = anytype_client.create_object(space_id, sf_payload)
-            click.echo(f"Created SystemFeature: {created_sf['id']}")
+        with Journal.open(
+            "create", space_name, os.path.abspath(file_path), resume=resume
+        ) as journal:
+            if resume and journal.completed:
+                click.echo(
+                    f"Resuming: {len(journal.completed)} objects already created."
+                )
+            _warn_unconfirmed(journal)
 
-            fr_ids = []
-            for fr in feature.functional_requirements:
-                fr_payload = {
-                    "type_key": fr_type_key,
-                    "name": fr.id,
-                    "properties": [
-                        {"key": "description", "text": fr.description},
-                        {"key": "status", "select": fr.completion_state},
+            # Create the SFs first so every FR is created already linked to its
+            # SF through the FR's System Feature relation, the one sync and
+            # create-fr use as well: one write per object and no follow-up PATCH.
+            with tracing.span("create system features"):
+                sf_results = create_objects(
+                    anytype_client,
+                    space_id,
+                    [
+                        (
+                            f"sf:{source}:{feature.id}",
+                            system_feature_payload(feature, sf_type_key),
+                        )
+                        for source, feature in zip(sources, features)
                     ],
-                }
-                created_fr = anytype_client.create_object(space_id, fr_payload)
-                click.echo(f"  Created FunctionalRequirement: {created_fr['id']}")
-                fr_ids.append(created_fr["id"])
+                    max_workers,
+                    journal=journal,
+                )
+
+            fr_items = []
+            for source, feature, sf_result in zip(sources, features, sf_results):
+                if not sf_result.ok:
+                    # Left for --resume, so the FRs are never created unlinked.
+                    continue
+                for fr in feature.functional_requirements:
+                    payload = functional_requirement_payload(fr, fr_type_key)
+                    payload["properties"].append(
+                        {
+                            "key": FR_SYSTEM_FEATURE_KEY,
+                            "objects": [sf_result.object_id],
+                        }
+                    )
+                    fr_items.append((f"fr:{source}:{fr.id}", payload))
+            with tracing.span("create functional requirements"):
+                created = iter(
+                    create_objects(
+                        anytype_client,
+                        space_id,
+                        fr_items,
+                        max_workers,
+                        journal=journal,
+                    )
+                )
+
+            fr_results = []
+            fr_results_by_feature = []
+            for feature, sf_result in zip(features, sf_results):
+                results = [
+                    next(created)
+                    if sf_result.ok
+                    else WriteResult(fr.id, error="its System Feature was not created")
+                    for fr in feature.functional_requirements
+                ]
+                fr_results.extend(results)
+                fr_results_by_feature.append(results)
 
-            sf_update_payload = {
-                "properties": [{"key": "functionalRequirements", "objects": fr_ids}]
-            }
-            anytype_client.update_object(created_sf["id"], sf_update_payload)
+        failures = 0
+        for feature, sf_result, results in zip(
+            features, sf_results, fr_results_by_feature
+        ):
+            if sf_result.ok:
+                verb = "Already created" if sf_result.resumed else "Created"
+                click.echo(f"{verb} SystemFeature: {sf_result.object_id}")
+            else:
+                failures += 1
+                click.echo(
+                    f"Failed to create SystemFeature {feature.id}: {sf_result.error}"
+                )
+            for fr, fr_result in zip(feature.functional_requirements, results):
+                if fr_result.ok:
+                    verb = "Already created" if fr_result.resumed else "Created"
+                    click.echo(f"  {verb} FunctionalRequirement: {fr_result.object_id}")
+                else:
+                    failures += 1
+                    click.echo(
+                        f"  Failed to create FunctionalRequirement {fr.id}: {fr_result.error}"
+                    )
+
+        total = len(sf_results) + len(fr_results)
+        if failures:
+            click.echo(f"\n⚠️  {failures} of {total} objects failed to create.")
+            click.echo("Run again with --resume to retry only the failed objects.")
+        else:
+            click.echo(f"\n✅ Created {total} objects.")
 
     except Exception as e:
         click.echo(f"Error: {e}")
+
+
+def _warn_unconfirmed(journal):
+    """Warn about writes an interrupted run sent without confirming them."""
+    unconfirmed = journal.unconfirmed
+    if unconfirmed:
+        click.echo(
+            f"Warning: {len(unconfirmed)} writes were started but never confirmed "
+            "and will be retried; check the space for duplicates of: "
+            + ", ".join(step.rsplit(":", 1)[-1] for step in unconfirmed)
+        )
@@ -0,0 +1,12 @@
+import sys
+
+import click
+
+from parser.lsp import LanguageServer
+
+
+@click.command()
+def serve():
+    """Run a language server on stdio that validates requirements as you type."""
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    sys.exit(server.serve())
@@ -1,9 +1,6 @@
 import click
-from dotenv import load_dotenv
 
-from anytype_api import AnytypeClient
-
-load_dotenv()
+from anytype_api import get_client
 
 
 @click.command()
@@ -26,7 +23,7 @@ load_dotenv()
 def create_sf(space_name, sf_id, sf_description, sf_type_key):
     """Create a single System Feature object in Anytype."""
     try:
-        anytype_client = AnytypeClient()
+        anytype_client = get_client()
         spaces = anytype_client.get_spaces()
         space = next((s for s in spaces["data"] if s["name"] == space_name), None)
         if not space:
@@ -0,0 +1,118 @@
+import shlex
+
+import click
+
+from anytype_api.session import CachingAnytypeClient, use_client
+
+SHELL_COMMANDS = {
+    "exit": "Leave the shell.",
+    "quit": "Leave the shell.",
+    "refresh": "Forget cached responses so the next commands refetch them.",
+}
+
+
+def _completer(group, ctx, client):
+    """Build a readline completer over commands, options and cached names."""
+
+    def candidates(line):
+        words = shlex.split(line) if line.strip() else []
+        if not words or (len(words) == 1 and not line.endswith(" ")):
+            return sorted(set(group.list_commands(ctx)) | set(SHELL_COMMANDS))
+        names = []
+        command = group.get_command(ctx, words[0])
+        if command:
+            for param in command.params:
+                names.extend(getattr(param, "opts", []))
+        for name in sorted(client.type_names | client.object_names):
+            names.append(f'"{name}"' if " " in name else name)
+        return names
+
+    matches = []
+
+    def complete(text, state):
+        nonlocal matches
+        if state == 0:
+            import readline
+
+            try:
+                options = candidates(readline.get_line_buffer())
+            except ValueError:
+                # Unbalanced quotes while the user is still typing a name.
+                options = candidates(readline.get_line_buffer() + '"')
+            matches = [option for option in options if option.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    return complete
+
+
+@click.command()
+@click.pass_context
+def shell(ctx):
+    """Run commands interactively against a shared client and cache."""
+    group = ctx.find_root().command
+    client = CachingAnytypeClient()
+
+    try:
+        import readline
+
+        readline.set_completer_delims(" \t\n")
+        readline.set_completer(_completer(group, ctx, client))
+        readline.parse_and_bind("tab: complete")
+    except ImportError:
+        pass  # No line editing or completion on this platform.
+
+    click.echo("Everywhere Any shell. Type 'help' for commands, 'exit' to leave.")
+    with use_client(client):
+        while True:
+            try:
+                line = input("everywhere> ")
+            except EOFError:
+                click.echo()
+                break
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                click.echo(f"Error: {e}")
+                continue
+            if not args:
+                continue
+
+            name = args[0]
+            if name in ("exit", "quit"):
+                break
+            if name == "refresh":
+                client.clear()
+                click.echo("Cache cleared.")
+                continue
+            if name == "help":
+                group.main(["--help"], prog_name="", standalone_mode=False)
+                click.echo("\nShell commands:")
+                for shell_command, help_text in SHELL_COMMANDS.items():
+                    click.echo(f"  {shell_command:<24} {help_text}")
+                continue
+            if name == "shell":
+                click.echo("Already in the shell.")
+                continue
+            if name == "serve":
+                click.echo(
+                    "Run 'serve' outside the shell: it takes over stdin and stdout."
+                )
+                continue
+
+            try:
+                group.main(args, prog_name="", standalone_mode=False)
+            except click.ClickException as e:
+                e.show()
+            except click.exceptions.Abort:
+                click.echo("Aborted.")
+            except SystemExit as e:
+                # sys.exit() ends the command, not the session.
+                if e.code not in (None, 0):
+                    click.echo(f"Command exited with status {e.code}.")
+            except Exception as e:
+                # A failing command must not end the session.
+                click.echo(f"Error: {e}")
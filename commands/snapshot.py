@@ -0,0 +1,51 @@
+import functools
+
+import click
+
+from anytype_api import get_client
+from anytype_api.session import use_client
+from anytype_api.snapshot import SnapshotClient, write_snapshot
+
+
+def from_snapshot_option(command):
+    """Add ``--from-snapshot`` to a command that reads through ``get_client()``."""
+
+    @click.option(
+        "--from-snapshot",
+        type=click.Path(exists=True, dir_okay=False),
+        help="Read from a file written by 'snapshot' instead of the Anytype app.",
+    )
+    @functools.wraps(command)
+    def wrapper(*args, from_snapshot=None, **kwargs):
+        if not from_snapshot:
+            return command(*args, **kwargs)
+        with use_client(SnapshotClient.load(from_snapshot)):
+            return command(*args, **kwargs)
+
+    return wrapper
+
+
+@click.command()
+@click.option(
+    "--space-name", default="Everywhere", help="The name of the Anytype space."
+)
+@click.option(
+    "--output",
+    help="The snapshot file to write. Defaults to '<space name>.snapshot.jsonl.gz'.",
+)
+def snapshot(space_name, output):
+    """Save the SFs, FRs, APIs and types of a space to a local file."""
+    try:
+        anytype_client = get_client()
+        spaces = anytype_client.get_spaces()
+        space = next((s for s in spaces["data"] if s["name"] == space_name), None)
+        if not space:
+            click.echo(f"Error: Space '{space_name}' not found.")
+            return
+
+        output = output or f"{space_name}.snapshot.jsonl.gz"
+        count = write_snapshot(anytype_client, space, output)
+        click.echo(f"✅ Saved {count} objects from '{space_name}' to {output}")
+
+    except Exception as e:
+        click.echo(f"Error: {e}")
@@ -0,0 +1,79 @@
+import json
+
+import click
+
+from anytype_api import get_client, tracing
+from anytype_api.graph import SF, RelationGraph
+from commands.snapshot import from_snapshot_option
+
+
+@click.command()
+@click.option(
+    "--space-name", default="Everywhere", help="The name of the Anytype space."
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    help="Print a table, or JSON including per-FR API completion.",
+)
+@from_snapshot_option
+def stats(space_name, output_format):
+    """Roll up FR and API status per System Feature for a space."""
+    try:
+        try:
+            # Imported here: NumPy is an optional dependency of this command.
+            from anytype_api.rollup import StatusRollup
+        except ImportError:
+            click.echo(
+                "Error: The stats command needs NumPy. "
+                "Install it with: pip install 'everywhere-any[stats]'"
+            )
+            return
+
+        anytype_client = get_client()
+        spaces = anytype_client.get_spaces()
+        space = next((s for s in spaces["data"] if s["name"] == space_name), None)
+        if not space:
+            click.echo(f"Error: Space '{space_name}' not found.")
+            return
+
+        with tracing.span("load graph"):
+            graph = RelationGraph.load(anytype_client, space["id"])
+        with tracing.span("rollup"):
+            rollup = StatusRollup.from_graph(graph)
+
+        if output_format == "json":
+            click.echo(json.dumps(rollup.to_dict(graph), indent=2))
+            return
+
+        summary = rollup.summary()
+        click.echo(f"\n📊 Status of '{space_name}':")
+        click.echo(f"- System Features: {summary['system_features']}")
+        click.echo(
+            f"- Functional Requirements: {summary['functional_requirements']} "
+            f"({summary['percent_frs_done']}% Done)"
+        )
+        click.echo(f"- APIs: {summary['apis']} ({summary['percent_apis_done']}% Done)")
+        for api_type, count in summary["apis_by_type"].items():
+            click.echo(f"    {api_type}: {count}")
+        completion = summary["fr_api_completion"]
+        click.echo(
+            f"- FRs by API completion: {completion['all_done']} all Done, "
+            f"{completion['some_done']} partly Done, {completion['none_done']} "
+            f"none Done, {completion['no_apis']} without APIs"
+        )
+
+        statuses = [status or "(none)" for status in rollup.statuses]
+        click.echo("\n--- FR status by System Feature ---")
+        header = "".join(f"{status[:12]:>13}" for status in statuses)
+        click.echo(f"{'System Feature':<40}{header}{'% Done':>9}")
+        counts, percent_done = rollup.sf_status.tolist(), rollup.sf_percent_done
+        for sf in sorted(range(len(counts)), key=lambda sf: graph.names[SF][sf]):
+            row = f"{graph.names[SF][sf][:40]:<40}"
+            row += "".join(f"{count:>13}" for count in counts[sf])
+            click.echo(f"{row}{percent_done[sf]:>8.1f}%")
+
+    except Exception as e:
+        click.echo(f"Error: {e}")
@@ -0,0 +1,102 @@
+import click
+
+from anytype_api import get_client, tracing
+from anytype_api.bulk import DEFAULT_MAX_WORKERS
+from anytype_api.keys import FR_TYPE_KEY, SF_TYPE_KEY
+from anytype_api.space_index import SpaceIndex
+from anytype_api.sync import CREATE, NOOP, UPDATE, apply_plan, plan_sync
+from commands.context import parsed_documents
+from parser.batch import load_features
+
+PLAN_SYMBOLS = {CREATE: "+", UPDATE: "~"}
+
+
+@click.command("sync")
+@click.option(
+    "--space-name",
+    default="Everywhere",
+    help="The name of the Anytype space.",
+)
+@click.option(
+    "--file-path",
+    default="requirements.md",
+    help="The requirements markdown file, a glob such as 'specs/*.md', or a directory.",
+)
+@click.option(
+    "--sf-type-key",
+    default=SF_TYPE_KEY,
+    help="The type key for System Feature objects.",
+)
+@click.option(
+    "--fr-type-key",
+    default=FR_TYPE_KEY,
+    help="The type key for Functional Requirement objects.",
+)
+@click.option(
+    "--apply",
+    "apply_changes",
+    is_flag=True,
+    help="Send the planned creates and updates instead of only printing the plan.",
+)
+@click.option(
+    "--max-workers",
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="Maximum number of concurrent write requests.",
+)
+def sync(space_name, file_path, sf_type_key, fr_type_key, apply_changes, max_workers):
+    """Plan (and optionally apply) the changes that bring a space in line with requirements.md."""
+    try:
+        with tracing.span("parse"):
+            features = load_features(file_path, memo=parsed_documents())
+
+        anytype_client = get_client()
+        spaces = anytype_client.get_spaces()
+        space = next((s for s in spaces["data"] if s["name"] == space_name), None)
+        if not space:
+            click.echo(f"Error: Space '{space_name}' not found.")
+            return
+        space_id = space["id"]
+
+        with tracing.span("load space index"):
+            index = SpaceIndex.load(
+                anytype_client, space_id, sf_type_key, fr_type_key
+            )
+        with tracing.span("plan"):
+            plan = plan_sync(features, index)
+
+        click.echo(f"\n--- Sync plan for '{space_name}' ---")
+        for action in plan.actions:
+            if action.action == NOOP:
+                continue
+            line = f"{PLAN_SYMBOLS[action.action]} {action.action} {action.kind} {action.name}"
+            if action.changes:
+                line += f" ({', '.join(action.changes)})"
+            click.echo(line)
+        click.echo(
+            f"\n{len(plan.by_action(CREATE))} to create, "
+            f"{len(plan.by_action(UPDATE))} to update, "
+            f"{len(plan.by_action(NOOP))} unchanged."
+        )
+
+        if not plan.has_changes:
+            click.echo("✅ Space is already in sync.")
+            return
+        if not apply_changes:
+            click.echo("Run again with --apply to send these changes.")
+            return
+
+        with tracing.span("apply"):
+            results = apply_plan(
+                anytype_client, index, plan, sf_type_key, fr_type_key, max_workers
+            )
+        failures = [r for r in results if not r.ok]
+        for result in failures:
+            click.echo(f"Failed to write {result.key}: {result.error}")
+        if failures:
+            click.echo(f"\n⚠️  {len(failures)} of {len(results)} writes failed.")
+        else:
+            click.echo(f"\n✅ Applied {len(results)} writes.")
+
+    except Exception as e:
+        click.echo(f"Error: {e}")
@@ -1,30 +1,78 @@
 import click
-from dotenv import load_dotenv
 
-from parser.exporter import export_to_json
-from parser.parser import parse_lines
-from parser.reader import read_markdown
-from parser.stats import print_stats, validate_frs
-
-load_dotenv()
+from anytype_api import tracing
+from commands.context import parsed_documents
+from parser.batch import parse_files, resolve_paths
+from parser.exporter import export_to_json, export_to_jsonl
+from parser.stats import (
+    print_duplicate_frs,
+    print_duplicate_srs,
+    print_file_timings,
+    print_stats,
+    validate_frs,
+)
 
 
 @click.command("validate")
 @click.option(
     "--file-path",
     default="requirements.md",
-    help="The path to the requirements markdown file.",
+    help="The requirements markdown file, a glob such as 'specs/*.md', or a directory.",
+)
+@click.option(
+    "--export-format",
+    type=click.Choice(["json", "jsonl"], case_sensitive=False),
+    default="json",
+    help="Write requirements.json as a JSON array or requirements.jsonl with one feature per line.",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Write the JSON export without indentation.",
 )
-def validate_requirements_command(file_path: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Parse the whole file instead of reusing the parse cache.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Processes used to parse several files (defaults to the CPU count).",
+)
+def validate_requirements_command(
+    file_path: str,
+    export_format: str = "json",
+    compact: bool = False,
+    no_cache: bool = False,
+    workers: int | None = None,
+):
     """Parses and validates a requirements markdown file."""
-    lines = read_markdown(file_path)
-    features = parse_lines(lines)
+    paths = resolve_paths(file_path)
+    with tracing.span("parse", files=len(paths)):
+        batch = parse_files(
+            paths, workers, use_cache=not no_cache, memo=parsed_documents()
+        )
+    features = batch.features
 
-    export_to_json(features, "requirements.json")
-    click.echo("✅ Requirements exported to requirements.json")
+    with tracing.span("export", format=export_format):
+        if export_format == "jsonl":
+            export_to_jsonl(features, "requirements.jsonl")
+            click.echo("✅ Requirements exported to requirements.jsonl")
+        else:
+            export_to_json(features, "requirements.json", compact=compact)
+            click.echo("✅ Requirements exported to requirements.json")
 
     print_stats(features)
 
-    with open(file_path, "r") as f:
-        md_text = f.read()
-    validate_frs(features, md_text)
+    with tracing.span("validate"):
+        for path, document in batch.documents.items():
+            if len(paths) > 1:
+                click.echo(f"\n📄 {path}")
+            validate_frs(document)
+
+    if len(paths) > 1:
+        print_duplicate_srs(batch.duplicate_srs())
+        print_duplicate_frs(batch.duplicate_frs())
+        print_file_timings(batch.timings)
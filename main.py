@@ -1,37 +1,125 @@
+import importlib
+
 import click
 from dotenv import load_dotenv
 
-from commands.create import create
-from commands.fr import create_fr, list_frs
-from commands.list import list_objects, get_object_type_details
-from commands.validate import validate_requirements_command
-from commands.objects import create_objects_command
-
 load_dotenv()
 
 
-@click.group()
-def cli():
+class LazyGroup(click.Group):
+    """A click group that imports a command's module only when it is used.
+
+    Commands are registered as ``"name": "module:attribute"`` so that, for
+    example, ``validate --help`` never imports the report or prompt modules.
+    ``lazy_help`` holds their one-line help, so the top-level ``--help``
+    lists every command without importing any of them.
+    """
+
+    def __init__(self, *args, lazy_commands=None, lazy_help=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+        self.lazy_help = dict(lazy_help or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            # Unloaded commands are summarised from a stand-in with their help.
+            command = self.commands.get(name) or click.Command(
+                name, help=self.lazy_help.get(name)
+            )
+            if not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "create": "commands.create:create",
+        "create-objects": "commands.objects:create_objects_command",
+        "create-fr": "commands.fr:create_fr",
+        "create-sf": "commands.sf:create_sf",
+        "list-frs": "commands.fr:list_frs",
+        "list-objects": "commands.list:list_objects",
+        "get-object-type-details": "commands.list:get_object_type_details",
+        "list-templates": "commands.list_templates:list_templates",
+        "validate": "commands.validate:validate_requirements_command",
+        "import-requirements": "commands.import_requirements:import_requirements",
+        "generate-report": "commands.generate_report:generate_report",
+        "sync": "commands.sync:sync",
+        "shell": "commands.shell:shell",
+        "index": "commands.index:index",
+        "coverage": "commands.coverage:coverage",
+        "snapshot": "commands.snapshot:snapshot",
+        "stats": "commands.stats:stats",
+        "serve": "commands.serve:serve",
+    },
+    lazy_help={
+        "create": "Parse a requirements file and create objects in Anytype.",
+        "create-objects": "Creates objects in Anytype based on a requirements file.",
+        "create-fr": "Create a single Functional Requirement object in Anytype.",
+        "create-sf": "Create a single System Feature object in Anytype.",
+        "list-frs": "List all Functional Requirements in a given space.",
+        "list-objects": "List objects in an Anytype space.",
+        "get-object-type-details": (
+            "Get details of a specific "
+            "object type in an Anytype space."
+        ),
+        "list-templates": "List templates for a given object type in an Anytype space.",
+        "validate": "Parses and validates a requirements markdown file.",
+        "import-requirements": (
+            "Reads and imports Functional "
+            "Requirements from a Markdown file."
+        ),
+        "generate-report": (
+            "Generates a Markdown report of System "
+            "Features and Functional Requirements from Anytype."
+        ),
+        "sync": (
+            "Plan (and optionally apply) the changes that "
+            "bring a space in line with requirements.md."
+        ),
+        "shell": "Run commands interactively against a shared client and cache.",
+        "index": "Build or refresh the local search index of a space.",
+        "coverage": "Report traceability coverage between SFs, FRs and APIs.",
+        "snapshot": "Save the SFs, FRs, APIs and types of a space to a local file.",
+        "stats": "Roll up FR and API status per System Feature for a space.",
+        "serve": (
+            "Run a language server on stdio "
+            "that validates requirements as you type."
+        ),
+    },
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(dir_okay=False),
+    help="Write a Chrome/Perfetto trace of the command's phases to this file.",
+)
+@click.pass_context
+def cli(ctx, trace_path):
     """A command-line tool for interacting with Anytype."""
-    pass
-
-
-from commands.sf import create_sf
-from commands.list_templates import list_templates
-from commands.import_requirements import import_requirements
-from commands.generate_report import generate_report
-
-cli.add_command(create)
-cli.add_command(list_objects)
-cli.add_command(get_object_type_details)
-cli.add_command(create_fr)
-cli.add_command(list_frs)
-cli.add_command(validate_requirements_command)
-cli.add_command(create_objects_command)
-cli.add_command(create_sf)
-cli.add_command(list_templates)
-cli.add_command(import_requirements)
-cli.add_command(generate_report)
+    if trace_path:
+        from anytype_api import tracing
+
+        tracing.start()
+        ctx.call_on_close(lambda: tracing.write(trace_path))
+
 
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,133 @@
+"""Parse several requirements files at once on a process pool."""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+
+from .cache import load_document
+from .document import ParsedDocument
+from .parser import parse_document
+from .reader import iter_markdown
+
+
+@dataclass
+class BatchResult:
+    # Path -> parsed document, in the order the paths were given.
+    documents: dict[str, ParsedDocument] = field(default_factory=dict)
+    # Path -> seconds spent reading and parsing that file.
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def features(self) -> list:
+        return [feature for _, feature in self.iter_features()]
+
+    def iter_features(self):
+        """Yield ``(path, feature)`` for every feature, in file order."""
+        for path, document in self.documents.items():
+            for feature in document.features:
+                yield path, feature
+
+    def duplicate_frs(self) -> dict[str, list[tuple[str, int]]]:
+        """FR ids parsed in more than one file, with each (path, line)."""
+        seen: dict[str, list[tuple[str, int]]] = {}
+        for path, document in self.documents.items():
+            for fr_id, line_numbers in document.fr_lines.items():
+                seen.setdefault(fr_id, []).extend(
+                    (path, line_no) for line_no in line_numbers
+                )
+        return {
+            fr_id: locations
+            for fr_id, locations in seen.items()
+            if len({path for path, _ in locations}) > 1
+        }
+
+    def duplicate_srs(self) -> dict[str, list[str]]:
+        """SR ids parsed in more than one file, with each file's path.
+
+        Every file numbers its own ``### 2.x`` headings, so two files that
+        both start at 2.1 collide on SR-1.
+        """
+        seen: dict[str, list[str]] = {}
+        for path, document in self.documents.items():
+            for feature in document.features:
+                seen.setdefault(feature.id, []).append(path)
+        return {
+            sr_id: paths for sr_id, paths in seen.items() if len(set(paths)) > 1
+        }
+
+
+def resolve_paths(spec: str) -> list[str]:
+    """Expand a file path, glob pattern or directory into markdown files."""
+    if os.path.isdir(spec):
+        paths = glob.glob(os.path.join(spec, "**", "*.md"), recursive=True)
+    elif glob.has_magic(spec):
+        paths = glob.glob(spec, recursive=True)
+    else:
+        return [spec]
+    if not paths:
+        raise FileNotFoundError(f"No markdown files match '{spec}'")
+    return sorted(paths)
+
+
+def _parse_file(path: str, use_cache: bool) -> tuple[str, ParsedDocument, float]:
+    start = time.perf_counter()
+    if use_cache:
+        document = load_document(path)
+    else:
+        document = parse_document(iter_markdown(path))
+    return path, document, time.perf_counter() - start
+
+
+def parse_files(
+    paths: list[str],
+    max_workers: int | None = None,
+    use_cache: bool = True,
+    memo: dict | None = None,
+) -> BatchResult:
+    """Parse ``paths``; with ``memo``, a set of paths is only parsed once."""
+    key = tuple(os.path.abspath(path) for path in paths)
+    if memo is not None and key in memo:
+        return memo[key]
+
+    if len(paths) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parsed = list(pool.map(_parse_file, paths, repeat(use_cache)))
+    else:
+        parsed = [_parse_file(path, use_cache) for path in paths]
+
+    result = BatchResult()
+    for path, document, elapsed in parsed:
+        result.documents[path] = document
+        result.timings[path] = elapsed
+    if memo is not None:
+        memo[key] = result
+    return result
+
+
+def load_features(
+    spec: str, max_workers: int | None = None, memo: dict | None = None
+) -> list:
+    """Parse every file matched by ``spec`` and merge their features."""
+    return load_batch(spec, max_workers, memo).features
+
+
+def load_batch(
+    spec: str, max_workers: int | None = None, memo: dict | None = None
+) -> BatchResult:
+    """Parse every file matched by ``spec`` for merging into one space.
+
+    Raises ValueError when two files define the same SR id, since merging
+    them would create one System Feature per file under the same name.
+    """
+    batch = parse_files(resolve_paths(spec), max_workers, memo=memo)
+    duplicates = batch.duplicate_srs()
+    if duplicates:
+        collisions = "; ".join(
+            f"{sr_id} in {', '.join(paths)}"
+            for sr_id, paths in sorted(duplicates.items())
+        )
+        raise ValueError(f"SR ids defined in more than one file: {collisions}")
+    return batch
@@ -0,0 +1,144 @@
+"""Persistent parse cache for requirements files.
+
+Each cached file stores the hash of the whole file and, for every section
+(the block that starts at a ``### x.y`` heading), the hash and parse result
+of that section. An unchanged file is loaded straight from the cache; when
+only some sections change, only those are decoded and re-parsed and the
+rest are spliced in from the cache.
+
+The cache holds plain JSON, never pickles: it sits in the working
+directory, so loading it must not run code a checkout could plant there.
+Nodes are rebuilt from their fields on load.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+
+from .document import FeatureNode, ParsedDocument, RequirementNode
+from .parser import parse_section
+from .reader import map_markdown, split_lines
+
+CACHE_DIR = ".everywhere_cache"
+# Bump whenever the parser or the parse models change shape.
+CACHE_VERSION = 5
+
+# Stricter than parser.heading_pattern on purpose: every boundary found here
+# is a level-3 numbered heading, which resets the parser's current feature.
+section_boundary_pattern = re.compile(
+    rb"^[ \t]*###[ \t]+\d+\.\d+[ \t]+\S", re.MULTILINE
+)
+
+
+def _cache_path(filepath: str, cache_dir: str) -> str:
+    key = hashlib.sha1(os.path.abspath(filepath).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def _read_cache(path: str) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_cache(path: str, entry: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _document_from_fields(fields: dict) -> ParsedDocument:
+    return ParsedDocument(
+        features=[
+            FeatureNode(
+                id=feature["id"],
+                description=feature["description"],
+                functional_requirements=[
+                    RequirementNode(**fr) for fr in feature["functional_requirements"]
+                ],
+            )
+            for feature in fields["features"]
+        ],
+        fr_lines=fields["fr_lines"],
+        fr_mentions=fields["fr_mentions"],
+    )
+
+
+def _section_lines(data: bytes) -> list[str]:
+    # Mirrors parser.reader.iter_markdown.
+    return [line.strip() for line in split_lines(data.decode("utf-8"))]
+
+
+def _section_offsets(mapped) -> list[int]:
+    offsets = [0]
+    for match in section_boundary_pattern.finditer(mapped):
+        if match.start() > 0:
+            offsets.append(match.start())
+    offsets.append(len(mapped))
+    return offsets
+
+
+def load_document(filepath: str, cache_dir: str = CACHE_DIR) -> ParsedDocument:
+    """Parse a requirements file, reusing cached results where possible."""
+    path = _cache_path(filepath, cache_dir)
+    entry = _read_cache(path)
+    cached_sections = entry["sections"] if entry else {}
+
+    with map_markdown(filepath) as mapped:
+        file_hash = hashlib.sha256(mapped).hexdigest()
+        if entry and entry["file_hash"] == file_hash:
+            return _assemble(entry["order"], cached_sections)
+
+        sections = {}
+        order = []
+        offsets = _section_offsets(mapped)
+        view = memoryview(mapped)
+        try:
+            for start, end in zip(offsets, offsets[1:]):
+                if start == end:
+                    continue
+                section_hash = hashlib.sha256(view[start:end]).hexdigest()
+                section = cached_sections.get(section_hash)
+                if section is None:
+                    lines = _section_lines(mapped[start:end])
+                    section_document, section_stops = parse_section(lines)
+                    fields = dataclasses.asdict(section_document)
+                    section = (fields, section_stops, len(lines))
+                sections[section_hash] = section
+                order.append(section_hash)
+        finally:
+            view.release()
+
+    _write_cache(
+        path,
+        {
+            "version": CACHE_VERSION,
+            "file_hash": file_hash,
+            "order": order,
+            "sections": sections,
+        },
+    )
+    return _assemble(order, sections)
+
+
+def _assemble(order: list[str], sections: dict) -> ParsedDocument:
+    document = ParsedDocument()
+    line_offset = 0
+    stopped = False
+    for section_hash in order:
+        fields, section_stops, line_count = sections[section_hash]
+        document.extend(
+            _document_from_fields(fields), line_offset, mentions_only=stopped
+        )
+        stopped = stopped or section_stops
+        line_offset += line_count
+    return document
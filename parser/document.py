@@ -0,0 +1,50 @@
+"""Network-free models for a parsed requirements document.
+
+These only describe what is written in the markdown. The Anytype-backed
+models in ``parser.models`` are hydrated from a space instead, and
+``parser.payloads`` turns these nodes into Anytype create payloads.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RequirementNode:
+    id: str
+    description: str
+    linked_sr: str
+    completion_state: str = "To Do"
+
+
+@dataclass
+class FeatureNode:
+    id: str
+    description: str
+    functional_requirements: list[RequirementNode] = field(default_factory=list)
+
+
+@dataclass
+class ParsedDocument:
+    features: list[FeatureNode] = field(default_factory=list)
+    # FR id -> line numbers (1-based) of the FR bullets that were parsed.
+    fr_lines: dict[str, list[int]] = field(default_factory=dict)
+    # FR id -> line numbers of every FR-looking token anywhere in the file.
+    fr_mentions: dict[str, list[int]] = field(default_factory=dict)
+
+    def extend(self, other: "ParsedDocument", line_offset: int, mentions_only=False):
+        """Append a section parsed on its own, shifting its line numbers."""
+        _merge_lines(self.fr_mentions, other.fr_mentions, line_offset)
+        if mentions_only:
+            return
+        self.features.extend(other.features)
+        _merge_lines(self.fr_lines, other.fr_lines, line_offset)
+
+
+def _merge_lines(target: dict, source: dict, line_offset: int):
+    for fr_id, line_numbers in source.items():
+        shifted = [n + line_offset for n in line_numbers]
+        existing = target.get(fr_id)
+        if existing is None:
+            target[fr_id] = shifted
+        else:
+            existing.extend(shifted)
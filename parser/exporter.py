@@ -1,26 +1,56 @@
 import csv
 import json
+from typing import Iterable
 
+from .document import FeatureNode
 from .models import SystemFeature
 
 
-def export_to_json(features: list[SystemFeature], filepath: str):
-    def serialize(obj):
-        if isinstance(obj, SystemFeature):
-            return {
-                "id": obj.id,
-                "description": obj.description,
-                "functional_requirements": [
-                    serialize(fr) for fr in obj.functional_requirements
-                ],
-            }
-        elif isinstance(obj, dict):
-            return obj
-        else:  # FunctionalRequirement
-            return vars(obj)
+# Explicit field schema for JSON exports; anything else on the objects is ignored.
+SYSTEM_FEATURE_FIELDS = ("id", "description")
+FUNCTIONAL_REQUIREMENT_FIELDS = ("id", "linked_sr", "completion_state", "description")
 
+
+def _feature_record(feature: FeatureNode) -> dict:
+    record = {field: getattr(feature, field) for field in SYSTEM_FEATURE_FIELDS}
+    record["functional_requirements"] = [
+        {field: getattr(fr, field) for field in FUNCTIONAL_REQUIREMENT_FIELDS}
+        for fr in feature.functional_requirements
+    ]
+    return record
+
+
+def export_to_json(
+    features: Iterable[FeatureNode], filepath: str, compact: bool = False
+):
+    """Write features as a JSON array, serializing one feature at a time."""
+    if compact:
+        encoder = json.JSONEncoder(separators=(",", ":"))
+    else:
+        encoder = json.JSONEncoder(indent=2)
+
+    with open(filepath, "w") as f:
+        f.write("[")
+        empty = True
+        for feature in features:
+            if not empty:
+                f.write(",")
+            empty = False
+            chunk = encoder.encode(_feature_record(feature))
+            if compact:
+                f.write(chunk)
+            else:
+                f.write("\n  " + chunk.replace("\n", "\n  "))
+        f.write("]" if compact or empty else "\n]")
+
+
+def export_to_jsonl(features: Iterable[FeatureNode], filepath: str):
+    """Write one compact JSON object per feature, one feature per line."""
+    encoder = json.JSONEncoder(separators=(",", ":"))
     with open(filepath, "w") as f:
-        json.dump([serialize(f) for f in features], f, indent=2)
+        for feature in features:
+            f.write(encoder.encode(_feature_record(feature)))
+            f.write("\n")
 
 
 def export_to_markdown(features: list[SystemFeature], filepath: str):
@@ -0,0 +1,325 @@
+"""An in-memory requirements document that re-parses only edited sections.
+
+The text is split into the same sections as the parse cache (each starting
+at a ``### x.y`` heading) and every section is parsed on its own with
+``parse_section``. An edit re-splits and re-parses only the sections it
+touches; document-wide checks (undefined and duplicate FRs) are kept as
+running counts that the re-parsed sections adjust, so the work per edit
+is proportional to the edited section plus the number of sections.
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .document import ParsedDocument
+from .parser import (
+    NON_FUNCTIONAL_HEADING,
+    description_pattern,
+    fr_pattern,
+    heading_pattern,
+    parse_section,
+)
+
+# Diagnostic severities, as numbered by the Language Server Protocol.
+ERROR, WARNING, INFORMATION = 1, 2, 3
+
+# The str counterpart of parser.cache.section_boundary_pattern, for stripped lines.
+section_boundary_pattern = re.compile(r"^###\s+\d+\.\d+\s+\S")
+fr_bullet_pattern = re.compile(r"^[*-]\s*(?:\*\*)?FR-\d")
+line_break_pattern = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass
+class Diagnostic:
+    line: int  # 0-based
+    severity: int
+    code: str
+    message: str
+
+
+@dataclass(eq=False)
+class Section:
+    lines: list[str]
+    document: ParsedDocument
+    stops: bool
+    # Checks that only need this section, with 0-based section-relative lines.
+    local: list[Diagnostic] = field(default_factory=list)
+    # Whether this section's FR definitions are in the document-wide counts;
+    # sections after the non-functional heading only contribute mentions.
+    counted: bool = False
+
+    @classmethod
+    def parse(cls, raw_lines: list[str]) -> "Section":
+        lines = [line.strip() for line in raw_lines]
+        document, stops = parse_section(lines)
+        return cls(lines, document, stops, _local_diagnostics(lines, document))
+
+
+def _local_diagnostics(lines: list[str], document: ParsedDocument) -> list[Diagnostic]:
+    diagnostics = []
+    defined_lines = {n for numbers in document.fr_lines.values() for n in numbers}
+    heading_lines = {}
+    has_description = False
+    # Occurrences of each FR id so far, to find a repeated id's own line.
+    seen = Counter()
+
+    for index, line in enumerate(lines):
+        heading = heading_pattern.match(line)
+        if heading:
+            level, number, title = heading.groups()
+            if (
+                len(level) == 2
+                and number == "3.0"
+                and title.lower().startswith(NON_FUNCTIONAL_HEADING)
+            ):
+                break
+            if len(level) == 3 and number.startswith("2."):
+                heading_lines[f"SR-{number.split('.')[1]}"] = index
+        elif description_pattern.match(line):
+            has_description = True
+        elif fr_bullet_pattern.match(line):
+            if not fr_pattern.match(line):
+                diagnostics.append(
+                    Diagnostic(
+                        index,
+                        WARNING,
+                        "structure",
+                        "Malformed FR bullet; expected '- FR-x.y: description'",
+                    )
+                )
+            elif index + 1 not in defined_lines:
+                diagnostics.append(
+                    Diagnostic(
+                        index,
+                        WARNING,
+                        "structure",
+                        "FR bullet is not under a '### 2.x' System Feature heading",
+                    )
+                )
+
+    for feature in document.features:
+        heading_line = heading_lines.get(feature.id, 0)
+        if not feature.functional_requirements:
+            diagnostics.append(
+                Diagnostic(
+                    heading_line,
+                    WARNING,
+                    "structure",
+                    f"{feature.id} has no Functional Requirements",
+                )
+            )
+        if not has_description:
+            diagnostics.append(
+                Diagnostic(
+                    heading_line,
+                    INFORMATION,
+                    "structure",
+                    f"{feature.id} has no **Description:** line",
+                )
+            )
+
+        sr_number = feature.id.split("-")[1]
+        expected = 1
+        for fr in feature.functional_requirements:
+            major, _, minor = fr.id[len("FR-") :].partition(".")
+            fr_line = document.fr_lines[fr.id][seen[fr.id]] - 1
+            seen[fr.id] += 1
+            if major != sr_number:
+                diagnostics.append(
+                    Diagnostic(
+                        fr_line,
+                        WARNING,
+                        "numbering",
+                        f"{fr.id} is listed under {feature.id}",
+                    )
+                )
+            elif minor != str(expected):
+                diagnostics.append(
+                    Diagnostic(
+                        fr_line,
+                        WARNING,
+                        "numbering",
+                        f"Expected FR-{sr_number}.{expected} here, found {fr.id}",
+                    )
+                )
+            if minor.isdigit():
+                expected = int(minor) + 1
+    return diagnostics
+
+
+def _split_sections(raw_lines: list[str]) -> list[Section]:
+    starts = [0] + [
+        index
+        for index in range(1, len(raw_lines))
+        if section_boundary_pattern.match(raw_lines[index].strip())
+    ]
+    ends = starts[1:] + [len(raw_lines)]
+    return [Section.parse(raw_lines[start:end]) for start, end in zip(starts, ends)]
+
+
+class IncrementalDocument:
+    def __init__(self, text: str = ""):
+        self.raw_lines = line_break_pattern.split(text)
+        self.sections: list[Section] = []
+        self._definitions: Counter[str] = Counter()
+        # FR id -> sections mentioning it, to place document-wide diagnostics.
+        self._mentioned_in: dict[str, set[Section]] = {}
+        self._splice(0, 0, _split_sections(self.raw_lines))
+
+    # -- edits -----------------------------------------------------------
+
+    def _section_starts(self) -> list[int]:
+        starts, line = [], 0
+        for section in self.sections:
+            starts.append(line)
+            line += len(section.lines)
+        return starts
+
+    def apply_change(self, text: str, start=None, end=None):
+        """Replace the text between two (line, character) positions.
+
+        Without positions the whole document is replaced. Characters are
+        code points, so callers speaking UTF-16 offsets convert first.
+        """
+        if start is None:
+            self.raw_lines = line_break_pattern.split(text)
+            self._splice(0, len(self.sections), _split_sections(self.raw_lines))
+            return
+
+        (start_line, start_char), (end_line, end_char) = start, end
+        last = len(self.raw_lines) - 1
+        start_line, end_line = min(start_line, last), min(end_line, last)
+        prefix = self.raw_lines[start_line][:start_char]
+        suffix = self.raw_lines[end_line][end_char:]
+        replacement = line_break_pattern.split(prefix + text + suffix)
+        self.raw_lines[start_line : end_line + 1] = replacement
+
+        starts = self._section_starts()
+        first = bisect_right(starts, start_line) - 1
+        if first > 0 and starts[first] == start_line:
+            # The edit may remove this section's heading, merging it upwards.
+            first -= 1
+        last_section = bisect_right(starts, end_line) - 1
+        region_start = starts[first]
+        old_end = starts[last_section] + len(self.sections[last_section].lines)
+        new_end = old_end + len(replacement) - (end_line - start_line + 1)
+        self._splice(
+            first,
+            last_section + 1,
+            _split_sections(self.raw_lines[region_start:new_end]),
+        )
+
+    def _splice(self, first: int, stop: int, new_sections: list[Section]):
+        for section in self.sections[first:stop]:
+            self._count(section, -1)
+        self.sections[first:stop] = new_sections
+        for section in new_sections:
+            self._count(section, +1)
+
+        # Re-balance definitions if the non-functional cutoff moved.
+        stopped = False
+        for section in self.sections:
+            if section.counted == stopped:
+                self._count_definitions(section, not stopped)
+            stopped = stopped or section.stops
+
+    def _count(self, section: Section, sign: int):
+        for fr_id, numbers in section.document.fr_mentions.items():
+            holders = self._mentioned_in.setdefault(fr_id, set())
+            if sign > 0:
+                holders.add(section)
+            else:
+                holders.discard(section)
+                if not holders:
+                    del self._mentioned_in[fr_id]
+        if sign < 0 and section.counted:
+            self._count_definitions(section, False)
+
+    def _count_definitions(self, section: Section, counted: bool):
+        sign = 1 if counted else -1
+        for fr_id, numbers in section.document.fr_lines.items():
+            self._definitions[fr_id] += sign * len(numbers)
+        section.counted = counted
+
+    # -- results ---------------------------------------------------------
+
+    def document(self) -> ParsedDocument:
+        """The whole document, as ``parse_document`` would return it."""
+        document = ParsedDocument()
+        line_offset = 0
+        stopped = False
+        for section in self.sections:
+            document.extend(section.document, line_offset, mentions_only=stopped)
+            stopped = stopped or section.stops
+            line_offset += len(section.lines)
+        return document
+
+    def diagnostics(self) -> list[Diagnostic]:
+        starts = {}
+        diagnostics = []
+        line = 0
+        previous_sr = 0
+        for section in self.sections:
+            starts[section] = line
+            if section.counted:
+                diagnostics.extend(
+                    Diagnostic(line + d.line, d.severity, d.code, d.message)
+                    for d in section.local
+                )
+                for feature in section.document.features:
+                    number = int(feature.id.split("-")[1])
+                    if number != previous_sr + 1:
+                        diagnostics.append(
+                            Diagnostic(
+                                line + _heading_line(section, feature.id),
+                                WARNING,
+                                "numbering",
+                                f"Expected SR-{previous_sr + 1} here, found {feature.id}",
+                            )
+                        )
+                    previous_sr = number
+            line += len(section.lines)
+
+        for fr_id in self._mentioned_in:
+            if self._definitions[fr_id]:
+                continue
+            for section in self._mentioned_in[fr_id]:
+                for number in dict.fromkeys(section.document.fr_mentions[fr_id]):
+                    diagnostics.append(
+                        Diagnostic(
+                            starts[section] + number - 1,
+                            WARNING,
+                            "mismatch",
+                            f"{fr_id} is mentioned but never defined as an FR bullet",
+                        )
+                    )
+
+        for fr_id, count in self._definitions.items():
+            if count < 2:
+                continue
+            for section in self._mentioned_in.get(fr_id, ()):
+                if not section.counted:
+                    continue
+                for number in section.document.fr_lines.get(fr_id, ()):
+                    diagnostics.append(
+                        Diagnostic(
+                            starts[section] + number - 1,
+                            ERROR,
+                            "duplicate",
+                            f"{fr_id} is defined {count} times",
+                        )
+                    )
+
+        diagnostics.sort(key=lambda d: (d.line, d.code, d.message))
+        return diagnostics
+
+
+def _heading_line(section: Section, sr_id: str) -> int:
+    number = sr_id.split("-")[1]
+    for index, line in enumerate(section.lines):
+        heading = heading_pattern.match(line)
+        if heading and heading.group(2) == f"2.{number}":
+            return index
+    return 0
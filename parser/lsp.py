@@ -0,0 +1,175 @@
+"""A minimal Language Server Protocol endpoint for requirements files.
+
+Speaks Content-Length framed JSON-RPC over a pair of binary streams and
+keeps one ``IncrementalDocument`` per open file. Editors send incremental
+``didChange`` edits; after each one the server publishes the document's
+diagnostics. Only the text synchronisation part of the protocol is served.
+"""
+
+import json
+
+from .incremental import IncrementalDocument
+
+SOURCE = "everywhere"
+# TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+METHOD_NOT_FOUND = -32601
+
+
+def _index(line: str, character: int) -> int:
+    """Convert an LSP (UTF-16) character offset into a str index."""
+    if line.isascii():
+        return character
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _utf16_length(line: str) -> int:
+    if line.isascii():
+        return len(line)
+    return sum(2 if ord(char) > 0xFFFF else 1 for char in line)
+
+
+class LanguageServer:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.documents: dict[str, IncrementalDocument] = {}
+        self.shutdown_requested = False
+
+    # -- framing ---------------------------------------------------------
+
+    def read_message(self) -> dict | None:
+        length = None
+        while True:
+            header = self.reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length))
+
+    def send(self, message: dict):
+        body = json.dumps(message).encode("utf-8")
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+        self.writer.write(body)
+        self.writer.flush()
+
+    def notify(self, method: str, params: dict):
+        self.send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    # -- dispatch --------------------------------------------------------
+
+    def serve(self) -> int:
+        """Handle messages until ``exit``; returns the process exit code."""
+        while True:
+            message = self.read_message()
+            if message is None or message.get("method") == "exit":
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
+
+    def handle(self, message: dict):
+        method = message.get("method")
+        params = message.get("params") or {}
+        handler = getattr(self, "on_" + (method or "").replace("/", "_"), None)
+        if "id" not in message:
+            if handler:
+                handler(params)
+            return
+        if handler is None:
+            self.send(
+                {
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {
+                        "code": METHOD_NOT_FOUND,
+                        "message": f"Unsupported method: {method}",
+                    },
+                }
+            )
+            return
+        self.send({"jsonrpc": "2.0", "id": message["id"], "result": handler(params)})
+
+    def on_initialize(self, params):
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": SYNC_INCREMENTAL}
+            },
+            "serverInfo": {"name": SOURCE},
+        }
+
+    def on_shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def on_textDocument_didOpen(self, params):
+        item = params["textDocument"]
+        self.documents[item["uri"]] = IncrementalDocument(item["text"])
+        self.publish(item["uri"], item.get("version"))
+
+    def on_textDocument_didChange(self, params):
+        uri = params["textDocument"]["uri"]
+        document = self.documents.get(uri)
+        if document is None:
+            return
+        for change in params["contentChanges"]:
+            edit = change.get("range")
+            if edit is None:
+                document.apply_change(change["text"])
+                continue
+            start, end = edit["start"], edit["end"]
+            lines = document.raw_lines
+            document.apply_change(
+                change["text"],
+                (start["line"], _position(lines, start)),
+                (end["line"], _position(lines, end)),
+            )
+        self.publish(uri, params["textDocument"].get("version"))
+
+    def on_textDocument_didClose(self, params):
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self.notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    def publish(self, uri: str, version=None):
+        document = self.documents[uri]
+        lines = document.raw_lines
+        params = {
+            "uri": uri,
+            "diagnostics": [
+                {
+                    "range": {
+                        "start": {"line": d.line, "character": 0},
+                        "end": {
+                            "line": d.line,
+                            "character": _utf16_length(lines[d.line]),
+                        },
+                    },
+                    "severity": d.severity,
+                    "code": d.code,
+                    "source": SOURCE,
+                    "message": d.message,
+                }
+                for d in document.diagnostics()
+            ],
+        }
+        if version is not None:
+            params["version"] = version
+        self.notify("textDocument/publishDiagnostics", params)
+
+
+def _position(lines: list[str], position: dict) -> int:
+    line = position["line"]
+    if line >= len(lines):
+        return 0
+    return _index(lines[line], position["character"])
@@ -1,7 +1,19 @@
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import InitVar, dataclass, field
+from typing import List, Optional, Set
 
-from anytype_api.client import AnytypeClient
+from anytype_api import tracing
+from anytype_api.session import get_client
+
+
+def is_fr_name(name: str) -> bool:
+    """Whether ``name`` follows the "FR-<n>.<n>" naming convention."""
+    if not name.startswith("FR-"):
+        return False
+    try:
+        [int(p) for p in name.replace("FR-", "").split(".")]
+    except ValueError:
+        return False
+    return True
 
 
 @dataclass
@@ -14,7 +26,7 @@ class API:
     api_type: str = ""
 
     def __post_init__(self):
-        client = AnytypeClient()
+        client = get_client()
         obj = client.get_object(self.space_id, self.id)["object"]
         self.name = obj.get("name", "Unknown API")
         for prop in obj.get("properties", []):
@@ -37,7 +49,7 @@ class FunctionalRequirement:
     apis: List[API] = field(default_factory=list)
 
     def __post_init__(self):
-        client = AnytypeClient()
+        client = get_client()
         obj = client.get_object(self.space_id, self.id)["object"]
         self.name = obj.get("name", "Unknown Functional Requirement")
         fr_name = obj.get("name", "")
@@ -63,9 +75,12 @@ class SystemFeature:
     description: str = ""
     custom_id: str = ""
     functional_requirements: List[FunctionalRequirement] = field(default_factory=list)
+    # When given, only these FR ids are hydrated and they are trusted to be
+    # FRs, so other backlinks are never fetched.
+    fr_ids: InitVar[Optional[Set[str]]] = None
 
-    def __post_init__(self):
-        client = AnytypeClient()
+    def __post_init__(self, fr_ids=None):
+        client = get_client()
         obj = client.get_object(self.space_id, self.id)["object"]
         self.name = obj.get("name", "Unknown System Feature")
         for prop in obj.get("properties", []):
@@ -74,28 +89,34 @@ class SystemFeature:
             elif prop.get("key") == "6829bde80dd8772c7c96a582":
                 self.custom_id = prop.get("text", "")
             elif prop.get("key") == "backlinks" and prop.get("objects"):
-                # Filter out non-Functional Requirement objects before creating them
-                fr_ids = []
-                for linked_obj_id in prop.get("objects"):
-                    linked_obj = client.get_object(self.space_id, linked_obj_id)[
-                        "object"
-                    ]
-                    if (
-                        linked_obj.get("type", {}).get("name")
-                        == "Functional Requirement"
-                    ):
-                        fr_name = linked_obj.get("name", "")
-                        if fr_name.startswith("FR-"):
-                            try:
-                                [int(p) for p in fr_name.replace("FR-", "").split(".")]
-                                fr_ids.append(linked_obj_id)
-                            except ValueError:
-                                pass  # Ignore FRs that don't conform to the naming convention
-
-                for fr_id in fr_ids:
+                with tracing.span("hydrate functional requirements", sf=self.id):
+                    self._hydrate_functional_requirements(
+                        client, prop["objects"], fr_ids
+                    )
+
+    def _hydrate_functional_requirements(self, client, linked_obj_ids, allowed_ids):
+        if allowed_ids is not None:
+            for fr_id in linked_obj_ids:
+                if fr_id in allowed_ids:
                     self.functional_requirements.append(
                         FunctionalRequirement(id=fr_id, space_id=self.space_id)
                     )
+            return
+
+        # Filter out non-Functional Requirement objects before creating them
+        fr_ids = []
+        for linked_obj_id in linked_obj_ids:
+            linked_obj = client.get_object(self.space_id, linked_obj_id)["object"]
+            linked_type = linked_obj.get("type", {}).get("name")
+            if linked_type == "Functional Requirement" and is_fr_name(
+                linked_obj.get("name", "")
+            ):
+                fr_ids.append(linked_obj_id)
+
+        for fr_id in fr_ids:
+            self.functional_requirements.append(
+                FunctionalRequirement(id=fr_id, space_id=self.space_id)
+            )
 
 
 @dataclass
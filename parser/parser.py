@@ -1,54 +1,103 @@
 import re
+from typing import Iterable
 
-from .models import FunctionalRequirement, SystemFeature
+from .document import FeatureNode, ParsedDocument, RequirementNode
 
-sr_heading_pattern = re.compile(r"^###\s+(\d+\.\d+)\s+(.+)")
+# Numbered headings of any level, e.g. "### 2.3 Reporting" or "## 3.0 Non-Functional Requirements".
+heading_pattern = re.compile(r"^(#+)\s+(\d+\.\d+)\s+(.+)")
+# FR bullets: "- FR-1.2: ...", "* FR-1.2**:** ...", "- **FR-1.2:** ..." and "- **FR-1.2**: ...".
+fr_pattern = re.compile(
+    r"^[*-]\s*(?:\*\*)?FR-(\d+\.\d+)(?:\*\*:\*\*|:\*\*|\*\*:|:)\s*(.+)"
+)
 description_pattern = re.compile(r"^\*\*\s*Description:\s*(.+)")
 stimulus_pattern = re.compile(r"^\*\*\s*Stimulus/Response Sequences:\s*")
-fr_pattern = re.compile(r"^[*-]\s*FR-(\d+\.\d+)(?:\*\*\:\*\*|:)\s*(.+)")
-non_functional_pattern = re.compile(
-    r"^##\s+3\.0\s+Non-Functional Requirements", re.IGNORECASE
-)
+# Any FR id mentioned anywhere in the document, including prose and later sections.
+fr_token_pattern = re.compile(r"\bFR-(\d+(?:\.\d+)+)(?=\b|[^.\d])")
+
+NON_FUNCTIONAL_HEADING = "non-functional requirements"
+
+
+def parse_lines(lines: Iterable[str]) -> list[FeatureNode]:
+    return parse_document(lines).features
+
+
+def parse_document(lines: Iterable[str]) -> ParsedDocument:
+    """Parse features and collect every FR id mention in a single pass."""
+    document = ParsedDocument()
+    _scan(lines, document)
+    return document
 
 
-def parse_lines(lines: list[str]) -> list[SystemFeature]:
-    features = []
+def parse_section(lines: Iterable[str]) -> tuple[ParsedDocument, bool]:
+    """Parse one section of a document in isolation.
+
+    Line numbers in the result are relative to the section's first line.
+    The flag is True when the section contains the non-functional heading,
+    after which nothing else in the document is parsed.
+    """
+    document = ParsedDocument()
+    parsing = _scan(lines, document)
+    return document, not parsing
+
+
+def _scan(lines: Iterable[str], document: ParsedDocument) -> bool:
+    features = document.features
+    fr_lines = document.fr_lines
+    fr_mentions = document.fr_mentions
     current_sr = None
     parsing = True
 
-    for line in lines:
-        if non_functional_pattern.match(line):
-            parsing = False
-            continue
+    for line_no, line in enumerate(lines, start=1):
+        if "FR-" in line:
+            for match in fr_token_pattern.findall(line):
+                fr_mentions.setdefault(f"FR-{match}", []).append(line_no)
 
         if not parsing:
             continue
 
-        sr_match = sr_heading_pattern.match(line)
-        fr_match = fr_pattern.match(line)
+        # Dispatch on the leading character so each line is matched against
+        # at most one pattern; most lines are prose and match none.
+        lead = line[:1]
+
+        if lead == "#":
+            heading = heading_pattern.match(line)
+            if not heading:
+                continue
+            level = len(heading.group(1))
+            number = heading.group(2)
+            title = heading.group(3)
 
-        if sr_match:
-            sr_number = sr_match.group(1)
-            sr_desc = sr_match.group(2).replace("**", "").strip()
+            if (
+                level == 2
+                and number == "3.0"
+                and title.lower().startswith(NON_FUNCTIONAL_HEADING)
+            ):
+                # Nothing after the non-functional section is parsed, but FR
+                # mentions there still count for validation.
+                parsing = False
+                continue
 
-            if sr_number.startswith("2."):
-                sr_id = f"SR-{sr_number.split('.')[1]}"
-                current_sr = SystemFeature(id=sr_id, description=sr_desc)
-                features.append(current_sr)
-            else:
-                current_sr = None
+            if level == 3:
+                if number.startswith("2."):
+                    sr_id = f"SR-{number.split('.')[1]}"
+                    sr_desc = title.replace("**", "").strip()
+                    current_sr = FeatureNode(id=sr_id, description=sr_desc)
+                    features.append(current_sr)
+                else:
+                    current_sr = None
             continue
 
-        if fr_match and current_sr:
-            fr_number = fr_match.group(1)
-            fr_desc = fr_match.group(2)
-            fr_id = f"FR-{fr_number}"
-            fr_obj = FunctionalRequirement(
-                id=fr_id,
-                linked_sr=current_sr.id,
-                completion_state="To Do",
-                description=fr_desc,
-            )
-            current_sr.functional_requirements.append(fr_obj)
-
-    return features
+        if (lead == "-" or lead == "*") and current_sr:
+            fr_match = fr_pattern.match(line)
+            if fr_match:
+                fr_id = f"FR-{fr_match.group(1)}"
+                fr_obj = RequirementNode(
+                    id=fr_id,
+                    linked_sr=current_sr.id,
+                    completion_state="To Do",
+                    description=fr_match.group(2),
+                )
+                current_sr.functional_requirements.append(fr_obj)
+                fr_lines.setdefault(fr_id, []).append(line_no)
+
+    return parsing
@@ -0,0 +1,22 @@
+"""Convert parsed requirement nodes into Anytype object payloads."""
+
+from .document import FeatureNode, RequirementNode
+
+
+def system_feature_payload(feature: FeatureNode, type_key: str) -> dict:
+    return {
+        "type_key": type_key,
+        "name": feature.id,
+        "properties": [{"key": "description", "text": feature.description}],
+    }
+
+
+def functional_requirement_payload(fr: RequirementNode, type_key: str) -> dict:
+    return {
+        "type_key": type_key,
+        "name": fr.id,
+        "properties": [
+            {"key": "description", "text": fr.description},
+            {"key": "status", "select": fr.completion_state},
+        ],
+    }
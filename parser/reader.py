@@ -1,3 +1,54 @@
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Iterator
+
+# The line endings text-mode open() recognises; str.splitlines also splits
+# on form feeds, \x1c-\x1e, \x85 and \u2028, which open() does not.
+newline_pattern = re.compile(r"\r\n|\r|\n")
+
+
+@contextmanager
+def map_markdown(filepath: str) -> Iterator[bytes]:
+    """Memory-map a markdown file read-only.
+
+    The yielded object supports the buffer protocol, so ``re`` patterns
+    compiled from bytes can scan it without copying the file into memory.
+    """
+    with open(filepath, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def split_lines(text: str) -> list[str]:
+    """Split ``text`` into lines the way text-mode ``open()`` reads them."""
+    lines = newline_pattern.split(text)
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def iter_markdown(filepath: str) -> Iterator[str]:
+    """Lazily yield the stripped lines of a markdown file.
+
+    Lines end at ``\n``, ``\r\n`` or a bare ``\r``, as with text-mode
+    ``open()``.
+    """
+    with map_markdown(filepath) as mapped:
+        if not mapped:
+            return
+        for raw in iter(mapped.readline, b""):
+            for line in split_lines(raw.decode("utf-8")):
+                yield line.strip()
+
+
 def read_markdown(filepath: str) -> list[str]:
-    with open(filepath, "r") as file:
-        return [line.strip() for line in file.readlines()]
+    return list(iter_markdown(filepath))
@@ -1,7 +1,7 @@
-import re
+from .document import FeatureNode, ParsedDocument
 
 
-def print_stats(features):
+def print_stats(features: list[FeatureNode]):
     total_srs = len(features)
     total_frs = sum(len(sr.functional_requirements) for sr in features)
 
@@ -21,16 +21,22 @@ def print_stats(features):
     print("-" * 40)
 
 
-def validate_frs(features, md_text):
-    total_frs = sum(len(sr.functional_requirements) for sr in features)
+def _format_lines(line_numbers):
+    label = "line" if len(line_numbers) == 1 else "lines"
+    return f"{label} {', '.join(str(n) for n in line_numbers)}"
 
-    fr_pattern = re.compile(r"\bFR-(\d+(?:\.\d+)+)(?=\b|[^.\d])")
-    fr_ids_in_md = set(f"FR-{match}" for match in fr_pattern.findall(md_text))
 
-    fr_ids_in_json = set()
-    for sr in features:
-        for fr in sr.functional_requirements:
-            fr_ids_in_json.add(fr.id)
+def validate_frs(document: ParsedDocument):
+    """Compare parsed FRs with every FR id mentioned in the markdown.
+
+    Both sets are collected by ``parser.parser.parse_document`` in the same
+    pass, so this is a set comparison with no rescan of the file.
+    """
+    features = document.features
+    total_frs = sum(len(sr.functional_requirements) for sr in features)
+
+    fr_ids_in_md = set(document.fr_mentions)
+    fr_ids_in_json = set(document.fr_lines)
 
     if len(fr_ids_in_md) != total_frs or fr_ids_in_md != fr_ids_in_json:
         print(f"\n⚠️  WARNING: Mismatch in FR count or content!")
@@ -41,7 +47,7 @@ def validate_frs(features, md_text):
         if missing_in_json:
             print(f"- FRs missing from parsed JSON ({len(missing_in_json)}):")
             for fr_id in sorted(missing_in_json):
-                print(f"  - {fr_id}")
+                print(f"  - {fr_id} ({_format_lines(document.fr_mentions[fr_id])})")
 
         extra_in_json = fr_ids_in_json - fr_ids_in_md
         if extra_in_json:
@@ -49,4 +55,38 @@ def validate_frs(features, md_text):
                 f"- Extra FRs in JSON not detected in markdown ({len(extra_in_json)}):"
             )
             for fr_id in sorted(extra_in_json):
-                print(f"  - {fr_id}")
+                print(f"  - {fr_id} ({_format_lines(document.fr_lines[fr_id])})")
+
+        duplicated = {
+            fr_id: line_numbers
+            for fr_id, line_numbers in document.fr_lines.items()
+            if len(line_numbers) > 1
+        }
+        if duplicated:
+            print(f"- FRs parsed more than once ({len(duplicated)}):")
+            for fr_id in sorted(duplicated):
+                print(f"  - {fr_id} ({_format_lines(duplicated[fr_id])})")
+
+
+def print_file_timings(timings):
+    print("\n⏱️  Parse time per file:")
+    for path, elapsed in timings.items():
+        print(f"- {path}: {elapsed * 1000:.1f} ms")
+    print(f"- Total (summed across workers): {sum(timings.values()) * 1000:.1f} ms")
+
+
+def print_duplicate_frs(duplicates):
+    if not duplicates:
+        return
+    print(f"\n⚠️  WARNING: FRs defined in more than one file ({len(duplicates)}):")
+    for fr_id in sorted(duplicates):
+        locations = ", ".join(f"{path}:{line_no}" for path, line_no in duplicates[fr_id])
+        print(f"  - {fr_id} ({locations})")
+
+
+def print_duplicate_srs(duplicates):
+    if not duplicates:
+        return
+    print(f"\n⚠️  WARNING: SRs defined in more than one file ({len(duplicates)}):")
+    for sr_id in sorted(duplicates):
+        print(f"  - {sr_id} ({', '.join(duplicates[sr_id])})")
@@ -0,0 +1,38 @@
+"""Merging requirements parsed from several files."""
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.synthetic import requirements_markdown
+from parser.batch import load_features, parse_files
+
+
+@pytest.fixture
+def specs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "specs").mkdir()
+    # Both files number their features from 2.1, so both define SR-1 and SR-2.
+    for name in ("a.md", "b.md"):
+        (tmp_path / "specs" / name).write_text(requirements_markdown(2, 1))
+    return "specs"
+
+
+def test_sr_collisions_are_reported(specs):
+    batch = parse_files(["specs/a.md", "specs/b.md"], max_workers=1)
+    assert batch.duplicate_srs() == {
+        "SR-1": ["specs/a.md", "specs/b.md"],
+        "SR-2": ["specs/a.md", "specs/b.md"],
+    }
+    with pytest.raises(ValueError, match="SR-1 in specs/a.md, specs/b.md"):
+        load_features(specs, max_workers=1)
+
+
+def test_create_refuses_colliding_files(specs):
+    from main import cli
+
+    # The collision is found while parsing, before any client is created.
+    result = CliRunner().invoke(
+        cli, ["create-objects", "--space-name", "Everywhere", "--file-path", specs]
+    )
+    assert result.exception is None, result.output
+    assert "Error: SR ids defined in more than one file" in result.output
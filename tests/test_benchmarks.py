@@ -0,0 +1,24 @@
+"""The benchmark runner refuses to time failed runs."""
+
+import click
+import pytest
+
+from benchmarks.run import measure
+
+
+def test_error_output_fails_the_benchmark():
+    with pytest.raises(click.ClickException, match="Space 'x' not found"):
+        measure("report", lambda: print("Error: Space 'x' not found."))
+
+
+def test_exceptions_fail_the_benchmark():
+    def fail():
+        raise FileNotFoundError("requirements.md")
+
+    with pytest.raises(click.ClickException, match="requirements.md"):
+        measure("parse", fail, trace_memory=False)
+
+
+def test_successful_runs_are_measured():
+    result = measure("noop", lambda: print("done"))
+    assert result["name"] == "noop" and result["peak_memory_bytes"] is not None
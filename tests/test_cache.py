@@ -0,0 +1,37 @@
+"""The parse cache stores plain data and survives damaged entries."""
+
+import json
+
+from benchmarks.synthetic import requirements_markdown
+from parser.cache import load_document
+from parser.parser import parse_document
+
+TEXT = requirements_markdown(3, 2)
+
+
+def _parse(tmp_path):
+    return load_document(str(tmp_path / "requirements.md"), str(tmp_path / "cache"))
+
+
+def test_cache_is_json_and_rebuilds_nodes(tmp_path):
+    (tmp_path / "requirements.md").write_text(TEXT)
+    expected = parse_document(line.strip() for line in TEXT.splitlines())
+
+    _parse(tmp_path)
+    [cache_file] = (tmp_path / "cache").iterdir()
+    assert cache_file.suffix == ".json"
+    json.loads(cache_file.read_text())
+
+    document = _parse(tmp_path)
+    assert document.features == expected.features
+    assert document.fr_lines == expected.fr_lines
+
+
+def test_unreadable_cache_is_a_miss(tmp_path):
+    (tmp_path / "requirements.md").write_text(TEXT)
+    _parse(tmp_path)
+    [cache_file] = (tmp_path / "cache").iterdir()
+    cache_file.write_bytes(b"\x80\x04not json")
+
+    document = _parse(tmp_path)
+    assert [feature.id for feature in document.features] == ["SR-1", "SR-2", "SR-3"]
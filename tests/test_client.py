@@ -0,0 +1,67 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.fake_anytype import SPACE_ID, FakeAnytype
+from benchmarks.synthetic import space_objects
+
+CALLERS = 8
+GET_OBJECT = "GET /v1/spaces/{space_id}/objects/{object_id}"
+
+
+class SlowFakeAnytype(FakeAnytype):
+    """Hold every response until all callers have had time to ask for it."""
+
+    def handle(self, method, path, query, body):
+        time.sleep(0.2)
+        return super().handle(method, path, query, body)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    with SlowFakeAnytype(space_objects(1, 1)) as fake:
+        yield fake
+
+
+def fetch_concurrently(fn):
+    barrier = threading.Barrier(CALLERS)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        futures = [executor.submit(call) for _ in range(CALLERS)]
+        return [future.result() for future in futures]
+
+
+def test_concurrent_identical_gets_share_one_request(fake):
+    client = fake.client()
+    results = fetch_concurrently(lambda: client.get_object(SPACE_ID, "fr-1-1"))
+    assert fake.requests[GET_OBJECT] == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_concurrent_failures_are_shared(fake):
+    client = fake.client()
+    outcomes = fetch_concurrently(
+        lambda: pytest.raises(Exception, client.get_object, SPACE_ID, "missing")
+    )
+    assert fake.requests[GET_OBJECT] == 1
+    assert all("404" in str(outcome.value) for outcome in outcomes)
+
+
+def test_sequential_gets_are_not_merged(fake):
+    client = fake.client()
+    client.get_object(SPACE_ID, "fr-1-1")
+    client.get_object(SPACE_ID, "fr-1-1")
+    assert fake.requests[GET_OBJECT] == 2
+
+
+def test_writes_are_never_merged(fake):
+    client = fake.client()
+    fetch_concurrently(lambda: client.update_object("fr-1-1", {"name": "FR-1.1"}))
+    assert fake.requests["PATCH /v1/objects/{object_id}"] == CALLERS
@@ -0,0 +1,163 @@
+"""Coverage queries over a small space with known answers."""
+
+import pytest
+from click.testing import CliRunner
+
+from anytype_api.graph import API, FR, SF, RelationGraph
+from anytype_api.keys import API_FUNCTIONAL_REQUIREMENTS_KEY, FR_SYSTEM_FEATURE_KEY
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import SPACE_ID, SPACE_NAME, FakeAnytype
+from benchmarks.synthetic import API_TYPE, FR_TYPE, SF_TYPE
+
+
+def _status(value):
+    return {"key": "status", "name": "Status", "select": {"name": value}}
+
+
+def _object(object_id, object_type, properties):
+    return {
+        "id": object_id,
+        "name": object_id,
+        "type": object_type,
+        "properties": properties,
+    }
+
+
+def sf(object_id, backlinks=()):
+    properties = [{"key": "backlinks", "objects": list(backlinks)}]
+    return _object(object_id, SF_TYPE, properties)
+
+
+def fr(object_id, status, sf_id=None):
+    properties = [_status(status)]
+    if sf_id:
+        properties.append({"key": FR_SYSTEM_FEATURE_KEY, "objects": [sf_id]})
+    return _object(object_id, FR_TYPE, properties)
+
+
+def api(object_id, status, api_type, fr_id=None):
+    properties = [
+        _status(status),
+        {"key": "api_type", "name": "API Type", "select": {"name": api_type}},
+    ]
+    if fr_id:
+        properties.append(
+            {"key": API_FUNCTIONAL_REQUIREMENTS_KEY, "objects": [fr_id]}
+        )
+    return _object(object_id, API_TYPE, properties)
+
+
+# sf-a: fr-1 and fr-2, both Done (fr-2 only through the SF's backlinks).
+# sf-b: fr-3 (To Do) and fr-4 (Done). sf-c has no FRs; fr-5 has no SF.
+# fr-1 has a Done and a To Do API, fr-3 a Done one, fr-4 a To Do one;
+# api-4 links no FR.
+OBJECTS = [
+    sf("sf-a", backlinks=["fr-2"]),
+    sf("sf-b"),
+    sf("sf-c"),
+    fr("fr-1", "Done", "sf-a"),
+    fr("fr-2", "Done"),
+    fr("fr-3", "To Do", "sf-b"),
+    fr("fr-4", "Done", "sf-b"),
+    fr("fr-5", "To Do"),
+    api("api-1", "Done", "GET", "fr-1"),
+    api("api-2", "To Do", "POST", "fr-1"),
+    api("api-3", "Done", "GET", "fr-3"),
+    api("api-4", "To Do", "GET"),
+    api("api-5", "To Do", "POST", "fr-4"),
+]
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    with FakeAnytype(OBJECTS, page_size=4) as fake:
+        yield fake
+
+
+@pytest.fixture
+def graph(fake):
+    return RelationGraph.load(fake.client(), SPACE_ID)
+
+
+def names(graph, kind, nodes):
+    return sorted(graph.names[kind][node] for node in nodes)
+
+
+def test_coverage_queries(graph):
+    assert names(graph, FR, graph.frs_without_api()) == ["fr-2", "fr-5"]
+    assert names(graph, FR, graph.frs_without_sf()) == ["fr-5"]
+    assert names(graph, API, graph.orphan_apis()) == ["api-4"]
+    assert names(graph, SF, graph.done_system_features()) == ["sf-a"]
+    assert {
+        graph.names[SF][sf]: (frs, done, with_api)
+        for sf, frs, done, with_api in graph.coverage_matrix()
+    } == {"sf-a": (2, 2, 1), "sf-b": (2, 1, 2), "sf-c": (0, 0, 0)}
+
+
+def test_coverage_command(fake):
+    from main import cli
+
+    with use_client(fake.client()):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "coverage",
+                "--space-name",
+                SPACE_NAME,
+                "--show",
+                "orphan-apis",
+                "--show",
+                "done-sfs",
+            ],
+        )
+    assert result.exception is None, result.output
+    assert "--- System Features with every FR Done (1) ---\n- sf-a" in result.output
+    assert "--- APIs not linked to an FR (1) ---\n- api-4" in result.output
+
+
+def test_status_rollup(graph):
+    pytest.importorskip("numpy")
+    from anytype_api.rollup import StatusRollup
+
+    rollup = StatusRollup.from_graph(graph)
+    by_sf = {sf["name"]: sf for sf in rollup.to_dict(graph)["system_features"]}
+    assert {name: sf["by_status"] for name, sf in by_sf.items()} == {
+        "sf-a": {"Done": 2, "To Do": 0},
+        "sf-b": {"Done": 1, "To Do": 1},
+        "sf-c": {"Done": 0, "To Do": 0},
+    }
+    # sf-c has no FRs, so it is 0% Done rather than a division by zero.
+    assert {name: sf["percent_done"] for name, sf in by_sf.items()} == {
+        "sf-a": 100.0,
+        "sf-b": 50.0,
+        "sf-c": 0.0,
+    }
+
+    # fr-3's only API is Done, fr-1 has one of two, fr-4 none of its one;
+    # fr-2 and fr-5 have no APIs.
+    assert rollup.api_completion() == {
+        "all_done": 1,
+        "some_done": 1,
+        "none_done": 1,
+        "no_apis": 2,
+    }
+    summary = rollup.summary()
+    assert (summary["functional_requirements"], summary["frs_done"]) == (5, 3)
+    assert summary["percent_frs_done"] == 60.0
+    assert (summary["apis"], summary["apis_done"]) == (5, 2)
+    assert summary["percent_apis_done"] == 40.0
+    assert summary["apis_by_type"] == {"GET": 3, "POST": 2}
+
+
+def test_status_rollup_of_empty_space(monkeypatch):
+    pytest.importorskip("numpy")
+    from anytype_api.rollup import StatusRollup
+
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    with FakeAnytype([]) as fake:
+        graph = RelationGraph.load(fake.client(), SPACE_ID)
+    summary = StatusRollup.from_graph(graph).summary()
+    assert summary["functional_requirements"] == 0
+    assert summary["percent_frs_done"] == 0.0
+    assert summary["percent_apis_done"] == 0.0
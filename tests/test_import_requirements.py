@@ -0,0 +1,39 @@
+"""import-requirements finds the System Features a heading names."""
+
+from click.testing import CliRunner
+
+from anytype_api.keys import FR_SYSTEM_FEATURE_KEY
+from anytype_api.session import use_client
+from anytype_api.space_index import get_property
+from benchmarks.fake_anytype import FakeAnytype
+from benchmarks.synthetic import SF_TYPE, requirements_markdown
+
+
+def _sf(object_id, name):
+    return {"id": object_id, "name": name, "type": SF_TYPE, "properties": []}
+
+
+def test_sfs_are_found_despite_case_spacing_and_extra_words(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "requirements.md").write_text(requirements_markdown(2, 1))
+    from main import cli
+
+    objects = [
+        # Differs from the heading "Synthetic Feature 1" in case and spacing.
+        _sf("sf-1", "synthetic  FEATURE 1"),
+        # Only found by the full-text search fallback.
+        _sf("sf-2", "Synthetic Feature 2 (legacy)"),
+    ]
+    with FakeAnytype(objects) as fake, use_client(fake.client()):
+        result = CliRunner().invoke(cli, ["import-requirements"], input="y\ny\n")
+        created = {
+            obj["name"]: get_property(obj, FR_SYSTEM_FEATURE_KEY)["objects"]
+            for obj in fake.objects.values()
+            if obj["name"].startswith("FR-")
+        }
+        sf_count = sum(obj["type"] == SF_TYPE for obj in fake.objects.values())
+
+    assert "not found" not in result.output, result.output
+    assert created == {"FR-1.1": ["sf-1"], "FR-2.1": ["sf-2"]}
+    assert sf_count == 2
@@ -0,0 +1,145 @@
+"""Incremental parsing and the stdio language server behind ``serve``."""
+
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.synthetic import requirements_markdown
+from parser.incremental import IncrementalDocument
+from parser.parser import parse_document
+
+ROOT = Path(__file__).resolve().parent.parent
+FR_1_2 = "- FR-1.2: The system shall handle case 2 of feature 1."
+SNIPPETS = [
+    "x",
+    "\n",
+    "### 2.9 Inserted feature\n",
+    "- FR-1.7: A duplicate\n",
+    "## 3.0 Non-Functional Requirements\n",
+    "see FR-9.9 ",
+    "- FR-",
+    "",
+]
+
+
+def test_edits_match_a_full_parse():
+    document = IncrementalDocument(requirements_markdown(10, 4))
+    rng = random.Random(0)
+    for _ in range(500):
+        lines = document.raw_lines
+        start_line = rng.randrange(len(lines))
+        end_line = min(start_line + (rng.random() < 0.2), len(lines) - 1)
+        start = (start_line, rng.randrange(len(lines[start_line]) + 1))
+        end = (end_line, rng.randrange(len(lines[end_line]) + 1))
+        document.apply_change(rng.choice(SNIPPETS), start, max(start, end))
+
+        expected = parse_document(line.strip() for line in document.raw_lines)
+        actual = document.document()
+        assert actual.features == expected.features
+        assert actual.fr_lines == expected.fr_lines
+        assert actual.fr_mentions == expected.fr_mentions
+
+        fresh = IncrementalDocument("\n".join(document.raw_lines))
+        assert document.diagnostics() == fresh.diagnostics()
+
+
+def codes(document):
+    return {(d.line, d.code) for d in document.diagnostics()}
+
+
+def test_diagnostics():
+    document = IncrementalDocument(requirements_markdown(2, 2))
+    assert document.diagnostics() == []
+    fr_line = document.raw_lines.index(FR_1_2)
+
+    document.apply_change("FR-1.1", (fr_line, 2), (fr_line, 8))
+    assert codes(document) == {
+        (fr_line - 1, "duplicate"),
+        (fr_line, "duplicate"),
+        (fr_line, "numbering"),
+    }
+
+    document.apply_change("FR-2.5", (fr_line, 2), (fr_line, 8))
+    assert codes(document) == {(fr_line, "numbering")}
+
+    document.apply_change("See FR-4.1.", (fr_line, 0), (fr_line, len("- FR-2.5:")))
+    assert codes(document) == {(fr_line, "mismatch")}
+
+
+def frame(message):
+    body = json.dumps(message).encode()
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def read_frame(stream):
+    length = int(stream.readline().split(b":")[1])
+    stream.readline()
+    return json.loads(stream.read(length))
+
+
+def test_serve_publishes_diagnostics_for_edits():
+    text = requirements_markdown(2, 2)
+    fr_line = text.split("\n").index(FR_1_2)
+    uri = "file:///requirements.md"
+    server = subprocess.Popen(
+        [sys.executable, "main.py", "serve"],
+        cwd=ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    try:
+        server.stdin.write(frame({"jsonrpc": "2.0", "id": 1, "method": "initialize"}))
+        server.stdin.write(
+            frame(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didOpen",
+                    "params": {
+                        "textDocument": {"uri": uri, "version": 1, "text": text}
+                    },
+                }
+            )
+        )
+        server.stdin.write(
+            frame(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {"uri": uri, "version": 2},
+                        "contentChanges": [
+                            {
+                                "range": {
+                                    "start": {"line": fr_line, "character": 7},
+                                    "end": {"line": fr_line, "character": 8},
+                                },
+                                "text": "1",
+                            }
+                        ],
+                    },
+                }
+            )
+        )
+        server.stdin.flush()
+
+        initialized = read_frame(server.stdout)
+        assert initialized["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+        opened = read_frame(server.stdout)["params"]
+        assert opened["version"] == 1 and opened["diagnostics"] == []
+        changed = read_frame(server.stdout)["params"]
+        assert changed["version"] == 2
+        assert {d["code"] for d in changed["diagnostics"]} == {"duplicate", "numbering"}
+        assert {d["range"]["start"]["line"] for d in changed["diagnostics"]} == {
+            fr_line - 1,
+            fr_line,
+        }
+
+        server.stdin.write(frame({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}))
+        server.stdin.write(frame({"jsonrpc": "2.0", "method": "exit"}))
+        server.stdin.flush()
+        assert read_frame(server.stdout) == {"jsonrpc": "2.0", "id": 2, "result": None}
+        assert server.wait(timeout=10) == 0
+    finally:
+        server.kill()
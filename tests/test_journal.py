@@ -0,0 +1,88 @@
+"""Resumable writes recorded in the run journal."""
+
+import pytest
+from click.testing import CliRunner
+
+from anytype_api.bulk import update_objects
+from anytype_api.journal import Journal
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import SPACE_NAME, FakeAnytype
+
+UPDATE = "PATCH /v1/objects/{object_id}"
+CREATE = "POST /v1/spaces/{space_id}/objects"
+
+
+def test_updates_are_journaled_and_skipped_on_resume(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    objects = [
+        {"id": f"obj-{n}", "name": f"SR-{n}", "type": {}, "properties": []}
+        for n in range(3)
+    ]
+    items = [
+        (f"sf:SR-{n}", f"obj-{n}", {"properties": [{"key": "description"}]})
+        for n in range(3)
+    ]
+    with FakeAnytype(objects) as fake:
+        with Journal.open("run", directory=str(tmp_path)) as journal:
+            results = update_objects(fake.client(), items[:2], journal=journal)
+        assert all(r.ok and not r.resumed for r in results)
+
+        fake.reset_counts()
+        with Journal.open("run", resume=True, directory=str(tmp_path)) as journal:
+            results = update_objects(fake.client(), items, journal=journal)
+        assert [r.resumed for r in results] == [True, True, False]
+        assert fake.requests[UPDATE] == 1
+
+
+def test_unconfirmed_steps_are_reported(tmp_path):
+    with Journal.open("run", directory=str(tmp_path)) as journal:
+        journal.planned("fr:a.md:FR-1.1", "create")
+        journal.planned("fr:a.md:FR-1.2", "create")
+        journal.done("fr:a.md:FR-1.1", "create", "obj-1")
+    with Journal.open("run", resume=True, directory=str(tmp_path)) as journal:
+        assert journal.unconfirmed == ["fr:a.md:FR-1.2"]
+
+
+# The two files are parsed on a forked pool while the stand-in server's
+# thread is idle.
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_steps_are_scoped_to_their_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "specs").mkdir()
+    # Different SRs, but both files number their FR FR-1.1.
+    for name, number in (("a.md", 1), ("b.md", 2)):
+        (tmp_path / "specs" / name).write_text(
+            f"### 2.{number} Feature {number}\n- FR-1.1: Requirement in {name}\n"
+        )
+    from main import cli
+
+    args = ["create-objects", "--space-name", SPACE_NAME, "--file-path", "specs"]
+    with FakeAnytype([]) as fake, use_client(fake.client()):
+        result = CliRunner().invoke(cli, [*args, "--max-workers", "1"])
+        assert "Created 4 objects" in result.output, result.output
+        assert fake.requests[CREATE] == 4
+
+        fake.reset_counts()
+        result = CliRunner().invoke(cli, [*args, "--resume"])
+        assert "Resuming: 4 objects already created." in result.output
+        assert fake.requests[CREATE] == 0
+
+
+def test_records_after_a_partial_line_survive_resume(tmp_path):
+    with Journal.open("run", directory=str(tmp_path)) as journal:
+        journal.done("sf:a.md:SR-1", "create", "obj-1")
+        journal.done("sf:a.md:SR-2", "create", "obj-2")
+    # A run killed mid-write leaves the last record cut short.
+    with open(journal.path, "rb+") as f:
+        f.truncate(f.seek(0, 2) - 10)
+
+    with Journal.open("run", resume=True, directory=str(tmp_path)) as journal:
+        assert journal.completed == {"sf:a.md:SR-1": "obj-1"}
+        journal.done("sf:a.md:SR-2", "create", "obj-3")
+
+    with Journal.open("run", resume=True, directory=str(tmp_path)) as journal:
+        assert journal.completed == {
+            "sf:a.md:SR-1": "obj-1",
+            "sf:a.md:SR-2": "obj-3",
+        }
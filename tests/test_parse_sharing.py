@@ -0,0 +1,57 @@
+"""Composite commands parse each requirements file once per invocation."""
+
+import pytest
+from click.testing import CliRunner
+
+import parser.batch
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import SPACE_NAME, FakeAnytype
+from benchmarks.synthetic import requirements_markdown, space_objects
+
+
+@pytest.fixture
+def parses(tmp_path, monkeypatch):
+    """Count the files parsed while a test runs."""
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "requirements.md").write_text(requirements_markdown(3, 2))
+
+    parsed = []
+    parse_file = parser.batch._parse_file
+
+    def counting_parse_file(path, use_cache):
+        parsed.append(path)
+        return parse_file(path, use_cache)
+
+    monkeypatch.setattr(parser.batch, "_parse_file", counting_parse_file)
+    return parsed
+
+
+def invoke(args, objects=(), input=None):
+    from main import cli
+
+    with FakeAnytype(objects) as fake, use_client(fake.client()):
+        result = CliRunner().invoke(cli, args, input=input)
+    assert result.exception is None, result.output
+    assert "Error" not in result.output, result.output
+    return result
+
+
+def test_create_parses_once(parses):
+    invoke(["create", "--space-name", SPACE_NAME])
+    assert parses == ["requirements.md"]
+
+
+def test_import_requirements_parses_once(parses):
+    invoke(
+        ["import-requirements", "--requirements-file", "requirements.md"],
+        space_objects(3, 0),
+        input="y\n" * 6,
+    )
+    assert parses == ["requirements.md"]
+
+
+def test_separate_invocations_parse_again(parses):
+    invoke(["validate"])
+    invoke(["validate"])
+    assert parses == ["requirements.md", "requirements.md"]
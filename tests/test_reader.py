@@ -0,0 +1,40 @@
+"""Reading requirements files with any line ending."""
+
+import pytest
+
+from benchmarks.synthetic import requirements_markdown
+from parser.cache import load_document
+from parser.parser import parse_document
+from parser.reader import read_markdown
+
+TEXT = requirements_markdown(3, 2)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_line_endings_parse_alike(tmp_path, newline):
+    path = tmp_path / "requirements.md"
+    path.write_bytes(TEXT.replace("\n", newline).encode("utf-8"))
+    expected = parse_document(line.strip() for line in TEXT.splitlines())
+
+    assert read_markdown(str(path)) == [line.strip() for line in TEXT.splitlines()]
+    for _ in range(2):  # a fresh parse, then one assembled from the cache
+        document = load_document(str(path), cache_dir=str(tmp_path / "cache"))
+        assert document.features == expected.features
+        assert document.fr_lines == expected.fr_lines
+        assert document.fr_mentions == expected.fr_mentions
+
+
+@pytest.mark.parametrize("separator", ["\x0c", "\x1c", "\x85", "\u2028"])
+def test_only_line_endings_split_lines(tmp_path, separator):
+    # A form feed or other Unicode separator inside a line must not shift the
+    # line numbers of the FRs after it.
+    text = TEXT.replace("## 1.0 Introduction", f"## 1.0{separator}Introduction")
+    path = tmp_path / "requirements.md"
+    path.write_text(text, encoding="utf-8", newline="")
+    with open(path, encoding="utf-8") as f:
+        expected_lines = [line.strip() for line in f]
+
+    assert read_markdown(str(path)) == expected_lines
+    expected = parse_document(expected_lines)
+    document = load_document(str(path), cache_dir=str(tmp_path / "cache"))
+    assert document.fr_lines == expected.fr_lines
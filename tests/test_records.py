@@ -0,0 +1,161 @@
+"""Machine-readable listings: projection, formats and page-by-page writes."""
+
+import csv
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import FakeAnytype
+from benchmarks.synthetic import space_objects
+from commands.records import RecordWriter
+
+API = {
+    "id": "api-1",
+    "name": "/users",
+    "type": {"key": "api", "name": "API"},
+    "properties": [
+        {"key": "status", "name": "Status", "select": {"name": "Done"}},
+        {"key": "tags", "name": "Tags", "multi_select": [{"name": "a"}, {"name": "b"}]},
+        {"key": "description", "name": "Description", "text": "Lists, users"},
+    ],
+}
+
+
+class PageStream(io.StringIO):
+    """Records the text flushed after each write."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+
+    def flush(self):
+        self.flushed.append(self.getvalue())
+
+
+def test_projection_and_formats():
+    stream = io.StringIO()
+    RecordWriter("jsonl", "id,Status,tags,type_key,missing", stream).write_page([API])
+    assert json.loads(stream.getvalue()) == {
+        "id": "api-1",
+        "Status": "Done",
+        "tags": ["a", "b"],
+        "type_key": "api",
+        "missing": "",
+    }
+
+    stream = io.StringIO()
+    RecordWriter("csv", "name,description,tags", stream).write_page([API])
+    assert list(csv.reader(io.StringIO(stream.getvalue()))) == [
+        ["name", "description", "tags"],
+        ["/users", "Lists, users", "a,b"],
+    ]
+
+    stream = io.StringIO()
+    RecordWriter("tsv", "name,status", stream).write_page([API])
+    assert stream.getvalue() == "name\tstatus\n/users\tDone\n"
+
+
+def test_each_page_is_flushed_as_it_is_written():
+    stream = PageStream()
+    writer = RecordWriter("jsonl", "id", stream)
+    writer.write_page([API])
+    writer.write_page([API, API])
+    assert [text.count("\n") for text in stream.flushed] == [1, 3]
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "csv", "tsv"])
+def test_list_objects_streams_every_page(monkeypatch, output_format):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    from main import cli
+
+    objects = space_objects(3, 4)
+    with FakeAnytype(objects, page_size=5) as fake, use_client(fake.client()):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "list-objects",
+                "--type-keys",
+                "Functional Requirement",
+                "--format",
+                output_format,
+                "--fields",
+                "name,status",
+            ],
+        )
+    assert result.exception is None, result.output
+    lines = result.output.splitlines()
+    if output_format == "jsonl":
+        records = [json.loads(line) for line in lines]
+    else:
+        delimiter = "\t" if output_format == "tsv" else ","
+        records = list(csv.DictReader(lines, delimiter=delimiter))
+    assert [record["name"] for record in records] == [
+        f"FR-{sf}.{fr}" for sf in range(1, 4) for fr in range(1, 5)
+    ]
+    assert {record["status"] for record in records} == {"To Do", "Done"}
+
+
+@pytest.fixture
+def invoke(monkeypatch, tmp_path):
+    """Invoke the CLI against a small fake space, keeping stdout and stderr apart."""
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    from main import cli
+
+    def invoke(args, client=None):
+        with FakeAnytype(space_objects(2, 3), page_size=2) as fake:
+            with use_client(client(fake) if client else fake.client()):
+                return CliRunner().invoke(cli, args)
+
+    return invoke
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["list-objects", "--type-keys", "Functional Requirement"],
+        ["list-frs"],
+        ["list-templates", "--object-type-id", "fr-type"],
+    ],
+)
+def test_machine_formats_fail_on_stderr(invoke, args):
+    result = invoke(args + ["--space-name", "Nowhere", "--format", "jsonl"])
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "Error: Space 'Nowhere' not found." in result.stderr
+
+    result = invoke(args + ["--space-name", "Nowhere"])
+    assert result.exit_code == 0
+    assert "Error: Space 'Nowhere' not found." in result.stdout
+
+
+@pytest.mark.parametrize("command", ["list-objects", "list-frs"])
+def test_missing_local_index_fails_on_stderr(invoke, command):
+    result = invoke([command, "--local", "--format", "csv"])
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "No local index" in result.stderr
+
+
+def test_failure_mid_stream_keeps_records_and_exits_non_zero(invoke):
+    def failing_client(fake):
+        client = fake.client()
+        iter_search_pages = client.iter_search_pages
+
+        def pages(*args, **kwargs):
+            yield next(iter_search_pages(*args, **kwargs))
+            raise Exception("connection lost")
+
+        client.iter_search_pages = pages
+        return client
+
+    result = invoke(["list-frs", "--format", "jsonl"], client=failing_client)
+    assert result.exit_code == 1
+    assert [json.loads(line)["name"] for line in result.stdout.splitlines()] == [
+        "FR-1.1",
+        "FR-1.2",
+    ]
+    assert result.stderr == "Error: connection lost\n"
@@ -0,0 +1,203 @@
+"""Request budgets for the commands that talk to Anytype.
+
+Each command runs in-process against the counting stand-in API from
+``benchmarks.fake_anytype`` with spaces of several sizes. The budgets pin
+how many requests each endpoint may receive as a function of the space, so
+a change that turns a per-type fetch into a per-object (or per-edge)
+fan-out fails here instead of in production.
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from anytype_api.session import use_client
+from benchmarks.fake_anytype import SPACE_NAME, FakeAnytype
+from benchmarks.synthetic import requirements_markdown, space_objects
+
+SIZES = (1, 5, 20)
+FRS_PER_FEATURE = 5
+APIS_PER_FR = 1
+# Small pages make paged searches take several requests even at these sizes.
+PAGE_SIZE = 7
+
+SPACES = "GET /v1/spaces"
+TYPES = "GET /v1/spaces/{space_id}/types"
+SEARCH = "POST /v1/spaces/{space_id}/search"
+GET_OBJECT = "GET /v1/spaces/{space_id}/objects/{object_id}"
+CREATE_OBJECT = "POST /v1/spaces/{space_id}/objects"
+
+
+def pages(count: int, page_size: int = PAGE_SIZE) -> int:
+    """Search requests needed to page through ``count`` results."""
+    return count // page_size + 1
+
+
+class Space:
+    def __init__(self, features: int):
+        self.features = features
+        self.frs = features * FRS_PER_FEATURE
+        self.apis = self.frs * APIS_PER_FR
+
+    @property
+    def objects(self) -> int:
+        return self.features + self.frs + self.apis
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Run CLI args against a fake space; return its per-endpoint counts."""
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+
+    from main import cli
+
+    def run(args, features, populated=True, page_size=PAGE_SIZE):
+        (tmp_path / "requirements.md").write_text(
+            requirements_markdown(features, FRS_PER_FEATURE)
+        )
+        objects = (
+            space_objects(features, FRS_PER_FEATURE, APIS_PER_FR) if populated else []
+        )
+        output = io.StringIO()
+        with FakeAnytype(objects, page_size=page_size) as fake:
+            with use_client(fake.client()), contextlib.redirect_stdout(output):
+                cli.main(args, prog_name="main.py", standalone_mode=False)
+        assert "Error" not in output.getvalue(), output.getvalue()
+        return dict(fake.requests)
+
+    return run
+
+
+def assert_within(counts: dict, budget: dict):
+    """Every endpoint stays within its budget; unlisted endpoints get none."""
+    for endpoint, used in counts.items():
+        allowed = budget.get(endpoint, 0)
+        assert used <= allowed, f"{endpoint}: {used} requests, budget {allowed}"
+
+
+@pytest.mark.parametrize("features", SIZES)
+@pytest.mark.parametrize("output_format", ["md", "md-table", "csv"])
+def test_generate_report(run, features, output_format):
+    space = Space(features)
+    counts = run(["generate-report", "--output-format", output_format], features)
+    assert_within(
+        counts,
+        {
+            SPACES: 1,
+            SEARCH: pages(space.features) + pages(space.apis),
+            # Each SF, API and FR is fetched once, plus one type check per
+            # backlinked FR.
+            GET_OBJECT: space.features + 2 * space.frs + space.apis,
+        },
+    )
+
+
+def test_generate_report_grows_linearly(run):
+    per_object = []
+    for features in SIZES:
+        counts = run(["generate-report"], features, page_size=1000)
+        per_object.append(sum(counts.values()) / Space(features).objects)
+    # Fixed costs are amortised as the space grows, so requests per object
+    # may only fall.
+    assert per_object == sorted(per_object, reverse=True), per_object
+    assert per_object[-1] <= 2
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_filtered_report_costs_its_slice(run, features):
+    space = Space(features)
+    counts = run(
+        ["generate-report", "--sf-ids", "SR-1", "--fr-status", "To Do"], features
+    )
+    # One SF with its FRs and their APIs, whatever the size of the space.
+    frs = FRS_PER_FEATURE
+    assert_within(
+        counts,
+        {
+            SPACES: 1,
+            SEARCH: pages(space.features) + pages(space.frs) + pages(space.apis),
+            GET_OBJECT: 1 + frs + frs * APIS_PER_FR,
+        },
+    )
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_create_objects(run, features):
+    space = Space(features)
+    counts = run(
+        ["create-objects", "--space-name", SPACE_NAME], features, populated=False
+    )
+    assert counts[CREATE_OBJECT] == space.features + space.frs
+    assert_within(counts, {SPACES: 1, CREATE_OBJECT: space.features + space.frs})
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_sync_plan(run, features):
+    space = Space(features)
+    counts = run(["sync"], features)
+    assert_within(
+        counts, {SPACES: 1, SEARCH: pages(space.features) + pages(space.frs)}
+    )
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_sync_apply_to_empty_space(run, features):
+    space = Space(features)
+    counts = run(["sync", "--apply"], features, populated=False)
+    assert_within(
+        counts,
+        {
+            SPACES: 1,
+            SEARCH: 2,
+            CREATE_OBJECT: space.features + space.frs,
+        },
+    )
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_index(run, features):
+    space = Space(features)
+    counts = run(["index"], features)
+    assert_within(
+        counts,
+        {
+            SPACES: 1,
+            TYPES: 1,
+            SEARCH: pages(space.objects),
+        },
+    )
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_coverage(run, features):
+    space = Space(features)
+    counts = run(["coverage"], features)
+    assert_within(counts, {SPACES: 1, SEARCH: pages(space.objects)})
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_stats(run, features):
+    pytest.importorskip("numpy")
+    space = Space(features)
+    counts = run(["stats"], features)
+    assert_within(counts, {SPACES: 1, SEARCH: pages(space.objects)})
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_list_frs(run, features):
+    counts = run(["list-frs"], features)
+    assert_within(counts, {SPACES: 1, SEARCH: 1})
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_validate_makes_no_requests(run, features):
+    assert run(["validate"], features) == {}
+
+
+@pytest.mark.parametrize("features", SIZES)
+def test_list_frs_streams_pages(run, features):
+    space = Space(features)
+    counts = run(["list-frs", "--format", "jsonl"], features)
+    assert_within(counts, {SPACES: 1, SEARCH: pages(space.frs)})
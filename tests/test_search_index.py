@@ -0,0 +1,40 @@
+"""The local search index round-trips through JSON and survives bad files."""
+
+import pytest
+
+from anytype_api.search_index import SearchIndex
+from benchmarks.synthetic import space_objects
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex("Everywhere")
+    for obj in space_objects(2, 3):
+        index.upsert(obj)
+    return index
+
+
+def names(documents):
+    return [document["name"] for document in documents]
+
+
+def test_saved_index_answers_the_same(index, tmp_path):
+    index.save(str(tmp_path))
+    loaded = SearchIndex.load("Everywhere", str(tmp_path))
+    for query in ("fr-1", "status:done type:FR", "synthetic feature"):
+        assert names(loaded.search(query)) == names(index.search(query))
+    assert names(loaded.search("fr-1.2")) == ["FR-1.2"]
+
+    loaded.upsert({**space_objects(1, 1)[0], "name": "FR-9.9"})
+    assert names(loaded.search("fr-9")) == ["FR-9.9"]
+
+
+@pytest.mark.parametrize(
+    "content", [b"\x80\x04garbage", b'{"version": 2}', b'{"version": 1}', b"[]"]
+)
+def test_unreadable_index_is_missing(index, tmp_path, content):
+    index.save(str(tmp_path))
+    path = SearchIndex.path_for("Everywhere", str(tmp_path))
+    with open(path, "wb") as f:
+        f.write(content)
+    assert SearchIndex.load("Everywhere", str(tmp_path)) is None
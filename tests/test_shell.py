@@ -0,0 +1,38 @@
+"""The interactive shell keeps running when a command fails."""
+
+from click.testing import CliRunner
+
+
+def test_failing_command_does_not_end_the_session(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    from main import cli
+
+    result = CliRunner().invoke(
+        cli,
+        ["shell"],
+        input="validate --file-path /nonexistent.md\nrefresh\nexit\n",
+    )
+    assert result.exception is None, result.output
+    assert "Error: " in result.output
+    # The shell read the lines after the failing command.
+    assert "Cache cleared." in result.output
+
+
+def test_exiting_command_does_not_end_the_session(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    from commands.validate import validate_requirements_command
+    from main import cli
+
+    def exit_with_status(**kwargs):
+        raise SystemExit(3)
+
+    monkeypatch.setattr(validate_requirements_command, "callback", exit_with_status)
+    result = CliRunner().invoke(
+        cli, ["shell"], input="validate\nserve\nrefresh\nexit\n"
+    )
+    assert result.exception is None, result.output
+    assert "Command exited with status 3." in result.output
+    assert "Run 'serve' outside the shell" in result.output
+    assert "Cache cleared." in result.output
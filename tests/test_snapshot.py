@@ -0,0 +1,64 @@
+"""Reports rendered from a snapshot instead of the Anytype app."""
+
+import contextlib
+import io
+
+import pytest
+
+from anytype_api.session import use_client
+from anytype_api.snapshot import SnapshotClient
+from benchmarks.fake_anytype import FakeAnytype
+from benchmarks.synthetic import space_objects
+
+NOTE = {
+    "id": "note-1",
+    "name": "Meeting notes",
+    "type": {"id": "note-type", "key": "note", "name": "Note"},
+    "properties": [],
+}
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+
+    from main import cli
+
+    def run(args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            cli.main(args, prog_name="main.py", standalone_mode=False)
+        return output.getvalue()
+
+    return run
+
+
+def test_report_from_snapshot_skips_non_fr_backlinks(cli, tmp_path, monkeypatch):
+    objects = space_objects(2, frs_per_feature=2)
+    # A note that mentions SF 1 shows up among its backlinks but is not one
+    # of the types a snapshot stores.
+    sf = next(obj for obj in objects if obj["id"] == "sf-1")
+    next(p for p in sf["properties"] if p["key"] == "backlinks")["objects"].append(
+        NOTE["id"]
+    )
+    with FakeAnytype(objects + [NOTE]) as fake, use_client(fake.client()):
+        output = cli(["snapshot", "--output", "space.jsonl.gz"])
+    assert "Saved 10 objects" in output, output
+
+    # No API key is needed to read a snapshot.
+    monkeypatch.delenv("ANYTYPE_API_KEY")
+    output = cli(["generate-report", "--from-snapshot", "space.jsonl.gz"])
+    assert "Error" not in output, output
+
+    report = next((tmp_path / "reports").glob("*.md")).read_text()
+    for name in ("FR-1.1", "FR-1.2", "FR-2.1", "FR-2.2"):
+        assert name in report
+    assert "Meeting notes" not in report
+
+
+def test_unknown_object_is_untyped(tmp_path):
+    client = SnapshotClient({"id": "space", "name": "Everywhere"}, [], {})
+    obj = client.get_object("space", "note-1")["object"]
+    assert obj["id"] == "note-1"
+    assert obj["type"] == {}
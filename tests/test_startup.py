@@ -0,0 +1,58 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Startup time is tracked by the "startup" benchmarks; here we check what it
+# depends on, which does not vary with the machine running the tests.
+HEAVY_MODULES = ("weasyprint", "markdown", "questionary", "requests", "numpy")
+
+PROBE = """
+import contextlib, io, json, sys
+import main
+with contextlib.redirect_stdout(io.StringIO()):
+    main.cli.main({args!r}, prog_name="main.py", standalone_mode=False)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def probe(args):
+    """Run the CLI with ``args`` in a fresh interpreter and report what it loaded."""
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(args=args)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def test_top_level_help_imports_no_command():
+    modules = probe(["--help"])
+    for module in HEAVY_MODULES:
+        assert module not in modules
+    assert "parser" not in modules
+    assert not [module for module in modules if module.startswith("commands.")]
+
+
+def test_validate_help_only_imports_validate():
+    modules = probe(["validate", "--help"])
+    assert "commands.validate" in modules
+    assert "commands.generate_report" not in modules
+    assert "commands.list" not in modules
+    for module in HEAVY_MODULES:
+        assert module not in modules
+
+
+def test_lazy_help_matches_the_commands():
+    import click
+
+    from main import cli
+
+    ctx = click.Context(cli)
+    for name in cli.lazy_commands:
+        command = cli.get_command(ctx, name)
+        assert cli.lazy_help[name] == command.get_short_help_str(limit=1000), name
@@ -0,0 +1,102 @@
+"""Sync plans against a space written by create and by earlier syncs."""
+
+import pytest
+from click.testing import CliRunner
+
+from anytype_api.keys import FR_TYPE_KEY, SF_TYPE_KEY
+from anytype_api.session import use_client
+from anytype_api.space_index import SpaceIndex, description_of
+from anytype_api.sync import UPDATE, apply_plan, plan_sync
+from benchmarks.fake_anytype import SPACE_ID, SPACE_NAME, FakeAnytype
+from benchmarks.synthetic import requirements_markdown, space_objects
+from parser.parser import parse_lines
+
+TYPE_KEYS = ["--sf-type-key", SF_TYPE_KEY, "--fr-type-key", FR_TYPE_KEY]
+
+
+@pytest.fixture
+def invoke(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "requirements.md").write_text(requirements_markdown(3, 2))
+    from main import cli
+
+    def invoke(fake, args):
+        with use_client(fake.client()):
+            result = CliRunner().invoke(cli, args)
+        assert result.exception is None, result.output
+        assert "Error" not in result.output, result.output
+        return result.output
+
+    return invoke
+
+
+def test_sync_after_create_plans_nothing(invoke):
+    with FakeAnytype([]) as fake:
+        invoke(fake, ["create-objects", "--space-name", SPACE_NAME, *TYPE_KEYS])
+        output = invoke(fake, ["sync", "--space-name", SPACE_NAME, *TYPE_KEYS])
+    assert "Space is already in sync" in output
+
+
+def test_existing_frs_are_linked_to_a_new_sf(invoke):
+    features = parse_lines(requirements_markdown(1, 2).splitlines())
+    index = SpaceIndex("space")
+    for fr in features[0].functional_requirements:
+        index.add_functional_requirement(
+            {
+                "id": f"remote-{fr.id}",
+                "name": fr.id,
+                "properties": [{"key": "description", "text": fr.description}],
+            }
+        )
+
+    plan = plan_sync(features, index)
+    fr_actions = [a for a in plan.actions if a.kind == "FR"]
+    assert [(a.action, a.changes) for a in fr_actions] == [
+        (UPDATE, ["system feature"]),
+        (UPDATE, ["system feature"]),
+    ]
+
+    with FakeAnytype([]) as fake:
+        invoke(fake, ["sync", "--space-name", SPACE_NAME, "--apply", *TYPE_KEYS])
+        output = invoke(fake, ["sync", "--space-name", SPACE_NAME, *TYPE_KEYS])
+    assert "Space is already in sync" in output
+
+
+def test_sync_against_a_space_matched_by_custom_id_plans_nothing(invoke):
+    with FakeAnytype(space_objects(3, 2)) as fake:
+        output = invoke(fake, ["sync", "--space-name", SPACE_NAME, *TYPE_KEYS])
+        descriptions = [
+            description_of(obj)
+            for obj in fake.objects.values()
+            if obj["type"]["key"] == SF_TYPE_KEY
+        ]
+    assert "Space is already in sync" in output
+    assert all(text.startswith("Feature ") for text in descriptions)
+
+
+def test_frs_of_a_failed_sf_are_reported_not_written(monkeypatch):
+    monkeypatch.setenv("ANYTYPE_API_KEY", "test")
+    features = parse_lines(requirements_markdown(1, 2).splitlines())
+    with FakeAnytype([]) as fake:
+        client = fake.client()
+        index = SpaceIndex.load(client, SPACE_ID, SF_TYPE_KEY, FR_TYPE_KEY)
+        plan = plan_sync(features, index)
+
+        create_object = client.create_object
+
+        def create_object_failing_sfs(space_id, payload):
+            if payload["type_key"] == SF_TYPE_KEY:
+                raise Exception("server error")
+            return create_object(space_id, payload)
+
+        client.create_object = create_object_failing_sfs
+        results = apply_plan(client, index, plan, SF_TYPE_KEY, FR_TYPE_KEY)
+        created = list(fake.objects.values())
+
+    assert created == []
+    assert [(r.key, r.error) for r in results] == [
+        ("SR-1", "server error"),
+        ("FR-1.1", "its System Feature was not created"),
+        ("FR-1.2", "its System Feature was not created"),
+    ]